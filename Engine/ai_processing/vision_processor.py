@@ -6,65 +6,230 @@ import requests
 import json
 import base64
 import os
-from typing import Dict, List, Optional, Any
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
+from utils.skill_canonicalizer import get_skill_canonicalizer
+
 logger = logging.getLogger(__name__)
 
+# Pages sent to the model per document type, overridable with config['page_budget']
+DEFAULT_PAGE_BUDGET = {
+    "certificate": 1,
+    "resume": 2,
+    "transcript": 3
+}
+
+# Keywords that mark a page as worth sending for each document type
+PAGE_KEYWORDS = {
+    "certificate": ["certificate", "certify", "completion", "awarded", "course", "skills"],
+    "resume": ["skills", "experience", "projects", "education", "technologies", "internship"],
+    "transcript": ["grade", "gpa", "cgpa", "credits", "semester", "course", "marks"]
+}
+
+_render_pool = None
+
+def _get_render_pool(max_workers: int):
+    """Lazily create the process pool shared by all processors for page rendering"""
+    global _render_pool
+    if _render_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _render_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _render_pool
+
+def _render_pdf_page(pdf_path: str, page_number: int, zoom: float) -> bytes:
+    """Render a single PDF page to PNG bytes (module level so it can run in a worker process)"""
+    import fitz  # PyMuPDF
+    
+    pdf_document = fitz.open(pdf_path)
+    try:
+        pix = pdf_document[page_number].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return pix.tobytes("png")
+    finally:
+        pdf_document.close()
+
+def _merge_lists(existing: List[Any], new_items: List[Any]) -> List[Any]:
+    """Append items not already present, comparing dicts by their JSON form"""
+    seen = {json.dumps(item, sort_keys=True, default=str) for item in existing}
+    merged = list(existing)
+    for item in new_items:
+        key = json.dumps(item, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged
+
+class IncrementalJSONParser:
+    """
+    Tracks a JSON document as it arrives in chunks and reports when the
+    top-level object or array has been closed
+    """
+    
+    def __init__(self):
+        self.buffer = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.complete = False
+        
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of text, returns True once the top-level value is complete"""
+        for char in chunk:
+            if self.complete:
+                break
+            
+            if not self.started:
+                if char in '{[':
+                    self.started = True
+                    self.depth = 1
+                    self.buffer.append(char)
+                continue
+            
+            self.buffer.append(char)
+            
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.complete = True
+                    
+        return self.complete
+    
+    def text(self) -> str:
+        """Text consumed so far, trimmed to the top-level value"""
+        return ''.join(self.buffer)
+
 class VisionProcessor:
     """
     Handles PDF and image processing using Ollama Llama3.2-vision model
     """
     
-    def __init__(self, ollama_url: str = "http://localhost:11434"):
+    def __init__(self, ollama_url: str = "http://localhost:11434", config: Optional[Dict] = None,
+                 metrics: Optional[Any] = None):
         self.ollama_url = ollama_url
-        self.model = "llama3.2-vision:latest"
+        self.config = config or {}
+        self.metrics = metrics
+        self.model = self.config.get('model', "llama3.2-vision:latest")
         self.api_endpoint = f"{ollama_url}/api/generate"
         
-    def _encode_file_to_base64(self, file_path: str) -> str:
-        """Convert file to base64 encoding for API"""
+        # Streaming mode reads NDJSON chunks and stops as soon as the JSON object is closed
+        self.stream = self.config.get('stream', False)
+        self.max_tokens = self.config.get('max_tokens', 1024)
+        self.max_generation_seconds = self.config.get('max_generation_seconds', 90)
+        
+        # Retry policy for transient failures and the overall time budget per batch
+        self.request_timeout = self.config.get('timeout', 120)
+        self.max_retries = self.config.get('max_retries', 2)
+        self.retry_backoff_base = self.config.get('retry_backoff_base', 1.0)
+        self.retry_backoff_max = self.config.get('retry_backoff_max', 10.0)
+        self.batch_deadline_seconds = self.config.get('batch_deadline_seconds', 300)
+        
+        # How long Ollama keeps the model loaded after each request (Ollama duration string or seconds)
+        self.keep_alive = self.config.get('keep_alive', '30m')
+        self._keep_warm_stop = None
+        
+    def _encode_file_to_base64(self, file_path: str, document_type: str = "certificate") -> List[str]:
+        """Convert file to base64 encoded images for API, one per selected page"""
         try:
             # Check if it's a PDF file that needs conversion
             if file_path.lower().endswith('.pdf'):
-                # For PDF files, we'll convert first page to image
-                return self._convert_pdf_to_image_base64(file_path)
+                # For PDF files, we'll convert the most relevant pages to images
+                return self._convert_pdf_to_images_base64(file_path, document_type)
             else:
                 # For image files, encode directly
                 with open(file_path, "rb") as file:
-                    return base64.b64encode(file.read()).decode('utf-8')
+                    return [base64.b64encode(file.read()).decode('utf-8')]
         except Exception as e:
             logger.error(f"Failed to encode file {file_path}: {e}")
             raise
     
-    def _convert_pdf_to_image_base64(self, pdf_path: str) -> str:
-        """Convert PDF first page to image and return base64"""
+    def _convert_pdf_to_images_base64(self, pdf_path: str, document_type: str = "certificate") -> List[str]:
+        """Convert the top-ranked PDF pages to images and return them as base64, in page order"""
         try:
             # Try PyMuPDF first (better quality)
             try:
                 import fitz  # PyMuPDF
                 
-                # Open PDF and convert first page to image
-                pdf_document = fitz.open(pdf_path)
-                first_page = pdf_document[0]
-                
-                # Convert to image with moderate resolution for faster processing
-                pix = first_page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5))  # 1.5x scaling for balance
-                img_data = pix.tobytes("png")
+                page_numbers = self._select_pdf_pages(pdf_path, document_type)
+                zoom = self.config.get('pdf_zoom', 1.5)  # 1.5x scaling for balance
                 
-                # Close PDF
-                pdf_document.close()
+                if len(page_numbers) > 1:
+                    images = self._render_pages_parallel(pdf_path, page_numbers, zoom)
+                else:
+                    images = [_render_pdf_page(pdf_path, page_numbers[0], zoom)]
                 
-                logger.info(f"PDF converted to image successfully: {pdf_path}")
-                return base64.b64encode(img_data).decode('utf-8')
+                logger.info(f"PDF converted to {len(images)} image(s) successfully: {pdf_path} pages {page_numbers}")
+                return [base64.b64encode(img_data).decode('utf-8') for img_data in images]
                 
             except ImportError:
                 logger.warning(f"PyMuPDF not available, using fallback for {pdf_path}")
-                return self._pdf_text_fallback(pdf_path)
+                return [self._pdf_text_fallback(pdf_path)]
                 
         except Exception as e:
             logger.error(f"PDF conversion failed for {pdf_path}: {e}")
             # Fallback to text extraction
-            return self._pdf_text_fallback(pdf_path)
+            return [self._pdf_text_fallback(pdf_path)]
+    
+    def _select_pdf_pages(self, pdf_path: str, document_type: str) -> List[int]:
+        """
+        Rank PDF pages by text density and document-type keywords and keep the top N
+        
+        The page budget comes from config['page_budget'][document_type]. Selected
+        pages are returned in document order so the model sees them as written.
+        """
+        import fitz  # PyMuPDF
+        
+        page_budget = self.config.get('page_budget', DEFAULT_PAGE_BUDGET)
+        max_pages = max(1, page_budget.get(document_type, page_budget.get('certificate', 1)))
+        keywords = PAGE_KEYWORDS.get(document_type, PAGE_KEYWORDS['certificate'])
+        
+        pdf_document = fitz.open(pdf_path)
+        try:
+            page_count = len(pdf_document)
+            if page_count <= max_pages:
+                return list(range(page_count))
+            
+            page_scores = []
+            for page_number in range(page_count):
+                page = pdf_document[page_number]
+                text = page.get_text().lower()
+                area = max(page.rect.width * page.rect.height, 1.0)
+                
+                # Characters per 1000 square points, plus a bonus per keyword hit
+                density = len(text.strip()) * 1000.0 / area
+                keyword_hits = sum(text.count(keyword) for keyword in keywords)
+                page_scores.append((density + keyword_hits * 5.0, page_number))
+        finally:
+            pdf_document.close()
+        
+        # Earlier pages win ties, they usually carry the summary
+        page_scores.sort(key=lambda item: (-item[0], item[1]))
+        return sorted(page_number for _, page_number in page_scores[:max_pages])
+    
+    def _render_pages_parallel(self, pdf_path: str, page_numbers: List[int], zoom: float) -> List[bytes]:
+        """Render several PDF pages in a process pool, falling back to sequential rendering"""
+        try:
+            pool = _get_render_pool(self.config.get('page_render_workers', 4))
+            futures = [pool.submit(_render_pdf_page, pdf_path, page_number, zoom) for page_number in page_numbers]
+            return [future.result() for future in futures]
+        except Exception as e:
+            logger.warning(f"Parallel page rendering failed for {pdf_path}, rendering sequentially: {e}")
+            return [_render_pdf_page(pdf_path, page_number, zoom) for page_number in page_numbers]
     
     def _pdf_text_fallback(self, pdf_path: str) -> str:
         """Fallback: Extract text from PDF and create mock image response"""
@@ -89,53 +254,82 @@ class VisionProcessor:
             logger.error(f"PDF text extraction failed for {pdf_path}: {e}")
             raise
     
-    def extract_from_document(self, file_path: str, document_type: str = "certificate") -> Dict[str, Any]:
+    def extract_from_document(self, file_path: str, document_type: str = "certificate",
+                              deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Extract structured data from documents using vision model
         
+        Multi-page PDFs are reduced to their most relevant pages. Pages are sent
+        together when the model accepts several images per request, otherwise one
+        request per page, and the per-page results are merged.
+        
         Args:
             file_path: Path to the document file
             document_type: Type of document (certificate, resume, transcript, etc.)
+            deadline: time.monotonic() value by which the whole batch must finish,
+                defaults to batch_deadline_seconds from now
             
         Returns:
             Dictionary containing extracted information
         """
+        if deadline is None:
+            deadline = time.monotonic() + self.batch_deadline_seconds
+            
         try:
-            # Encode file to base64
-            encoded_file = self._encode_file_to_base64(file_path)
+            # Encode selected pages to base64
+            encoded_pages = self._encode_file_to_base64(file_path, document_type)
             
             # Create extraction prompt based on document type
             prompt = self._get_extraction_prompt(document_type)
             
-            # Prepare API request
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "images": [encoded_file],
-                "stream": False,
-                "format": "json"
-            }
+            # llama3.2-vision only accepts a single image per request in Ollama
+            images_per_request = max(1, self.config.get('max_images_per_request', 1))
+            batches = [
+                encoded_pages[i:i + images_per_request]
+                for i in range(0, len(encoded_pages), images_per_request)
+            ]
             
-            # Send request to Ollama with longer timeout for vision processing
-            logger.info(f"Sending vision request for {file_path}, image size: {len(payload['images'][0])} chars")
-            response = requests.post(self.api_endpoint, json=payload, timeout=120)
-            response.raise_for_status()
+            page_results = []
+            batch_stats = []
+            for batch in batches:
+                batch_prompt = prompt
+                if len(batch) > 1:
+                    batch_prompt += "\nThe images are consecutive pages of the same document, combine them into one JSON object."
+                
+                # Prepare API request
+                payload = {
+                    "model": self.model,
+                    "prompt": batch_prompt,
+                    "images": batch,
+                    "stream": False,
+                    "format": "json",
+                    "keep_alive": self.keep_alive
+                }
+                
+                # Send request to Ollama with longer timeout for vision processing
+                logger.info(f"Sending vision request for {file_path}, {len(batch)} image(s), size: {sum(len(image) for image in batch)} chars")
+                extracted_text, generation_stats = self._generate_with_retry(payload, deadline)
+                batch_stats.append(generation_stats)
+                
+                # Parse JSON response
+                try:
+                    page_results.append(json.loads(extracted_text))
+                except json.JSONDecodeError:
+                    # Fallback to text extraction if JSON parsing fails
+                    page_results.append({"raw_text": extracted_text, "structured_data": {}})
             
-            # Parse response
-            result = response.json()
-            extracted_text = result.get('response', '')
+            generation_stats = self._combine_generation_stats(batch_stats)
+            generation_stats["pages_processed"] = len(encoded_pages)
+            if self.metrics:
+                self.metrics.record_generation_stats(generation_stats)
             
-            # Parse JSON response
-            try:
-                extracted_data = json.loads(extracted_text)
-            except json.JSONDecodeError:
-                # Fallback to text extraction if JSON parsing fails
-                extracted_data = {"raw_text": extracted_text, "structured_data": {}}
+            extracted_data = page_results[0] if len(page_results) == 1 else self._merge_page_results(page_results)
             
             return {
                 "document_type": document_type,
                 "file_path": file_path,
                 "extracted_data": extracted_data,
+                "generation_stats": generation_stats,
                 "success": True
             }
             
@@ -149,6 +343,193 @@ class VisionProcessor:
                 "success": False
             }
     
+    def _merge_page_results(self, page_results: List[Any]) -> Dict[str, Any]:
+        """Merge per-page extractions: lists are concatenated without duplicates, dicts merged, first non-empty scalar wins"""
+        merged: Dict[str, Any] = {}
+        
+        for result in page_results:
+            if not isinstance(result, dict):
+                continue
+            for key, value in result.items():
+                existing = merged.get(key)
+                if isinstance(value, list):
+                    merged[key] = _merge_lists(existing if isinstance(existing, list) else [], value)
+                elif isinstance(value, dict):
+                    if existing is None or isinstance(existing, dict):
+                        merged[key] = self._merge_page_results([existing or {}, value])
+                elif key == "raw_text" and existing:
+                    merged[key] = f"{existing}\n{value}"
+                elif existing in (None, "", [], {}):
+                    merged[key] = value
+        
+        return merged
+    
+    def _combine_generation_stats(self, batch_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine timing stats of the requests made for one document"""
+        if len(batch_stats) == 1:
+            return dict(batch_stats[0])
+        
+        tokens = sum(stats.get("tokens_generated", 0) or 0 for stats in batch_stats)
+        generation_seconds = sum(
+            stats["tokens_generated"] / stats["tokens_per_second"]
+            for stats in batch_stats
+            if stats.get("tokens_per_second") and stats.get("tokens_generated")
+        )
+        aborted = [stats["aborted"] for stats in batch_stats if stats.get("aborted") and stats["aborted"] != "object_complete"]
+        
+        return {
+            "streamed": batch_stats[0].get("streamed", False),
+            "time_to_first_token": batch_stats[0].get("time_to_first_token"),
+            "tokens_generated": tokens,
+            "tokens_per_second": tokens / generation_seconds if generation_seconds > 0 else None,
+            "total_time": sum(stats.get("total_time", 0.0) for stats in batch_stats),
+            "aborted": aborted[0] if aborted else batch_stats[-1].get("aborted"),
+            "requests": len(batch_stats)
+        }
+    
+    def _generate_with_retry(self, payload: Dict, deadline: float) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run a generate request, retrying transient failures with jittered exponential backoff
+        
+        Each attempt's timeout is capped by the time left before the deadline, and
+        no retry is started if its backoff would end past the deadline.
+        """
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record_metric('record_vision_deadline_exceeded')
+                raise TimeoutError("Vision batch deadline exceeded")
+            timeout = min(self.request_timeout, remaining)
+            
+            try:
+                if self.stream:
+                    text, stats = self._generate_streaming(payload, timeout=timeout)
+                else:
+                    text, stats = self._generate_blocking(payload, timeout=timeout)
+                stats["retries"] = attempt
+                return text, stats
+                
+            except Exception as e:
+                if isinstance(e, requests.Timeout):
+                    self._record_metric('record_vision_timeout')
+                if not self._is_transient_error(e) or attempt >= self.max_retries:
+                    raise
+                
+                # Full jitter: sleep a random time up to the exponential backoff cap
+                delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff_base * (2 ** attempt)))
+                if time.monotonic() + delay >= deadline:
+                    raise
+                
+                attempt += 1
+                self._record_metric('record_vision_retry')
+                logger.warning(f"Transient vision error ({e}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                time.sleep(delay)
+    
+    def _is_transient_error(self, error: Exception) -> bool:
+        """Connection errors, timeouts, 429 and 5xx responses are worth retrying"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return False
+    
+    def _record_metric(self, method_name: str):
+        if self.metrics:
+            getattr(self.metrics, method_name)()
+    
+    def _generate_blocking(self, payload: Dict, timeout: float) -> Tuple[str, Dict[str, Any]]:
+        """Send a non-streaming generate request and return the response text with timing stats"""
+        start_time = time.monotonic()
+        response = requests.post(self.api_endpoint, json=payload, timeout=timeout)
+        response.raise_for_status()
+        
+        result = response.json()
+        total_time = time.monotonic() - start_time
+        
+        # Ollama reports durations in nanoseconds; load + prompt evaluation approximates time to first token
+        eval_count = result.get('eval_count', 0)
+        eval_seconds = result.get('eval_duration', 0) / 1e9
+        first_token_seconds = (result.get('load_duration', 0) + result.get('prompt_eval_duration', 0)) / 1e9
+        
+        return result.get('response', ''), {
+            "streamed": False,
+            "time_to_first_token": first_token_seconds or None,
+            "tokens_generated": eval_count,
+            "tokens_per_second": eval_count / eval_seconds if eval_seconds > 0 else None,
+            "total_time": total_time,
+            "aborted": None
+        }
+    
+    def _generate_streaming(self, payload: Dict, timeout: float) -> Tuple[str, Dict[str, Any]]:
+        """
+        Stream a generate request, feeding chunks to an incremental JSON parser
+        
+        Generation is cut short once the top-level JSON object is complete or the
+        token/time budget is spent. Closing the connection makes Ollama stop generating.
+        """
+        payload = dict(payload)
+        payload["stream"] = True
+        payload["options"] = {**payload.get("options", {}), "num_predict": self.max_tokens}
+        
+        parser = IncrementalJSONParser()
+        raw_chunks = []
+        token_count = 0
+        first_token_time = None
+        aborted = None
+        start_time = time.monotonic()
+        
+        # The generation budget never outlives the caller's timeout
+        time_budget = min(self.max_generation_seconds, timeout)
+        
+        with requests.post(self.api_endpoint, json=payload, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                    
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+                
+                piece = chunk.get('response', '')
+                if piece:
+                    if first_token_time is None:
+                        first_token_time = time.monotonic()
+                    token_count += 1
+                    raw_chunks.append(piece)
+                    parser.feed(piece)
+                
+                if chunk.get('done'):
+                    token_count = chunk.get('eval_count', token_count)
+                    break
+                if parser.complete:
+                    aborted = "object_complete"
+                    break
+                if token_count >= self.max_tokens:
+                    aborted = "token_budget"
+                    break
+                if time.monotonic() - start_time >= time_budget:
+                    aborted = "time_budget"
+                    break
+        
+        end_time = time.monotonic()
+        if aborted and aborted != "object_complete":
+            logger.warning(f"Vision generation aborted ({aborted}) after {token_count} tokens")
+        
+        generation_seconds = end_time - first_token_time if first_token_time else 0.0
+        text = parser.text() if parser.complete else ''.join(raw_chunks)
+        
+        return text, {
+            "streamed": True,
+            "time_to_first_token": first_token_time - start_time if first_token_time else None,
+            "tokens_generated": token_count,
+            "tokens_per_second": token_count / generation_seconds if generation_seconds > 0 else None,
+            "total_time": end_time - start_time,
+            "aborted": aborted
+        }
+    
     def _get_extraction_prompt(self, document_type: str) -> str:
         """Generate extraction prompt based on document type"""
         
@@ -228,22 +609,26 @@ class VisionProcessor:
         """
         Process multiple documents and combine extracted data
         
+        All documents share one deadline of batch_deadline_seconds, so later
+        documents get shorter timeouts as the budget runs out.
+        
         Args:
             file_paths: List of document file paths
             
         Returns:
             Combined extracted data from all documents
         """
+        deadline = time.monotonic() + self.batch_deadline_seconds
         all_extractions = []
-        combined_skills = set()
-        combined_technologies = set()
+        combined_skills = []
+        combined_technologies = []
         
         for file_path in file_paths:
             # Determine document type from filename/extension
             doc_type = self._determine_document_type(file_path)
             
             # Extract from document
-            extraction = self.extract_from_document(file_path, doc_type)
+            extraction = self.extract_from_document(file_path, doc_type, deadline=deadline)
             all_extractions.append(extraction)
             
             # Combine skills and technologies
@@ -254,18 +639,20 @@ class VisionProcessor:
                 skills_learned = data.get("skills_learned", []) or []
                 technical_skills = data.get("technical_skills", []) or []
                 skills = skills_learned + technical_skills
-                combined_skills.update(skills)
+                combined_skills.extend(skills)
                 
                 # Extract technologies (ensure lists, not None)
                 technology_stack = data.get("technology_stack", []) or []
                 technologies = data.get("technologies", []) or []
                 tech = technology_stack + technologies
-                combined_technologies.update(tech)
+                combined_technologies.extend(tech)
         
+        # Merge synonyms across documents ("JS" on one certificate, "JavaScript" on another)
+        canonicalizer = get_skill_canonicalizer()
         return {
             "individual_extractions": all_extractions,
-            "combined_skills": list(combined_skills),
-            "combined_technologies": list(combined_technologies),
+            "combined_skills": canonicalizer.merge(combined_skills),
+            "combined_technologies": canonicalizer.merge(combined_technologies),
             "processing_summary": {
                 "total_documents": len(file_paths),
                 "successful_extractions": sum(1 for ext in all_extractions if ext["success"]),
@@ -286,6 +673,86 @@ class VisionProcessor:
         else:
             return "certificate"  # Default
     
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory ahead of real traffic
+        
+        Ollama loads the model and returns without generating when the prompt is empty.
+        """
+        try:
+            start_time = time.monotonic()
+            payload = {
+                "model": self.model,
+                "prompt": "",
+                "stream": False,
+                "keep_alive": self.keep_alive
+            }
+            response = requests.post(self.api_endpoint, json=payload, timeout=self.config.get('warmup_timeout', 180))
+            response.raise_for_status()
+            
+            logger.info(f"Vision model {self.model} warmed up in {time.monotonic() - start_time:.1f}s")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Vision model warm-up failed: {e}")
+            return False
+    
+    def model_status(self) -> Dict[str, Any]:
+        """Report whether the model is currently resident in Ollama's memory (from /api/ps)"""
+        try:
+            response = requests.get(f"{self.ollama_url}/api/ps", timeout=5)
+            response.raise_for_status()
+            
+            for model in response.json().get("models", []):
+                if model.get("name") == self.model or model.get("model") == self.model:
+                    return {
+                        "resident": True,
+                        "expires_at": model.get("expires_at"),
+                        "size_vram": model.get("size_vram")
+                    }
+            return {"resident": False, "expires_at": None, "size_vram": None}
+            
+        except Exception as e:
+            logger.error(f"Ollama model status check failed: {e}")
+            return {"resident": None, "expires_at": None, "size_vram": None, "error": str(e)}
+    
+    def start_keep_warm(self, interval_minutes: Optional[float] = None) -> Optional[threading.Thread]:
+        """
+        Ping the model on a schedule during business hours so it is never unloaded mid-day
+        
+        Business hours come from config['business_hours'] ([start_hour, end_hour), local
+        time) and config['business_days'] (0 = Monday). Returns the daemon thread, or
+        None when the schedule is disabled or already running.
+        """
+        interval_minutes = interval_minutes or self.config.get('keep_warm_interval_minutes', 0)
+        if not interval_minutes or self._keep_warm_stop is not None:
+            return None
+        
+        self._keep_warm_stop = threading.Event()
+        stop_event = self._keep_warm_stop
+        
+        def ping_loop():
+            while not stop_event.is_set():
+                if self._within_business_hours(datetime.now()) and not self.model_status().get("resident"):
+                    self.warm_up()
+                stop_event.wait(interval_minutes * 60)
+        
+        thread = threading.Thread(target=ping_loop, name="vision-keep-warm", daemon=True)
+        thread.start()
+        logger.info(f"Vision keep-warm schedule started, every {interval_minutes} minutes")
+        return thread
+    
+    def stop_keep_warm(self):
+        """Stop the keep-warm schedule started with start_keep_warm"""
+        if self._keep_warm_stop is not None:
+            self._keep_warm_stop.set()
+            self._keep_warm_stop = None
+    
+    def _within_business_hours(self, now: datetime) -> bool:
+        start_hour, end_hour = self.config.get('business_hours', [9, 18])
+        business_days = self.config.get('business_days', [0, 1, 2, 3, 4])
+        return now.weekday() in business_days and start_hour <= now.hour < end_hour
+    
     def health_check(self) -> bool:
         """Check if Ollama service is running and model is available"""
         try:
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Time ranking over a columnar Catalog against the per-internship dict scorer
+
+Internships are generated from benchmarks/data/job_descriptions.jsonl with
+distinct ids, companies, sectors and posting dates. The dict scorer is timed on
+a sample and extrapolated, since scoring 50k internships that way takes minutes.
+
+Usage:
+    python benchmarks/catalog_benchmark.py --count 50000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+# Add Engine path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_extraction.extractor import DataExtractor
+from recommendation.engine import RecommendationEngine
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_descriptions.jsonl')
+
+INDUSTRIES = ['Technology', 'Finance', 'Healthcare', 'Education', 'Marketing', 'Design']
+CITIES = [('Bengaluru', 'Karnataka'), ('Pune', 'Maharashtra'), ('Delhi', 'Delhi'), ('Chennai', 'Tamil Nadu')]
+
+
+def load_internships(path: str, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Raw internships in the shape the backend passes to the orchestrator"""
+    with open(path) as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    
+    rng = random.Random(seed)
+    now = datetime.now()
+    internships = []
+    for i in range(count):
+        row = rows[i % len(rows)]
+        city, state = rng.choice(CITIES)
+        internships.append({
+            'internship_id': i + 1,
+            'company_id': rng.randint(1, max(1, count // 20)),
+            'title': row.get('internship_title', ''),
+            'description': row.get('job_description', ''),
+            'required_skills': row.get('required_skills', ''),
+            'industry': rng.choice(INDUSTRIES),
+            'city': city,
+            'state': state,
+            'remote_allowed': rng.random() < 0.3,
+            'education_requirement': rng.choice(['bachelor', 'master', 'diploma', '']),
+            'posted_date': (now - timedelta(days=rng.randint(0, 90))).isoformat(),
+            'click_through_rate': rng.random() * 0.1,
+            'apply_rate': rng.random() * 0.05,
+            'total_applications': rng.randint(0, 300),
+            'total_selections': rng.randint(0, 10)
+        })
+    return internships
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog ranking benchmark")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSONL file with internship_title/required_skills/job_description")
+    parser.add_argument("--count", type=int, default=50000, help="Internships in the catalog")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed rankings")
+    parser.add_argument("--dict-sample", type=int, default=500, help="Internships scored by the dict path")
+    args = parser.parse_args()
+    
+    extractor = DataExtractor()
+    engine = RecommendationEngine()
+    user = extractor.normalize_user_data({
+        'user_id': 1,
+        'technical_skills': 'Python, SQL, Machine Learning, React',
+        'preferred_industry': 'Technology',
+        'education_level': 'bachelor',
+        'degree': 'B.Tech Computer Science'
+    })
+    
+    features = [extractor.internship_features(internship) for internship in load_internships(args.corpus, args.count)]
+    
+    start = time.perf_counter()
+    catalog = engine.build_catalog(features)
+    build_time = time.perf_counter() - start
+    print(f"✓ Built catalog of {len(catalog)} internships in {build_time:.2f}s "
+          f"({len(catalog.skill_vocab)} skills, {len(catalog.vectorizer.vocabulary_)} terms)")
+    
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        recommendations = engine.generate_catalog_recommendations(user, catalog, top_k=6)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"  catalog ranking      p50 {statistics.median(timings) * 1000:.1f} ms  p95 {p95 * 1000:.1f} ms  -> {recommendations}")
+    
+    sample = features[:args.dict_sample]
+    start = time.perf_counter()
+    engine.generate_recommendations(user, sample, top_k=6)
+    per_internship = (time.perf_counter() - start) / len(sample)
+    print(f"  dict scoring         {per_internship * 1e6:.0f} µs/internship  "
+          f"(~{per_internship * args.count:.1f} s for {args.count})")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Fake Ollama server for load-testing the vision pipeline without a GPU
+
+Implements /api/generate (streaming and non-streaming), /api/tags and /api/ps
+with configurable latency distributions, error rates, cold-start time and
+canned JSON outputs per document type.
+
+Usage:
+    python benchmarks/fake_ollama_server.py --port 11435 --latency lognormal --latency-median 2.0
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Canned extraction results, keyed by the document type found in the prompt
+DEFAULT_OUTPUTS = {
+    "certificate": {
+        "certificate_name": "Python for Data Science",
+        "issuing_organization": "Example Academy",
+        "completion_date": "2025-06-30",
+        "skills_learned": ["python", "pandas", "numpy", "data analysis"],
+        "technology_stack": ["jupyter", "scikit-learn"],
+        "duration": "8 weeks",
+        "grade_score": "92%",
+        "key_projects": ["Sales forecasting"]
+    },
+    "resume": {
+        "technical_skills": ["python", "javascript", "react", "sql", "git"],
+        "soft_skills": ["communication", "teamwork"],
+        "projects": [
+            {
+                "name": "Campus marketplace",
+                "description": "Web app for buying and selling used books",
+                "technologies": ["react", "flask", "mysql"],
+                "duration": "3 months"
+            }
+        ],
+        "education": {
+            "degree": "B.Tech",
+            "field": "Computer Science",
+            "institution": "Example Institute of Technology",
+            "year": "2026",
+            "gpa": "8.4"
+        },
+        "experience": []
+    },
+    "transcript": {
+        "subjects_completed": ["Data Structures", "Operating Systems", "Databases"],
+        "grades": {"Data Structures": "A", "Operating Systems": "B+", "Databases": "A"},
+        "overall_gpa": "8.4",
+        "technical_courses": ["Data Structures", "Databases"],
+        "semester_wise_performance": ["steady"],
+        "specializations": ["Software Engineering"]
+    }
+}
+
+# Phrases from VisionProcessor._get_extraction_prompt that identify the document type
+PROMPT_MARKERS = {
+    "resume": "For resumes",
+    "transcript": "For transcripts",
+    "certificate": "For certificates"
+}
+
+
+def parse_keep_alive(keep_alive: Any) -> float:
+    """Seconds for an Ollama keep_alive value such as 300, "30s", "30m" or "1h" (default 5m)"""
+    if keep_alive is None:
+        return 300.0
+    if isinstance(keep_alive, (int, float)):
+        return float(keep_alive)
+    units = {"s": 1, "m": 60, "h": 3600}
+    value = str(keep_alive).strip()
+    if value and value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+class FakeOllamaConfig:
+    """
+    Behaviour of the fake server
+    """
+    
+    def __init__(self, model: str = "llama3.2-vision:latest", latency: str = "fixed",
+                 latency_median: float = 0.5, latency_spread: float = 0.3,
+                 token_delay: float = 0.005, error_rate: float = 0.0,
+                 outputs: Optional[Dict[str, Any]] = None, seed: Optional[int] = None,
+                 cold_start: float = 0.0):
+        self.model = model
+        self.latency = latency
+        self.latency_median = latency_median
+        self.latency_spread = latency_spread
+        self.token_delay = token_delay
+        self.error_rate = error_rate
+        self.outputs = outputs or DEFAULT_OUTPUTS
+        self.cold_start = cold_start
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests_served = 0
+        self.loaded_until = 0.0
+        
+    def sample_latency(self) -> float:
+        """Seconds spent 'loading and evaluating the prompt' before the first token"""
+        with self.lock:
+            if self.latency == "uniform":
+                low = max(0.0, self.latency_median - self.latency_spread)
+                return self.random.uniform(low, self.latency_median + self.latency_spread)
+            if self.latency == "lognormal":
+                # latency_spread is the sigma of the underlying normal distribution
+                return self.random.lognormvariate(0.0, self.latency_spread) * self.latency_median
+            return self.latency_median
+    
+    def load_model(self, keep_alive: Any) -> float:
+        """Mark the model resident for keep_alive, returns the cold-start delay to simulate"""
+        with self.lock:
+            now = time.time()
+            delay = 0.0 if now < self.loaded_until else self.cold_start
+            self.loaded_until = now + delay + parse_keep_alive(keep_alive)
+            return delay
+    
+    def is_resident(self) -> bool:
+        return time.time() < self.loaded_until
+    
+    def should_fail(self) -> bool:
+        with self.lock:
+            self.requests_served += 1
+            return self.random.random() < self.error_rate
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """
+    Request handler emulating the parts of the Ollama API used by VisionProcessor
+    """
+    
+    protocol_version = "HTTP/1.1"
+    
+    @property
+    def fake_config(self) -> FakeOllamaConfig:
+        return self.server.fake_config
+    
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": self.fake_config.model}]})
+        elif self.path == "/api/ps":
+            models = []
+            if self.fake_config.is_resident():
+                expires_at = datetime.fromtimestamp(self.fake_config.loaded_until, timezone.utc).isoformat()
+                models.append({"name": self.fake_config.model, "model": self.fake_config.model,
+                               "expires_at": expires_at, "size_vram": 0})
+            self._send_json(200, {"models": models})
+        else:
+            self._send_json(404, {"error": "not found"})
+    
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+        
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+        
+        if self.fake_config.should_fail():
+            self._send_json(500, {"error": "simulated model failure"})
+            return
+        
+        cold_start = self.fake_config.load_model(payload.get("keep_alive"))
+        
+        # An empty prompt only loads the model, like the real server
+        if not payload.get("prompt") and not payload.get("images"):
+            time.sleep(cold_start)
+            self._send_json(200, {"model": payload.get("model", self.fake_config.model), "response": "",
+                                  "done": True, "load_duration": int(cold_start * 1e9)})
+            return
+        
+        latency = cold_start + self.fake_config.sample_latency()
+        time.sleep(latency)
+        
+        output = json.dumps(self.fake_config.outputs.get(self._document_type(payload.get("prompt", "")), {}))
+        # Roughly four characters per token, like real tokenizers on JSON
+        tokens = [output[i:i + 4] for i in range(0, len(output), 4)]
+        
+        if payload.get("stream", True):
+            self._stream_tokens(payload, tokens, latency)
+        else:
+            time.sleep(self.fake_config.token_delay * len(tokens))
+            self._send_json(200, self._final_chunk(payload, output, len(tokens), latency))
+    
+    def _document_type(self, prompt: str) -> str:
+        for document_type, marker in PROMPT_MARKERS.items():
+            if marker in prompt:
+                return document_type
+        return "certificate"
+    
+    def _final_chunk(self, payload: Dict, response: str, token_count: int, latency: float) -> Dict[str, Any]:
+        return {
+            "model": payload.get("model", self.fake_config.model),
+            "response": response,
+            "done": True,
+            "load_duration": int(latency * 0.5e9),
+            "prompt_eval_duration": int(latency * 0.5e9),
+            "eval_count": token_count,
+            "eval_duration": int(self.fake_config.token_delay * token_count * 1e9)
+        }
+    
+    def _stream_tokens(self, payload: Dict, tokens: list, latency: float):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        try:
+            for token in tokens:
+                self._write_chunk({"model": payload.get("model", self.fake_config.model), "response": token, "done": False})
+                time.sleep(self.fake_config.token_delay)
+            self._write_chunk(self._final_chunk(payload, "", len(tokens), latency))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading early, e.g. streaming early abort
+            pass
+    
+    def _write_chunk(self, data: Dict[str, Any]):
+        line = (json.dumps(data) + "\n").encode()
+        self.wfile.write(f"{len(line):X}\r\n".encode() + line + b"\r\n")
+        self.wfile.flush()
+    
+    def _send_json(self, status: int, data: Dict[str, Any]):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def start_fake_ollama(config: Optional[FakeOllamaConfig] = None, host: str = "127.0.0.1",
+                      port: int = 0) -> ThreadingHTTPServer:
+    """Start the fake server on a background thread, port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), FakeOllamaHandler)
+    server.daemon_threads = True
+    server.fake_config = config or FakeOllamaConfig()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Ollama server for vision pipeline load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--model", default="llama3.2-vision:latest")
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="fixed")
+    parser.add_argument("--latency-median", type=float, default=0.5, help="Seconds before the first token")
+    parser.add_argument("--latency-spread", type=float, default=0.3, help="Uniform half-width or lognormal sigma")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="Seconds between streamed tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of generate calls answered with HTTP 500")
+    parser.add_argument("--outputs", help="JSON file mapping document type to the canned extraction result")
+    parser.add_argument("--cold-start", type=float, default=0.0, help="Extra seconds when the model is not resident")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    
+    outputs = None
+    if args.outputs:
+        with open(args.outputs) as f:
+            outputs = {**DEFAULT_OUTPUTS, **json.load(f)}
+    
+    config = FakeOllamaConfig(
+        model=args.model, latency=args.latency, latency_median=args.latency_median,
+        latency_spread=args.latency_spread, token_delay=args.token_delay,
+        error_rate=args.error_rate, outputs=outputs, seed=args.seed,
+        cold_start=args.cold_start
+    )
+    
+    server = ThreadingHTTPServer((args.host, args.port), FakeOllamaHandler)
+    server.daemon_threads = True
+    server.fake_config = config
+    print(f"Fake Ollama listening on http://{args.host}:{args.port} (model {args.model})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compare the memory held by normalized internship dicts with InternshipFeatures records
+
+Internships are generated from benchmarks/data/job_descriptions.jsonl, normalized
+once, and then held both as plain dicts (what normalize_internship_data returns)
+and as __slots__ records (what the extractor caches). Field values are shared
+between the two, so tracemalloc measures only the per-entry container cost.
+
+Usage:
+    python benchmarks/feature_memory_benchmark.py --count 10000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+# Add Engine path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_extraction.extractor import DataExtractor
+from data_extraction.features import InternshipFeatures
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_descriptions.jsonl')
+
+
+def load_internships(path: str, count: int) -> List[Dict[str, Any]]:
+    """Raw internships in the shape the backend passes to the orchestrator"""
+    with open(path) as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    
+    now = datetime.now()
+    internships = []
+    for i in range(count):
+        row = rows[i % len(rows)]
+        internships.append({
+            'internship_id': i + 1,
+            'updated_at': now.isoformat(),
+            'title': row.get('internship_title', ''),
+            'company_name': f"Company {i % 50}",
+            'description': row.get('job_description', ''),
+            'required_skills': row.get('required_skills', ''),
+            'industry': 'Technology',
+            'stipend': f"₹{10000 + (i % 20) * 1000}/month",
+            'posted_date': (now - timedelta(days=i % 60)).isoformat(),
+            'click_through_rate': 0.05,
+            'apply_rate': 0.02,
+            'total_applications': i % 200,
+            'total_selections': i % 7
+        })
+    return internships
+
+
+def measure(build: Callable[[], list]) -> int:
+    """Bytes still allocated by build() once it returns"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+def time_lookups(entries: list, repeat: int) -> float:
+    """Seconds for the .get() lookups a scoring pass makes per internship"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for entry in entries:
+            entry.get('title', '')
+            entry.get('industry', '')
+            entry.get('posted_date', '')
+            entry.get('click_through_rate', 0.05)
+            entry.get('total_applications', 1)
+    return time.perf_counter() - start
+
+
+def time_slot_reads(records: list, repeat: int) -> float:
+    """Seconds for the same number of reads through attributes, as the engine reads pre-parsed slots"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for record in records:
+            record.title
+            record.industry
+            record.posted_timestamp
+            record.click_through_rate
+            record.total_applications
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalized feature memory benchmark")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSONL file with internship_title/required_skills/job_description")
+    parser.add_argument("--count", type=int, default=10000, help="Number of internships to hold")
+    parser.add_argument("--repeat", type=int, default=20, help="Lookup passes for the access timing")
+    args = parser.parse_args()
+    
+    extractor = DataExtractor()
+    normalized = [extractor._normalize_internship(row) for row in load_internships(args.corpus, args.count)]
+    
+    # Share the parsed values so only the containers are counted
+    records = [InternshipFeatures.from_dict(entry) for entry in normalized]
+    dict_bytes = measure(lambda: [dict(entry) for entry in normalized])
+    record_bytes = measure(lambda: [InternshipFeatures.from_dict(entry) for entry in normalized])
+    
+    print(f"✓ {args.count} internships, {len(InternshipFeatures.DEFAULTS)} normalized fields "
+          f"(+{len(InternshipFeatures.__slots__) - len(InternshipFeatures.DEFAULTS)} pre-parsed on records)")
+    for name, size in (("dict", dict_bytes), ("InternshipFeatures", record_bytes)):
+        print(f"  {name:<20} {size / 1024 / 1024:7.2f} MB  ({size / args.count:.0f} B/internship)")
+    print(f"  saving: {(1 - record_bytes / dict_bytes) * 100:.0f}%")
+    
+    for name, entries in (("dict", normalized), ("InternshipFeatures", records)):
+        elapsed = time_lookups(entries, args.repeat)
+        print(f"  {name:<20} {elapsed / (args.repeat * len(entries) * 5) * 1e9:.0f} ns/lookup")
+    elapsed = time_slot_reads(records, args.repeat)
+    print(f"  {'slot attributes':<20} {elapsed / (args.repeat * len(records) * 5) * 1e9:.0f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
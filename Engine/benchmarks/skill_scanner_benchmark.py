@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataExtractor.extract_skills_from_text against the per-category scan it replaced
+
+The corpus is a JSONL file of internships (required_skills + job_description),
+benchmarks/data/job_descriptions.jsonl by default. The extracted skill sets are
+checked to be identical before timings are reported.
+
+Usage:
+    python benchmarks/skill_scanner_benchmark.py --repeat 2000
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+# Add Engine path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_extraction.extractor import DataExtractor
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_descriptions.jsonl')
+
+
+def legacy_extract_skills(extractor: DataExtractor, text: str,
+                          categories: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """The previous implementation: one re.findall per category pattern"""
+    if not text:
+        return {}
+    
+    text_lower = text.lower()
+    extracted_skills = {}
+    for category in categories or list(extractor.skill_patterns.keys()):
+        if category not in extractor.skill_patterns:
+            continue
+        category_skills = []
+        for pattern in extractor.skill_patterns[category]:
+            category_skills.extend(re.findall(pattern, text_lower, re.IGNORECASE))
+        if category_skills:
+            extracted_skills[category] = list(set(category_skills))
+    return extracted_skills
+
+
+def load_corpus(path: str) -> List[str]:
+    """Texts as normalize_internship_data builds them: required skills followed by description"""
+    texts = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                texts.append(f"{row.get('required_skills', '')} {row.get('job_description', row.get('description', ''))}")
+    return texts
+
+
+def as_sets(result: Dict[str, List[str]]) -> Dict[str, set]:
+    return {category: set(skills) for category, skills in result.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill scanner benchmark")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSONL file with required_skills/job_description")
+    parser.add_argument("--repeat", type=int, default=1000, help="Passes over the corpus per implementation")
+    args = parser.parse_args()
+    
+    extractor = DataExtractor()
+    texts = load_corpus(args.corpus)
+    
+    # Same output before timing anything
+    mismatches = [
+        text for text in texts
+        if as_sets(extractor.extract_skills_from_text(text)) != as_sets(legacy_extract_skills(extractor, text))
+    ]
+    if mismatches:
+        print(f"✗ {len(mismatches)} texts produced different skill sets, first: {mismatches[0][:80]}")
+        sys.exit(1)
+    print(f"✓ Extracted skill sets identical on {len(texts)} texts")
+    
+    timings = {}
+    for name, extract in (
+        ("per-category findall", lambda text: legacy_extract_skills(extractor, text)),
+        ("single-pass scanner", extractor.extract_skills_from_text),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                extract(text)
+        timings[name] = time.perf_counter() - start
+    
+    calls = args.repeat * len(texts)
+    for name, elapsed in timings.items():
+        print(f"  {name:<22} {elapsed:.3f}s  ({elapsed / calls * 1e6:.1f} µs/text)")
+    print(f"  speedup: {timings['per-category findall'] / timings['single-pass scanner']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
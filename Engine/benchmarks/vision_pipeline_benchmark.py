@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark RecommendationOrchestrator.process_uploaded_documents against a fake Ollama
+
+Starts benchmarks/fake_ollama_server.py in-process (or targets --url), uploads a
+synthetic set of resume/transcript/certificate images per simulated user and
+reports throughput and latency percentiles.
+
+Usage:
+    python benchmarks/vision_pipeline_benchmark.py --requests 50 --concurrency 8 --stream
+"""
+
+import argparse
+import base64
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# Add Engine path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from main import RecommendationOrchestrator
+from utils.helpers import ConfigManager
+from benchmarks.fake_ollama_server import FakeOllamaConfig, start_fake_ollama
+
+# 1x1 pixel PNG, the fake server never looks at the image
+PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGNgYGAAAAAEAAH2FzhVAAAAAElFTkSuQmCC"
+)
+
+
+def create_sample_documents(directory: str, documents_per_user: int) -> List[str]:
+    """Write placeholder images named so _determine_document_type spreads them over all types"""
+    kinds = ["resume", "transcript", "certificate"]
+    paths = []
+    for index in range(documents_per_user):
+        path = os.path.join(directory, f"{kinds[index % len(kinds)]}_{index}.png")
+        with open(path, "wb") as f:
+            f.write(PLACEHOLDER_PNG)
+        paths.append(path)
+    return paths
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_benchmark(orchestrator: RecommendationOrchestrator, file_paths: List[str],
+                  requests: int, concurrency: int) -> Dict[str, float]:
+    """Drive process_uploaded_documents from a thread pool and collect per-call latency"""
+    
+    def one_request(request_number: int):
+        start = time.perf_counter()
+        result = orchestrator.process_uploaded_documents(f"bench{request_number}", file_paths)
+        elapsed = time.perf_counter() - start
+        summary = result.get("processing_summary", {})
+        ok = summary.get("failed_extractions", 0) == 0 if summary else result.get("success", False)
+        return elapsed, ok
+    
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one_request, range(requests)))
+    wall_time = time.perf_counter() - wall_start
+    
+    latencies = [elapsed for elapsed, _ in outcomes]
+    failures = sum(1 for _, ok in outcomes if not ok)
+    
+    return {
+        "requests": requests,
+        "documents": requests * len(file_paths),
+        "failures": failures,
+        "wall_time": wall_time,
+        "requests_per_second": requests / wall_time,
+        "documents_per_second": requests * len(file_paths) / wall_time,
+        "latency_mean": statistics.mean(latencies),
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p95": percentile(latencies, 0.95),
+        "latency_max": max(latencies)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vision pipeline throughput/latency benchmark")
+    parser.add_argument("--requests", type=int, default=20, help="Upload batches to process")
+    parser.add_argument("--concurrency", type=int, default=4, help="Batches processed at once")
+    parser.add_argument("--documents", type=int, default=3, help="Documents per batch")
+    parser.add_argument("--stream", action="store_true", help="Use VisionProcessor streaming mode")
+    parser.add_argument("--url", help="Use an already running (fake or real) Ollama instead of starting one")
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-median", type=float, default=0.2)
+    parser.add_argument("--latency-spread", type=float, default=0.4)
+    parser.add_argument("--token-delay", type=float, default=0.002)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    server = None
+    url = args.url
+    if not url:
+        server = start_fake_ollama(FakeOllamaConfig(
+            latency=args.latency, latency_median=args.latency_median,
+            latency_spread=args.latency_spread, token_delay=args.token_delay,
+            error_rate=args.error_rate, seed=args.seed
+        ))
+        url = f"http://127.0.0.1:{server.server_port}"
+    
+    config = ConfigManager.get_default_config()
+    config['ollama']['url'] = url
+    config['ollama']['stream'] = args.stream
+    orchestrator = RecommendationOrchestrator(config)
+    
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            file_paths = create_sample_documents(directory, args.documents)
+            results = run_benchmark(orchestrator, file_paths, args.requests, args.concurrency)
+    finally:
+        if server:
+            server.shutdown()
+    
+    print(f"\nVision pipeline benchmark ({'streaming' if args.stream else 'blocking'}, concurrency {args.concurrency})")
+    print(f"  batches:        {results['requests']} ({results['documents']} documents, {results['failures']} with failures)")
+    print(f"  wall time:      {results['wall_time']:.2f}s")
+    print(f"  throughput:     {results['requests_per_second']:.2f} batches/s, {results['documents_per_second']:.2f} documents/s")
+    print(f"  latency mean:   {results['latency_mean'] * 1000:.0f} ms")
+    print(f"  latency p50:    {results['latency_p50'] * 1000:.0f} ms")
+    print(f"  latency p95:    {results['latency_p95'] * 1000:.0f} ms")
+    print(f"  latency max:    {results['latency_max'] * 1000:.0f} ms")
+    
+    metrics = orchestrator.metrics.get_metrics()
+    print(f"  avg TTFT:       {metrics['avg_time_to_first_token'] * 1000:.0f} ms")
+    print(f"  avg tokens/s:   {metrics['avg_tokens_per_second']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Bulk, pandas-vectorized normalization for nightly jobs and migrations
+
+Produces the same fields as DataExtractor.normalize_internship_data and
+normalize_user_data, one DataFrame per chunk, so hundreds of thousands of
+records can be processed with flat memory.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+from data_extraction.extractor import DataExtractor
+from data_extraction.features import InternshipFeatures, UserFeatures, parse_amount, parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+Source = Union[pd.DataFrame, Iterable[Any]]
+
+
+class BulkNormalizer:
+    """
+    Chunked, columnar counterpart of the per-record DataExtractor normalizers
+    """
+    
+    def __init__(self, extractor: Optional[DataExtractor] = None, chunk_size: int = 10000):
+        """
+        Args:
+            extractor: Supplies the skill patterns, vision parsing and canonicalizer
+            chunk_size: Records per DataFrame chunk
+        """
+        self.extractor = extractor or DataExtractor()
+        self.canonicalizer = self.extractor.skill_canonicalizer
+        self.chunk_size = chunk_size
+    
+    def iter_chunks(self, source: Source, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Split a DataFrame, or an iterator of DB rows, into DataFrames of chunk_size records
+        
+        Rows may be dicts, SQLAlchemy Row objects or plain tuples (which need columns).
+        """
+        if isinstance(source, pd.DataFrame):
+            for start in range(0, len(source), self.chunk_size):
+                yield source.iloc[start:start + self.chunk_size].reset_index(drop=True)
+            return
+        
+        batch = []
+        for row in source:
+            batch.append(self._row_to_dict(row, columns))
+            if len(batch) >= self.chunk_size:
+                yield pd.DataFrame.from_records(batch)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch)
+    
+    @staticmethod
+    def _row_to_dict(row: Any, columns: Optional[Sequence[str]]) -> Dict[str, Any]:
+        if isinstance(row, Mapping):
+            return dict(row)
+        if hasattr(row, '_mapping'):
+            return dict(row._mapping)
+        if columns is None:
+            raise ValueError("columns are required for tuple rows")
+        return dict(zip(columns, row))
+    
+    def normalize_internships(self, source: Source, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Normalized internships, one DataFrame per chunk
+        
+        Columns are the keys of normalize_internship_data plus posted_timestamp,
+        stipend_amount and skill_ids (sorted canonical ids of the required and
+        parsed skills).
+        """
+        for chunk in self.iter_chunks(source, columns):
+            yield self._normalize_internship_chunk(chunk)
+    
+    def normalize_users(self, source: Source, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Normalized users, one DataFrame per chunk
+        
+        Columns are the keys of normalize_user_data plus gpa,
+        stipend_expectation_amount and skill_ids.
+        """
+        for chunk in self.iter_chunks(source, columns):
+            yield self._normalize_user_chunk(chunk)
+    
+    def iter_internship_features(self, source: Source, columns: Optional[Sequence[str]] = None) -> Iterator[InternshipFeatures]:
+        """InternshipFeatures records, e.g. for Catalog.append"""
+        for frame in self.normalize_internships(source, columns):
+            for record in frame.to_dict('records'):
+                yield InternshipFeatures.from_dict(record)
+    
+    def iter_user_features(self, source: Source, columns: Optional[Sequence[str]] = None) -> Iterator[UserFeatures]:
+        """UserFeatures records"""
+        for frame in self.normalize_users(source, columns):
+            for record in frame.to_dict('records'):
+                yield UserFeatures.from_dict(record)
+    
+    def _normalize_internship_chunk(self, raw: pd.DataFrame) -> pd.DataFrame:
+        normalized = self._select_fields(raw, InternshipFeatures.DEFAULTS, derived=('parsed_skills', 'competitiveness', 'popularity_score'))
+        
+        # Skills from the required list and description, one regex pass per chunk
+        text = normalized['required_skills'].astype(str) + ' ' + normalized['description'].astype(str)
+        parsed = self._extract_skills(text)
+        normalized['parsed_skills'] = parsed
+        
+        required = self._split_skills(normalized['required_skills'])
+        parsed_tokens = pd.Series(
+            [[skill for skills in by_category.values() for skill in skills] for by_category in parsed],
+            index=normalized.index
+        ).explode()
+        normalized['skill_ids'] = self._skill_ids(pd.concat([required, parsed_tokens]), normalized.index)
+        
+        normalized['competitiveness'] = self._competitiveness(normalized['total_applications'], normalized['total_selections'])
+        normalized['popularity_score'] = self._popularity(normalized['click_through_rate'], normalized['apply_rate'])
+        
+        normalized['posted_timestamp'] = self._timestamps(normalized['posted_date'])
+        normalized['stipend_amount'] = self._amounts(normalized['stipend'])
+        return normalized
+    
+    def _normalize_user_chunk(self, raw: pd.DataFrame) -> pd.DataFrame:
+        # Same sources as _normalize_user: email comes from username, vision_data from vision_extracted_data
+        raw = raw.drop(columns=['email', 'vision_data'], errors='ignore').rename(
+            columns={'username': 'email', 'vision_extracted_data': 'vision_data'}
+        )
+        normalized = self._select_fields(
+            raw, UserFeatures.DEFAULTS, derived=('all_skills', 'experience_level', 'location_flexibility')
+        )
+        
+        # Vision payloads are nested JSON, parsed per record
+        normalized['vision_data'] = [
+            self.extractor._process_vision_data(value) if self._present(value) else {}
+            for value in normalized['vision_data']
+        ]
+        
+        all_skills = self._merge_user_skills(normalized)
+        normalized['all_skills'] = all_skills
+        normalized['skill_ids'] = self._skill_ids(all_skills.explode(), normalized.index)
+        normalized['experience_level'] = self._experience_levels(normalized)
+        normalized['location_flexibility'] = self._location_flexibility(normalized)
+        
+        normalized['gpa'] = self._amounts(normalized['gpa_percentage'])
+        normalized['stipend_expectation_amount'] = self._amounts(normalized['stipend_expectation'])
+        return normalized
+    
+    @staticmethod
+    def _select_fields(raw: pd.DataFrame, defaults: Dict[str, Any], derived: Sequence[str]) -> pd.DataFrame:
+        """
+        Normalized columns in order; missing columns and missing values take the per-record default
+        
+        A DataFrame can't tell an absent key from an explicit None, so both are treated as absent.
+        """
+        columns = {}
+        for field, default in defaults.items():
+            if field in derived:
+                columns[field] = None
+            elif field in raw.columns:
+                values = raw[field]
+                missing = values.isna()
+                columns[field] = values.astype(object).where(~missing, default) if missing.any() else values
+            else:
+                columns[field] = pd.Series([default] * len(raw), index=raw.index, dtype=object)
+        return pd.DataFrame(columns, index=raw.index)
+    
+    @staticmethod
+    def _present(value: Any) -> bool:
+        return value is not None and not (isinstance(value, float) and np.isnan(value)) and bool(value)
+    
+    def _extract_skills(self, text: pd.Series) -> List[Dict[str, List[str]]]:
+        """
+        extract_skills_from_text for every row with one scan of the whole chunk
+        
+        Distinct texts are joined with newlines (no skill pattern spans one) and
+        each match is assigned back to its text by offset.
+        """
+        categories = tuple(self.extractor.skill_patterns)
+        scanner = self.extractor._get_skill_scanner(categories)
+        codes, distinct = pd.factorize(text.str.lower())
+        distinct = distinct.tolist()
+        
+        # Matches arrive in text order, so the owning text only ever moves forward
+        ends = np.cumsum([len(value) + 1 for value in distinct]).tolist()
+        found = [{} for _ in range(len(distinct))]
+        owner = 0
+        for match in scanner.finditer('\n'.join(distinct)):
+            while match.start() >= ends[owner]:
+                owner += 1
+            category = match.lastgroup
+            found[owner].setdefault(category, {})[match.group(category)] = None
+        
+        parsed_distinct = [
+            {category: list(skills[category]) for category in categories if category in skills}
+            for skills in found
+        ]
+        return [parsed_distinct[code] for code in codes]
+    
+    @staticmethod
+    def _split_skills(values: pd.Series) -> pd.Series:
+        """Comma-separated skills as one stripped token per row entry (index repeats)"""
+        tokens = values.where(values.map(lambda value: isinstance(value, str)), '').str.split(',').explode()
+        tokens = tokens.str.strip()
+        return tokens[tokens.astype(bool)]
+    
+    def _resolve_tokens(self, tokens: pd.Series) -> pd.DataFrame:
+        """Canonical id/display name per token, resolving each distinct token once"""
+        tokens = tokens.dropna().astype(str)
+        codes, distinct = pd.factorize(tokens)
+        resolved = [self.canonicalizer.resolve(token) for token in distinct]
+        frame = pd.DataFrame({
+            'skill_id': np.array([skill.skill_id for skill in resolved], dtype=np.int64)[codes],
+            'key': np.array([skill.key for skill in resolved], dtype=object)[codes],
+            'display_name': np.array([skill.display_name for skill in resolved], dtype=object)[codes]
+        }, index=tokens.index)
+        return frame[frame['key'] != '']
+    
+    @staticmethod
+    def _group_lists(labels: Iterable[Any], values: Iterable[Any], index: pd.Index) -> pd.Series:
+        """One list per index label of the values carrying that label, in the order given"""
+        lists = {label: [] for label in index}
+        for label, value in zip(labels, values):
+            lists[label].append(value)
+        return pd.Series(list(lists.values()), index=index, dtype=object)
+    
+    def _skill_ids(self, tokens: pd.Series, index: pd.Index) -> pd.Series:
+        resolved = self._resolve_tokens(tokens)
+        pairs = pd.DataFrame({'row': resolved.index.to_numpy(), 'skill_id': resolved['skill_id'].to_numpy()})
+        pairs = pairs.drop_duplicates().sort_values(['row', 'skill_id'], kind='stable')
+        return self._group_lists(pairs['row'].to_numpy(), pairs['skill_id'].tolist(), index)
+    
+    def _merge_user_skills(self, normalized: pd.DataFrame) -> pd.Series:
+        """_combine_all_skills: form skills then vision skills, synonyms merged in first-seen order"""
+        vision = normalized['vision_data']
+        sources = [
+            self._split_skills(normalized['technical_skills']),
+            self._split_skills(normalized['soft_skills']),
+            vision.map(lambda data: list(data.get('extracted_skills', []) or [])).explode(),
+            vision.map(lambda data: list(data.get('extracted_technologies', []) or [])).explode()
+        ]
+        resolved = self._resolve_tokens(pd.concat(sources, keys=range(len(sources))).droplevel(0).sort_index(kind='stable'))
+        first_seen = ~pd.DataFrame({'row': resolved.index.to_numpy(), 'skill_id': resolved['skill_id'].to_numpy()}).duplicated()
+        resolved = resolved[first_seen.to_numpy()]
+        return self._group_lists(resolved.index.to_numpy(), resolved['display_name'].to_numpy(), normalized.index)
+    
+    @staticmethod
+    def _text_length(values: pd.Series) -> pd.Series:
+        return values.map(lambda value: len(value) if value else 0)
+    
+    def _experience_levels(self, normalized: pd.DataFrame) -> pd.Series:
+        """_calculate_experience_level with the same thresholds"""
+        internships_length = self._text_length(normalized['previous_internships'])
+        projects_length = self._text_length(normalized['projects'])
+        score = np.select([internships_length > 50, internships_length > 0], [2.0, 1.0], 0.0)
+        score += np.select([projects_length > 100, projects_length > 0], [2.0, 1.0], 0.0)
+        
+        year = normalized['year_of_study']
+        year_is_text = year.map(lambda value: isinstance(value, str)).to_numpy()
+        year_text = year.where(year_is_text, '').astype(str)
+        final_year = (year_text.str.lower().str.contains('final', regex=False) | year_text.str.contains('4', regex=False)).to_numpy()
+        third_year = year_text.str.contains('3', regex=False).to_numpy()
+        score += np.select([final_year, third_year], [1.0, 0.5], 0.0)
+        
+        certificates = normalized['vision_data'].map(lambda data: len(data.get('certificates', []))).to_numpy()
+        score += np.minimum(certificates * 0.5, 2)
+        
+        levels = np.select([score >= 4, score >= 2], ['experienced', 'intermediate'], 'beginner')
+        # A non-text year_of_study fails the per-record version, which then falls back to beginner
+        return pd.Series(np.where(year_is_text, levels, 'beginner'), index=normalized.index)
+    
+    @staticmethod
+    def _location_flexibility(normalized: pd.DataFrame) -> List[Dict[str, Any]]:
+        """_assess_location_flexibility, with remote preference from one vectorized match"""
+        type_preference = normalized['internship_type_preference']
+        is_text = type_preference.map(lambda value: isinstance(value, str)).to_numpy()
+        remote = type_preference.where(is_text, '').astype(str).str.lower().str.contains('remote|online').to_numpy()
+        current = (normalized['city'].astype(str) + ' ' + normalized['state'].astype(str)).tolist()
+        return [
+            {
+                'willing_to_relocate': True,
+                'remote_work_preference': bool(remote_preference),
+                'preferred_locations': [],
+                'current_location': location
+            } if text else {'willing_to_relocate': True, 'remote_work_preference': False}
+            for text, remote_preference, location in zip(is_text, remote, current)
+        ]
+    
+    @staticmethod
+    def _numeric(values: pd.Series) -> np.ndarray:
+        """Float array of numeric values; NaN for anything the per-record arithmetic would reject (e.g. "7")"""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.to_numpy(dtype=np.float64)
+        return values.map(lambda value: float(value) if isinstance(value, (int, float)) else np.nan).to_numpy(dtype=np.float64)
+    
+    @staticmethod
+    def _competitiveness(applications: pd.Series, selections: pd.Series) -> pd.Series:
+        """
+        _calculate_competitiveness: 0.0 without applications, 0.5 when the ratio
+        can't be computed (no selections or non-numeric counts), else min(1, ratio / 100)
+        """
+        index = applications.index
+        applications = BulkNormalizer._numeric(applications)
+        selections = BulkNormalizer._numeric(selections)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.minimum(1.0, applications / selections / 100.0)
+        computable = ~np.isnan(applications) & ~np.isnan(selections) & (selections != 0)
+        return pd.Series(np.where(applications == 0, 0.0, np.where(computable, ratio, 0.5)), index=index)
+    
+    @staticmethod
+    def _popularity(click_through_rate: pd.Series, apply_rate: pd.Series) -> pd.Series:
+        """_calculate_popularity_score: min(1, (0.7 * ctr + 0.3 * apply_rate) / 0.1), 0.5 if non-numeric"""
+        ctr = BulkNormalizer._numeric(click_through_rate)
+        apply = BulkNormalizer._numeric(apply_rate)
+        popularity = np.minimum(1.0, (ctr * 0.7 + apply * 0.3) / 0.1)
+        return pd.Series(np.where(np.isnan(popularity), 0.5, popularity), index=click_through_rate.index)
+    
+    @staticmethod
+    def _map_distinct(values: pd.Series, parse) -> pd.Series:
+        """Apply parse once per distinct value (dates and stipends repeat heavily)"""
+        keys = values.map(lambda value: value if isinstance(value, (str, int, float)) else repr(value))
+        table = {}
+        for key, value in zip(keys, values):
+            if key not in table:
+                table[key] = parse(value)
+        return keys.map(table)
+    
+    def _timestamps(self, values: pd.Series) -> pd.Series:
+        """features.parse_timestamp per distinct value, NaN when missing"""
+        return self._map_distinct(values, parse_timestamp).astype(np.float64)
+    
+    def _amounts(self, values: pd.Series) -> pd.Series:
+        """features.parse_amount per distinct value"""
+        return self._map_distinct(values, parse_amount).astype(np.float64)
\ No newline at end of file
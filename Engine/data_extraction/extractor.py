@@ -7,8 +7,23 @@ import re
 from typing import Dict, List, Any, Optional
 import logging
 
+from utils.helpers import LRUCache
+from utils.skill_canonicalizer import get_skill_canonicalizer
+from data_extraction.features import InternshipFeatures, UserFeatures
+
 logger = logging.getLogger(__name__)
 
+# Normalized internships shared by every DataExtractor in the process,
+# keyed on internship_id and holding (updated_at, normalized data)
+_internship_cache = LRUCache(max_size=10000)
+
+# Normalized user profiles, keyed on user_id and holding
+# ((profile_updated_at, vision_processed_at), normalized data)
+_user_cache = LRUCache(max_size=5000)
+
+# Bumped whenever the normalized user layout changes so persisted copies are recomputed
+NORMALIZED_USER_VERSION = 2
+
 class DataExtractor:
     """
     Utility class for extracting and processing data from various sources
@@ -16,6 +31,8 @@ class DataExtractor:
     
     def __init__(self):
         self.skill_patterns = self._load_skill_patterns()
+        self._skill_scanners = {}
+        self.skill_canonicalizer = get_skill_canonicalizer()
         
     def _load_skill_patterns(self) -> Dict[str, List[str]]:
         """Load patterns for skill extraction"""
@@ -53,25 +70,82 @@ class DataExtractor:
         """
         if not text:
             return {}
-            
-        text_lower = text.lower()
-        extracted_skills = {}
         
-        categories_to_check = categories or list(self.skill_patterns.keys())
+        if categories:
+            categories_to_check = tuple(category for category in categories if category in self.skill_patterns)
+        else:
+            categories_to_check = tuple(self.skill_patterns)
         
-        for category in categories_to_check:
-            if category not in self.skill_patterns:
-                continue
-                
-            category_skills = []
-            for pattern in self.skill_patterns[category]:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                category_skills.extend(matches)
-            
-            if category_skills:
-                extracted_skills[category] = list(set(category_skills))  # Remove duplicates
-                
-        return extracted_skills
+        if not categories_to_check:
+            return {}
+        
+        # One pass over the text, the named group that matched tells the category
+        found_skills = {}
+        for match in self._get_skill_scanner(categories_to_check).finditer(text.lower()):
+            category = match.lastgroup
+            found_skills.setdefault(category, set()).add(match.group(category))
+        
+        return {
+            category: list(found_skills[category])
+            for category in categories_to_check
+            if category in found_skills
+        }
+    
+    def _get_skill_scanner(self, categories: tuple) -> re.Pattern:
+        """Compile (once) a single alternation of the category patterns, one named group per category"""
+        scanner = self._skill_scanners.get(categories)
+        if scanner is None:
+            alternatives = [
+                f"(?P<{category}>{'|'.join(self.skill_patterns[category])})"
+                for category in categories
+            ]
+            # Every skill starts with a word character after \b; checking that once up front lets
+            # the engine reject most positions before trying each category's alternation
+            scanner = re.compile(r'(?=\w)\b(?:' + '|'.join(alternatives) + ')')
+            self._skill_scanners[categories] = scanner
+        return scanner
+    
+    @staticmethod
+    def invalidate_user(user_id: Any):
+        """Drop the cached normalization of a user after their profile or documents change"""
+        _user_cache.pop(user_id)
+    
+    def _user_cache_stamp(self, user_data: Dict) -> Optional[List[Any]]:
+        """Timestamps that change whenever the inputs of normalize_user_data change"""
+        profile_updated_at = user_data.get('profile_updated_at')
+        vision_processed_at = user_data.get('vision_processed_at')
+        if not user_data.get('user_id') or not (profile_updated_at or vision_processed_at):
+            return None
+        return [profile_updated_at, vision_processed_at]
+    
+    def _load_persisted_user(self, user_data: Dict, stamp: List[Any]) -> Optional[Dict[str, Any]]:
+        """Normalized profile from the compact normalized_profile column, if still current"""
+        blob = user_data.get('normalized_profile')
+        if not blob:
+            return None
+        try:
+            persisted = json.loads(blob)
+            if persisted.get('v') == NORMALIZED_USER_VERSION and persisted.get('stamp') == stamp:
+                return persisted['data']
+        except (ValueError, TypeError, KeyError):
+            logger.warning(f"Ignoring unreadable normalized profile for user {user_data.get('user_id')}")
+        return None
+    
+    def serialize_normalized_user(self, user_data: Dict, normalized: Dict[str, Any]) -> Optional[str]:
+        """
+        Compact JSON for the users.normalized_profile column
+        
+        Returns None when the stored copy is already current (or the user has no
+        timestamps to key it on), so callers only write when something changed.
+        """
+        stamp = self._user_cache_stamp(user_data)
+        if stamp is None or self._load_persisted_user(user_data, stamp) is not None:
+            return None
+        return json.dumps(
+            {'v': NORMALIZED_USER_VERSION, 'stamp': stamp, 'data': normalized},
+            separators=(',', ':'),
+            default=str
+        )
     
     def normalize_user_data(self, user_data: Dict) -> Dict[str, Any]:
         """
@@ -83,6 +157,37 @@ class DataExtractor:
         Returns:
             Processed and normalized user data
         """
+        return self.user_features(user_data).to_dict()
+    
+    def user_features(self, user_data: Dict) -> UserFeatures:
+        """
+        Normalized user as a compact UserFeatures record
+        
+        Results are memoized per user on (profile_updated_at, vision_processed_at),
+        first in process and then from the persisted normalized_profile column.
+        """
+        stamp = self._user_cache_stamp(user_data)
+        if stamp is None:
+            return UserFeatures.from_dict(self._normalize_user(user_data))
+        
+        user_id = user_data['user_id']
+        cached = _user_cache.get(user_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        normalized = self._load_persisted_user(user_data, stamp)
+        if normalized is None:
+            normalized = self._normalize_user(user_data)
+            # Failed normalizations return the raw input, don't memoize those
+            if normalized is user_data:
+                return UserFeatures.from_dict(normalized)
+        
+        features = UserFeatures.from_dict(normalized)
+        _user_cache.set(user_id, (stamp, features))
+        return features
+    
+    def _normalize_user(self, user_data: Dict) -> Dict[str, Any]:
+        """Build the normalized user record (uncached)"""
         try:
             normalized = {}
             
@@ -132,6 +237,25 @@ class DataExtractor:
             logger.error(f"User data normalization failed: {e}")
             return user_data  # Return original data if processing fails
     
+    @staticmethod
+    def invalidate_internship(internship_id: Any):
+        """Drop the cached normalization of an internship after it is created, updated or deleted"""
+        _internship_cache.pop(internship_id)
+    
+    @staticmethod
+    def clear_internship_cache():
+        """Drop every cached internship normalization"""
+        _internship_cache.clear()
+    
+    @staticmethod
+    def set_internship_cache_size(max_size: int):
+        """Bound the number of normalized internships kept per process"""
+        _internship_cache.max_size = max_size
+    
+    @staticmethod
+    def internship_cache_stats() -> Dict[str, Any]:
+        return _internship_cache.stats()
+    
     def normalize_internship_data(self, internship_data: Dict) -> Dict[str, Any]:
         """
         Normalize and enrich internship data for recommendation processing
@@ -142,11 +266,42 @@ class DataExtractor:
         Returns:
             Processed and normalized internship data
         """
+        return self.internship_features(internship_data).to_dict()
+    
+    def internship_features(self, internship_data: Dict) -> InternshipFeatures:
+        """
+        Normalized internship as a compact InternshipFeatures record
+        
+        Results are memoized on (internship_id, updated_at), so an unchanged
+        internship is only normalized once per process.
+        """
+        internship_id = internship_data.get('internship_id')
+        updated_at = internship_data.get('updated_at')
+        cacheable = bool(internship_id) and bool(updated_at)
+        
+        if cacheable:
+            cached = _internship_cache.get(internship_id)
+            if cached is not None and cached[0] == updated_at:
+                return cached[1]
+        
+        normalized = self._normalize_internship(internship_data)
+        features = InternshipFeatures.from_dict(normalized)
+        
+        # Failed normalizations return the raw input, don't memoize those
+        if cacheable and normalized is not internship_data:
+            _internship_cache.set(internship_id, (updated_at, features))
+        
+        return features
+    
+    def _normalize_internship(self, internship_data: Dict) -> Dict[str, Any]:
+        """Build the normalized internship record (uncached)"""
         try:
             normalized = {}
             
             # Basic information
             normalized['internship_id'] = internship_data.get('internship_id', '')
+            normalized['updated_at'] = internship_data.get('updated_at', '')
+            normalized['company_id'] = internship_data.get('company_id', 0)
             normalized['title'] = internship_data.get('title', '')
             normalized['company_name'] = internship_data.get('company_name', '')
             normalized['description'] = internship_data.get('description', '')
@@ -235,24 +390,24 @@ class DataExtractor:
             return {}
     
     def _combine_all_skills(self, user_data: Dict) -> List[str]:
-        """Combine skills from all sources"""
-        all_skills = set()
+        """Combine skills from all sources, merging synonyms into canonical skill names"""
+        all_skills = []
         
         # Manual skills
         tech_skills = user_data.get('technical_skills', '')
         if tech_skills:
-            all_skills.update([s.strip() for s in tech_skills.split(',') if s.strip()])
+            all_skills.extend(tech_skills.split(','))
             
         soft_skills = user_data.get('soft_skills', '')
         if soft_skills:
-            all_skills.update([s.strip() for s in soft_skills.split(',') if s.strip()])
+            all_skills.extend(soft_skills.split(','))
         
         # Vision extracted skills
         vision_data = user_data.get('vision_data', {})
-        all_skills.update(vision_data.get('extracted_skills', []))
-        all_skills.update(vision_data.get('extracted_technologies', []))
+        all_skills.extend(vision_data.get('extracted_skills', []))
+        all_skills.extend(vision_data.get('extracted_technologies', []))
         
-        return list(all_skills)
+        return self.skill_canonicalizer.merge(all_skills)
     
     def _calculate_experience_level(self, user_data: Dict) -> str:
         """Calculate experience level based on available data"""
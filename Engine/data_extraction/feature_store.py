@@ -0,0 +1,147 @@
+"""
+Internship features computed once at write time and persisted by the backend
+
+Everything here depends only on the internship's own content, so the backend
+stores it next to the internship (the internship_features table) and
+recommendation requests rebuild the InternshipFeatures record from those
+columns instead of re-extracting skills from raw text.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from data_extraction.extractor import DataExtractor
+from data_extraction.features import InternshipFeatures
+from utils.skill_canonicalizer import CanonicalSkill, get_skill_canonicalizer
+
+logger = logging.getLogger(__name__)
+
+# Bump when anything below changes how features are computed; older rows are recomputed
+FEATURE_VERSION = 2
+
+# Hashed term space of the description vectors. A fitted TF-IDF vocabulary depends on
+# the whole corpus, hashing doesn't, so a vector stored today stays comparable later.
+DESCRIPTION_FEATURES = 2 ** 18
+
+_description_vectorizer = HashingVectorizer(
+    n_features=DESCRIPTION_FEATURES, stop_words='english', alternate_sign=False, norm='l2'
+)
+
+
+def description_vector(text: str) -> sparse.csr_matrix:
+    """L2-normalized hashed term frequencies of a text (1 x DESCRIPTION_FEATURES)"""
+    return _description_vectorizer.transform([text or ''])
+
+
+def pack_vector(vector: sparse.csr_matrix) -> Dict[str, bytes]:
+    """Indices (int32) and values (float32) of a one-row sparse vector"""
+    vector = vector.tocsr()
+    return {
+        'description_indices': vector.indices.astype(np.int32).tobytes(),
+        'description_values': vector.data.astype(np.float32).tobytes()
+    }
+
+
+def unpack_vector(indices: Optional[bytes], values: Optional[bytes]) -> sparse.csr_matrix:
+    column_indices = np.frombuffer(indices or b'', dtype=np.int32)
+    data = np.frombuffer(values or b'', dtype=np.float32).astype(np.float64)
+    return sparse.csr_matrix(
+        (data, column_indices, np.array([0, len(column_indices)])),
+        shape=(1, DESCRIPTION_FEATURES)
+    )
+
+
+class InternshipFeatureStore:
+    """
+    Computes the persisted internship features and loads records from them
+    
+    Args:
+        extractor: DataExtractor used for skill extraction and the derived metrics
+        required_skills_fn: Ordered canonical required skills of a normalized internship,
+            RecommendationEngine._ordered_required_skills so stored skills match what scoring uses
+    """
+    
+    def __init__(self, extractor: Optional[DataExtractor] = None,
+                 required_skills_fn: Optional[Callable[[Dict], List[str]]] = None):
+        self.extractor = extractor or DataExtractor()
+        if required_skills_fn is None:
+            from recommendation.engine import RecommendationEngine
+            required_skills_fn = RecommendationEngine()._ordered_required_skills
+        self.required_skills_fn = required_skills_fn
+        self.canonicalizer = get_skill_canonicalizer()
+    
+    def compute(self, internship_data: Dict) -> Dict[str, Any]:
+        """
+        Feature columns of one internship
+        
+        Args:
+            internship_data: Internship in the engine's field names (title, description, ...)
+        
+        Returns:
+            Column name -> value, ready to store
+        """
+        return self.compute_many([internship_data])[0]
+    
+    def compute_many(self, internships: List[Dict]) -> List[Dict[str, Any]]:
+        """compute() for a batch, with the description vectors hashed in one pass"""
+        return [features for features, _ in self.compute_with_skills(internships)]
+    
+    def compute_with_skills(self, internships: List[Dict]) -> List[Tuple[Dict[str, Any], List[CanonicalSkill]]]:
+        """
+        compute_many() plus each internship's canonical required skills in scoring order,
+        for the backend's internship_skills rows
+        """
+        normalized_internships = [self.extractor._normalize_internship(internship) for internship in internships]
+        vectors = _description_vectorizer.transform([
+            normalized.get('description', '') or '' for normalized in normalized_internships
+        ])
+        
+        batch = []
+        for row, normalized in enumerate(normalized_internships):
+            skills = [self.canonicalizer.resolve(skill) for skill in self.required_skills_fn(normalized)]
+            features = {
+                'feature_version': FEATURE_VERSION,
+                # Canonical keys rather than alias-table ids, which change when the table is edited
+                'skill_keys': json.dumps(list(dict.fromkeys(skill.key for skill in skills)), separators=(',', ':')),
+                'parsed_skills': json.dumps(normalized.get('parsed_skills', {}), separators=(',', ':')),
+                'competitiveness': float(normalized.get('competitiveness', 0.0)),
+                'popularity_score': float(normalized.get('popularity_score', 0.0))
+            }
+            features.update(pack_vector(vectors[row]))
+            batch.append((features, skills))
+        return batch
+    
+    @staticmethod
+    def is_current(stored: Optional[Mapping[str, Any]]) -> bool:
+        return bool(stored) and stored.get('feature_version') == FEATURE_VERSION
+    
+    def load(self, internship_data: Dict) -> InternshipFeatures:
+        """
+        InternshipFeatures of an internship, from its stored features when they are current
+        
+        internship_data may carry the stored columns under 'stored_features'; without
+        them (or when they are from an older FEATURE_VERSION) the internship is
+        normalized from its raw text as before.
+        """
+        stored = internship_data.get('stored_features')
+        if not self.is_current(stored):
+            return self.extractor.internship_features(internship_data)
+        
+        try:
+            normalized = {name: internship_data.get(name, default) for name, default in InternshipFeatures.DEFAULTS.items()}
+            normalized['parsed_skills'] = json.loads(stored.get('parsed_skills') or '{}')
+            normalized['competitiveness'] = stored.get('competitiveness', 0.0)
+            normalized['popularity_score'] = stored.get('popularity_score', 0.0)
+            
+            record = InternshipFeatures.from_dict(normalized)
+            record.skill_keys = json.loads(stored.get('skill_keys') or '[]')
+            record.description_vector = unpack_vector(stored.get('description_indices'), stored.get('description_values'))
+            return record
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Stored features of internship {internship_data.get('internship_id')} unreadable ({e}), recomputing")
+            return self.extractor.internship_features(internship_data)
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Compact __slots__ records for normalized users and internships
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+_AMOUNT_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+
+def parse_amount(value: Any) -> float:
+    """First number in a stipend-like value ("₹15,000/month" -> 15000.0), 0.0 when absent"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _AMOUNT_PATTERN.search(str(value or ''))
+    return float(match.group().replace(',', '')) if match else 0.0
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """POSIX timestamp of an ISO date string or datetime, None when missing or unparseable"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
+
+
+class FeatureRecord:
+    """
+    Base for the slot records, with read-only dict-style access so scoring code
+    written against normalized dicts (record.get('title', '')) keeps working
+    """
+    
+    __slots__ = ()
+    
+    # Normalized fields and their defaults; slots beyond these are pre-parsed
+    DEFAULTS: Dict[str, Any] = {}
+    _FIELDS: FrozenSet[str] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = frozenset(cls.__slots__)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELDS:
+            return getattr(self, key)
+        return default
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELDS
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """The normalized dict this record was built from (pre-parsed fields left out)"""
+        return {name: getattr(self, name) for name in self.DEFAULTS}
+    
+    def __repr__(self) -> str:
+        identifier = self.__slots__[0]
+        return f"<{type(self).__name__} {identifier}={getattr(self, identifier)!r}>"
+
+
+class InternshipFeatures(FeatureRecord):
+    """
+    Normalized internship with pre-parsed numeric fields
+    """
+    
+    __slots__ = (
+        'internship_id', 'updated_at', 'company_id', 'title', 'company_name', 'description',
+        'city', 'state', 'remote_allowed',
+        'required_skills', 'education_requirement', 'experience_required',
+        'duration', 'stipend', 'type', 'industry',
+        'posted_date', 'application_deadline',
+        'click_through_rate', 'apply_rate', 'total_applications', 'total_selections',
+        'parsed_skills', 'competitiveness', 'popularity_score',
+        # Pre-parsed fields
+        'posted_timestamp', 'stipend_amount',
+        # Persisted features, set by InternshipFeatureStore when the backend stored them
+        'skill_keys', 'description_vector'
+    )
+    
+    # Defaults match DataExtractor._normalize_internship
+    DEFAULTS = {
+        'internship_id': '', 'updated_at': '', 'company_id': 0, 'title': '', 'company_name': '', 'description': '',
+        'city': '', 'state': '', 'remote_allowed': False,
+        'required_skills': '', 'education_requirement': '', 'experience_required': '',
+        'duration': '', 'stipend': 0, 'type': '', 'industry': '',
+        'posted_date': '', 'application_deadline': '',
+        'click_through_rate': 0.05, 'apply_rate': 0.02, 'total_applications': 0, 'total_selections': 0,
+        'parsed_skills': {}, 'competitiveness': 0.0, 'popularity_score': 0.0
+    }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InternshipFeatures':
+        """Build from a normalized internship dict"""
+        record = cls.__new__(cls)
+        for name, default in cls.DEFAULTS.items():
+            setattr(record, name, data.get(name, default))
+        
+        record.click_through_rate = float(record.click_through_rate or 0.0)
+        record.apply_rate = float(record.apply_rate or 0.0)
+        record.total_applications = int(record.total_applications or 0)
+        record.total_selections = int(record.total_selections or 0)
+        record.posted_timestamp = parse_timestamp(record.posted_date)
+        record.stipend_amount = parse_amount(record.stipend)
+        record.skill_keys = None
+        record.description_vector = None
+        return record
+
+
+class UserFeatures(FeatureRecord):
+    """
+    Normalized user profile with pre-parsed numeric fields
+    """
+    
+    __slots__ = (
+        'user_id', 'name', 'email', 'city', 'state', 'pincode',
+        'education_level', 'degree', 'year_of_study', 'gpa_percentage',
+        'technical_skills', 'soft_skills', 'preferred_industry',
+        'internship_type_preference', 'duration_preference', 'stipend_expectation',
+        'previous_internships', 'projects', 'vision_data',
+        'all_skills', 'experience_level', 'location_flexibility',
+        # Pre-parsed fields
+        'gpa', 'stipend_expectation_amount'
+    )
+    
+    # Defaults match DataExtractor._normalize_user
+    DEFAULTS = {
+        'user_id': '', 'name': '', 'email': '', 'city': '', 'state': '', 'pincode': '',
+        'education_level': '', 'degree': '', 'year_of_study': '', 'gpa_percentage': 0.0,
+        'technical_skills': '', 'soft_skills': '', 'preferred_industry': '',
+        'internship_type_preference': '', 'duration_preference': '', 'stipend_expectation': 0,
+        'previous_internships': '', 'projects': '', 'vision_data': {},
+        'all_skills': [], 'experience_level': 'beginner', 'location_flexibility': {}
+    }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UserFeatures':
+        """Build from a normalized user dict"""
+        record = cls.__new__(cls)
+        for name, default in cls.DEFAULTS.items():
+            setattr(record, name, data.get(name, default))
+        
+        record.all_skills = list(record.all_skills or [])
+        record.gpa = parse_amount(record.gpa_percentage)
+        record.stipend_expectation_amount = parse_amount(record.stipend_expectation)
+        return record
\ No newline at end of file
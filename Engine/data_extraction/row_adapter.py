@@ -0,0 +1,93 @@
+"""
+Read-only view of backend internship rows under the Engine's field names
+
+The backend's internships table names fields internship_title, job_description,
+industry_domain, ... while the Engine reads title, description, industry.
+RowAdapter maps between them on access, so ORM objects, SQLAlchemy result rows
+or plain tuples can be handed to the Engine without building a dict per row.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from data_extraction.features import InternshipFeatures
+
+# Engine field -> (backend column, conversion applied to the column value or None)
+FIELD_MAP: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {
+    'title': ('internship_title', None),
+    'description': ('job_description', None),
+    'industry': ('industry_domain', None),
+    'education_requirement': ('education_level', None),
+    'posted_date': ('created_at', None),
+    'remote_allowed': ('location_type', lambda location_type: location_type == 'Remote')
+}
+
+# Engine fields read from a column of the same name when the row has one
+PASSTHROUGH_FIELDS = frozenset(InternshipFeatures.DEFAULTS) - frozenset(FIELD_MAP)
+
+_MISSING = object()
+
+
+class RowAdapter(Mapping):
+    """
+    Mapping over one internship row, keyed by Engine field names
+    
+    Args:
+        row: ORM Internship, SQLAlchemy Row, or a tuple when columns is given
+        columns: Column positions of a tuple row, from RowAdapter.positions()
+        extra: Additional Engine fields that don't come from the row (e.g. stored_features)
+    
+    Fields the row doesn't have raise KeyError, so internship.get(field, default)
+    in the Engine falls back to its usual defaults.
+    """
+    
+    __slots__ = ('_row', '_positions', '_extra')
+    
+    def __init__(self, row: Any, columns: Optional[Dict[str, int]] = None, extra: Optional[Dict[str, Any]] = None):
+        self._row = row
+        self._positions = columns
+        self._extra = extra
+    
+    @staticmethod
+    def positions(columns: Sequence[str]) -> Dict[str, int]:
+        """Column name -> position, computed once and shared by every tuple row of a query"""
+        return {name: position for position, name in enumerate(columns)}
+    
+    def _column(self, name: str) -> Any:
+        if self._positions is not None:
+            position = self._positions.get(name)
+            return _MISSING if position is None else self._row[position]
+        return getattr(self._row, name, _MISSING)
+    
+    def __getitem__(self, key: str) -> Any:
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        
+        mapped = FIELD_MAP.get(key)
+        if mapped is not None:
+            column, convert = mapped
+            value = self._column(column)
+            if value is _MISSING:
+                raise KeyError(key)
+            return convert(value) if convert else value
+        
+        if key in PASSTHROUGH_FIELDS:
+            value = self._column(key)
+            if value is _MISSING and key == 'company_name':
+                # ORM rows carry the name on the company relationship
+                company = self._column('company')
+                value = _MISSING if company is _MISSING or company is None else company.company_name
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in dict.fromkeys(list(FIELD_MAP) + sorted(PASSTHROUGH_FIELDS) + list(self._extra or ())):
+            if key in self:
+                yield key
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return f"<RowAdapter internship_id={self.get('internship_id')!r}>"
\ No newline at end of file
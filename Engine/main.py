@@ -10,6 +10,7 @@ from pathlib import Path
 from ai_processing.vision_processor import VisionProcessor
 from recommendation.engine import RecommendationEngine
 from data_extraction.extractor import DataExtractor
+from data_extraction.feature_store import InternshipFeatureStore
 from utils.helpers import CacheManager, ConfigManager, MetricsCollector, DatabaseUtils
 
 logger = logging.getLogger(__name__)
@@ -24,11 +25,17 @@ class RecommendationOrchestrator:
         self.config = config or ConfigManager.get_default_config()
         
         # Initialize components
-        self.vision_processor = VisionProcessor(self.config['ollama']['url'])
+        self.metrics = MetricsCollector()
+        self.vision_processor = VisionProcessor(
+            self.config['ollama']['url'],
+            config=self.config['ollama'],
+            metrics=self.metrics
+        )
         self.recommendation_engine = RecommendationEngine()
         self.data_extractor = DataExtractor()
+        DataExtractor.set_internship_cache_size(self.config['recommendation'].get('internship_cache_size', 10000))
+        self.feature_store = InternshipFeatureStore(self.data_extractor, self.recommendation_engine._ordered_required_skills)
         self.cache_manager = CacheManager()
-        self.metrics = MetricsCollector()
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -69,18 +76,24 @@ class RecommendationOrchestrator:
             enhanced_user_data = self._process_user_vision_data(user_data)
             
             # Step 2: Normalize and enrich all data
-            normalized_user = self.data_extractor.normalize_user_data(enhanced_user_data)
+            normalized_user = self.data_extractor.user_features(enhanced_user_data)
+            normalized_profile = None
+            if self.config['recommendation'].get('persist_normalized_user', True):
+                normalized_profile = self.data_extractor.serialize_normalized_user(
+                    enhanced_user_data, normalized_user.to_dict()
+                )
             normalized_internships = [
-                self.data_extractor.normalize_internship_data(internship)
+                self.feature_store.load(internship)
                 for internship in internships
             ]
             
             # Step 3: Generate recommendations using the engine
-            recommendation_ids = self.recommendation_engine.generate_recommendations(
+            scored_recommendations = self.recommendation_engine.generate_scored_recommendations(
                 normalized_user,
                 normalized_internships,
                 self.config['recommendation']['top_k']
             )
+            recommendation_ids = [recommendation['internship_id'] for recommendation in scored_recommendations]
             
             # Step 4: Cache the results
             self._cache_recommendations(user_id, internships, recommendation_ids)
@@ -93,6 +106,8 @@ class RecommendationOrchestrator:
             
             return {
                 'recommendations': recommendation_ids,
+                'scored_recommendations': scored_recommendations,
+                'normalized_profile': normalized_profile,
                 'source': 'generated',
                 'processing_time': processing_time,
                 'user_profile_completion': self._calculate_profile_completeness(normalized_user),
@@ -156,6 +171,16 @@ class RecommendationOrchestrator:
                 'extracted_data': {}
             }
     
+    def warm_up_vision_model(self, start_schedule: bool = True) -> bool:
+        """
+        Load the vision model ahead of traffic, optionally starting the business-hours
+        keep-warm schedule configured in config['ollama']['keep_warm_interval_minutes']
+        """
+        warmed = self.vision_processor.warm_up()
+        if start_schedule:
+            self.vision_processor.start_keep_warm()
+        return warmed
+    
     def get_recommendation_explanations(self, user_data: Dict, internship_ids: List[int], 
                                      internships: List[Dict]) -> List[Dict[str, Any]]:
         """
@@ -176,14 +201,14 @@ class RecommendationOrchestrator:
             internship_lookup = {int_data['internship_id']: int_data for int_data in internships}
             
             # Normalize user data
-            normalized_user = self.data_extractor.normalize_user_data(user_data)
+            normalized_user = self.data_extractor.user_features(user_data)
             
             for internship_id in internship_ids:
                 internship = internship_lookup.get(internship_id)
                 if not internship:
                     continue
                     
-                normalized_internship = self.data_extractor.normalize_internship_data(internship)
+                normalized_internship = self.feature_store.load(internship)
                 
                 # Generate explanation
                 explanation = self._generate_recommendation_explanation(
@@ -206,9 +231,13 @@ class RecommendationOrchestrator:
     
     def get_system_health(self) -> Dict[str, Any]:
         """Get system health and metrics"""
+        model_status = self.vision_processor.model_status()
         return {
             'ollama_available': self.vision_processor.health_check(),
+            'vision_model_resident': model_status.get('resident'),
+            'vision_model_expires_at': model_status.get('expires_at'),
             'metrics': self.metrics.get_metrics(),
+            'internship_cache': DataExtractor.internship_cache_stats(),
             'config': self.config,
             'status': 'healthy'
         }
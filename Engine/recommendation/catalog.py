@@ -0,0 +1,407 @@
+"""
+Columnar in-memory internship catalog for vectorized scoring
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from data_extraction.features import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+EDUCATION_LEVELS = {
+    'high school': 1, 'diploma': 2, 'undergraduate': 3,
+    'bachelor': 3, 'graduate': 4, 'master': 4, 'phd': 5
+}
+
+# Bit positions of the boolean barrier/inclusivity fields in the flags column
+FLAG_BITS = {
+    'remote_allowed': 0,
+    'requires_fee': 1,
+    'strict_hours': 2,
+    'requires_relocation': 3,
+    'pwd_friendly': 4,
+    'women_encouraged': 5,
+    'local_quota': 6
+}
+
+# Column name -> dtype, one entry per catalog row
+COLUMNS = {
+    'ids': np.int64,
+    'company_ids': np.int64,
+    'sector_codes': np.int32,
+    'location_codes': np.int32,
+    'education_codes': np.int8,
+    'posted_timestamps': np.float64,  # NaN when the posting date is missing or unparseable
+    'click_through_rates': np.float64,
+    'apply_rates': np.float64,
+    'total_applications': np.int64,
+    'total_selections': np.int64,
+    'flags': np.uint8,
+    'has_title': np.bool_,
+    'has_description': np.bool_,
+    'alive': np.bool_
+}
+
+
+class _GrowableCSR:
+    """Binary CSR matrix built one row at a time with amortized appends"""
+    
+    def __init__(self, initial_capacity: int = 1024):
+        self.indptr = np.zeros(initial_capacity + 1, dtype=np.int64)
+        self.indices = np.zeros(initial_capacity * 8, dtype=np.int32)
+        self.rows = 0
+        self._matrix = None
+    
+    def append_row(self, columns: Sequence[int]):
+        nnz = self.indptr[self.rows]
+        if self.rows + 2 > len(self.indptr):
+            self.indptr = np.resize(self.indptr, 2 * len(self.indptr))
+        if nnz + len(columns) > len(self.indices):
+            self.indices = np.resize(self.indices, 2 * (nnz + len(columns)))
+        self.indices[nnz:nnz + len(columns)] = columns
+        self.indptr[self.rows + 1] = nnz + len(columns)
+        self.rows += 1
+        self._matrix = None
+    
+    def row_lengths(self) -> np.ndarray:
+        return np.diff(self.indptr[:self.rows + 1])
+    
+    def matrix(self, n_columns: int) -> sparse.csr_matrix:
+        if self._matrix is None or self._matrix.shape[1] != n_columns:
+            nnz = self.indptr[self.rows]
+            self._matrix = sparse.csr_matrix(
+                (np.ones(nnz, dtype=np.float32), self.indices[:nnz], self.indptr[:self.rows + 1]),
+                shape=(self.rows, n_columns)
+            )
+        return self._matrix
+    
+    def keep(self, mask: np.ndarray, n_columns: int):
+        """Drop the rows where mask is False"""
+        kept = self.matrix(n_columns)[mask]
+        self.indptr = np.array(kept.indptr, dtype=np.int64)
+        self.indices = np.array(kept.indices, dtype=np.int32)
+        self.rows = kept.shape[0]
+        self._matrix = None
+
+
+class Catalog:
+    """
+    Internships stored column-wise for vectorized scoring and filtering
+    
+    Scalar fields live in NumPy arrays, required skills in binary CSR matrices
+    over a growing skill vocabulary, and titles/descriptions as TF-IDF rows.
+    Rows are append-only: an update tombstones the old row and appends a new
+    one, and compact() drops dead rows once they pass compact_ratio.
+    """
+    
+    def __init__(self, required_skills_fn: Callable[[Any], Sequence[str]], top_k_skills: int = 3,
+                 max_features: int = 5000, compact_ratio: float = 0.25, initial_capacity: int = 1024):
+        """
+        Args:
+            required_skills_fn: Ordered required skills of a normalized internship
+            top_k_skills: Leading required skills kept in the top skill matrix
+            max_features: TF-IDF vocabulary size
+            compact_ratio: Fraction of tombstoned rows that triggers compaction
+            initial_capacity: Rows allocated up front
+        """
+        self.required_skills_fn = required_skills_fn
+        self.top_k_skills = top_k_skills
+        self.compact_ratio = compact_ratio
+        
+        self._capacity = initial_capacity
+        self._columns = {name: np.zeros(initial_capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._size = 0
+        self._dead = 0
+        self._row_of: Dict[Any, int] = {}
+        
+        # Interned strings; code 0 is always the empty string
+        self.skill_vocab: Dict[str, int] = {}
+        self.sector_vocab: Dict[str, int] = {'': 0}
+        self.location_vocab: Dict[str, int] = {'': 0}
+        
+        self._skills = _GrowableCSR(initial_capacity)
+        self._top_skills = _GrowableCSR(initial_capacity)
+        
+        # TF-IDF rows are appended in blocks and stacked on demand
+        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=max_features)
+        self._vectorizer_fitted = False
+        self._analyzer = None
+        self._fitted_rows = 0
+        self._titles: List[str] = []
+        self._descriptions: List[str] = []
+        self._title_blocks: List[sparse.csr_matrix] = []
+        self._description_blocks: List[sparse.csr_matrix] = []
+    
+    def __len__(self) -> int:
+        return self._size - self._dead
+    
+    def __contains__(self, internship_id: Any) -> bool:
+        return int(internship_id) in self._row_of
+    
+    @property
+    def size(self) -> int:
+        """Rows including tombstones; every column has this length"""
+        return self._size
+    
+    def column(self, name: str) -> np.ndarray:
+        """View of a scalar column over all rows (check 'alive' for tombstones)"""
+        return self._columns[name][:self._size]
+    
+    def row_of(self, internship_id: Any) -> Optional[int]:
+        return self._row_of.get(int(internship_id))
+    
+    def append(self, internships: Iterable[Any]):
+        """
+        Add normalized internships (dicts or InternshipFeatures)
+        
+        An internship whose id is already in the catalog replaces its old row.
+        """
+        titles = []
+        descriptions = []
+        for internship in internships:
+            internship_id = int(internship.get('internship_id') or 0)
+            if internship_id in self._row_of:
+                self._tombstone_row(self._row_of.pop(internship_id))
+            
+            self._ensure_capacity(self._size + 1)
+            row = self._size
+            self._row_of[internship_id] = row
+            self._write_row(row, internship)
+            self._size += 1
+            
+            titles.append(internship.get('title', '') or '')
+            descriptions.append(internship.get('description', '') or '')
+        
+        if titles:
+            self._append_text(titles, descriptions)
+        self._maybe_compact()
+    
+    def update(self, internship: Any):
+        """Replace the row of an internship (or add it)"""
+        self.append([internship])
+    
+    def tombstone(self, internship_id: Any) -> bool:
+        """Mark an internship as removed; returns False when it isn't in the catalog"""
+        row = self._row_of.pop(int(internship_id), None)
+        if row is None:
+            return False
+        self._tombstone_row(row)
+        self._maybe_compact()
+        return True
+    
+    def compact(self):
+        """Drop tombstoned rows and refit the TF-IDF vocabulary on the live rows"""
+        keep = self.column('alive').copy()
+        n_live = int(keep.sum())
+        capacity = max(n_live, 1)
+        
+        for name, values in self._columns.items():
+            compacted = np.zeros(capacity, dtype=values.dtype)
+            compacted[:n_live] = values[:self._size][keep]
+            self._columns[name] = compacted
+        self._capacity = capacity
+        
+        self._skills.keep(keep, len(self.skill_vocab))
+        self._top_skills.keep(keep, len(self.skill_vocab))
+        self._titles = [text for text, alive in zip(self._titles, keep) if alive]
+        self._descriptions = [text for text, alive in zip(self._descriptions, keep) if alive]
+        
+        self._size = n_live
+        self._dead = 0
+        self._row_of = {int(internship_id): row for row, internship_id in enumerate(self.column('ids'))}
+        self._refit_text()
+        logger.info(f"Compacted internship catalog to {n_live} rows")
+    
+    def _tombstone_row(self, row: int):
+        self._columns['alive'][row] = False
+        self._dead += 1
+    
+    def _maybe_compact(self):
+        if self._size and self._dead / self._size > self.compact_ratio:
+            self.compact()
+    
+    def _ensure_capacity(self, rows: int):
+        if rows <= self._capacity:
+            return
+        capacity = max(rows, 2 * self._capacity)
+        for name, values in self._columns.items():
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+        self._capacity = capacity
+    
+    def _write_row(self, row: int, internship: Any):
+        columns = self._columns
+        columns['ids'][row] = int(internship.get('internship_id') or 0)
+        columns['company_ids'][row] = int(internship.get('company_id') or 0)
+        columns['sector_codes'][row] = self._intern(self.sector_vocab, (internship.get('industry', '') or '').lower())
+        location = f"{internship.get('city', '')} {internship.get('state', '')}".lower()
+        columns['location_codes'][row] = self._intern(self.location_vocab, location)
+        columns['education_codes'][row] = EDUCATION_LEVELS.get(
+            (internship.get('education_requirement', '') or '').lower(), 3
+        )
+        
+        posted_timestamp = internship.get('posted_timestamp')
+        if posted_timestamp is None:
+            posted_timestamp = parse_timestamp(internship.get('posted_date'))
+        columns['posted_timestamps'][row] = np.nan if posted_timestamp is None else posted_timestamp
+        columns['click_through_rates'][row] = internship.get('click_through_rate', 0.05)
+        columns['apply_rates'][row] = internship.get('apply_rate', 0.02)
+        columns['total_applications'][row] = internship.get('total_applications', 1)
+        columns['total_selections'][row] = internship.get('total_selections', 0)
+        
+        flags = 0
+        for field, bit in FLAG_BITS.items():
+            if internship.get(field, False):
+                flags |= 1 << bit
+        columns['flags'][row] = flags
+        columns['has_title'][row] = bool((internship.get('title', '') or '').strip())
+        columns['has_description'][row] = bool(internship.get('description', ''))
+        columns['alive'][row] = True
+        
+        skills = [self._intern(self.skill_vocab, skill) for skill in self.required_skills_fn(internship)]
+        self._skills.append_row(sorted(set(skills)))
+        self._top_skills.append_row(sorted(set(skills[:self.top_k_skills])))
+    
+    @staticmethod
+    def _intern(vocab: Dict[str, int], value: str) -> int:
+        code = vocab.get(value)
+        if code is None:
+            code = len(vocab)
+            vocab[value] = code
+        return code
+    
+    def _append_text(self, titles: List[str], descriptions: List[str]):
+        self._titles.extend(titles)
+        self._descriptions.extend(descriptions)
+        
+        # Refit whenever the catalog has doubled since the last fit
+        if not self._vectorizer_fitted or len(self) > 2 * self._fitted_rows:
+            self._refit_text()
+            return
+        
+        self._title_blocks.append(self.vectorizer.transform(titles))
+        self._description_blocks.append(self.vectorizer.transform(descriptions))
+    
+    def _refit_text(self):
+        self._title_blocks = []
+        self._description_blocks = []
+        self._fitted_rows = len(self)
+        if not self._titles:
+            return
+        try:
+            self.vectorizer.fit(self._titles + self._descriptions)
+            self._analyzer = self.vectorizer.build_analyzer()
+            self._vectorizer_fitted = True
+        except ValueError:
+            # Only stop words (or nothing) so far
+            self._vectorizer_fitted = False
+            return
+        self._title_blocks = [self.vectorizer.transform(self._titles)]
+        self._description_blocks = [self.vectorizer.transform(self._descriptions)]
+    
+    def _text_matrix(self, blocks: List[sparse.csr_matrix]) -> Optional[sparse.csr_matrix]:
+        if not blocks:
+            return None
+        if len(blocks) > 1:
+            blocks[:] = [sparse.vstack(blocks, format='csr')]
+        return blocks[0]
+    
+    def skill_matrix(self) -> sparse.csr_matrix:
+        """rows x skill_vocab binary matrix of required skills"""
+        return self._skills.matrix(len(self.skill_vocab))
+    
+    def top_skill_matrix(self) -> sparse.csr_matrix:
+        """rows x skill_vocab binary matrix of the first top_k_skills required skills"""
+        return self._top_skills.matrix(len(self.skill_vocab))
+    
+    def skill_counts(self) -> np.ndarray:
+        """Number of distinct required skills per row"""
+        return self._skills.row_lengths()
+    
+    def title_matrix(self) -> Optional[sparse.csr_matrix]:
+        """L2-normalized TF-IDF rows of the titles, None until a vocabulary is fitted"""
+        return self._text_matrix(self._title_blocks)
+    
+    def description_matrix(self) -> Optional[sparse.csr_matrix]:
+        """L2-normalized TF-IDF rows of the descriptions, None until a vocabulary is fitted"""
+        return self._text_matrix(self._description_blocks)
+    
+    def skill_vector(self, skills: Iterable[str]) -> np.ndarray:
+        """Dense 0/1 vector over the skill vocabulary (unknown skills are ignored)"""
+        vector = np.zeros(len(self.skill_vocab), dtype=np.float32)
+        codes = [self.skill_vocab[skill] for skill in skills if skill in self.skill_vocab]
+        vector[codes] = 1.0
+        return vector
+    
+    def text_vector(self, text: str) -> Optional[np.ndarray]:
+        """
+        Dense L2-normalized TF-IDF vector of a query text in the catalog's vocabulary
+        
+        Same result as vectorizer.transform([text]) without its per-call input
+        validation, which dominates for a single short query.
+        """
+        if not self._vectorizer_fitted:
+            return None
+        vector = np.zeros(len(self.vectorizer.vocabulary_), dtype=np.float64)
+        for token in self._analyzer(text):
+            column = self.vectorizer.vocabulary_.get(token)
+            if column is not None:
+                vector[column] += 1.0
+        vector *= self.vectorizer.idf_
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def flag(self, field: str) -> np.ndarray:
+        """Boolean column of one of the FLAG_BITS fields"""
+        return (self.column('flags') >> FLAG_BITS[field]) & 1 == 1
+    
+    def sector_mask(self, sectors: Iterable[str]) -> np.ndarray:
+        """Rows whose lowercased industry is one of sectors (compared as given)"""
+        matches = np.zeros(len(self.sector_vocab), dtype=np.bool_)
+        matches[[self.sector_vocab[sector] for sector in sectors if sector in self.sector_vocab]] = True
+        return matches[self.column('sector_codes')]
+    
+    def location_mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Rows whose lowercased "city state" satisfies predicate, evaluated once per distinct location"""
+        matches = np.zeros(len(self.location_vocab), dtype=np.bool_)
+        for location, code in self.location_vocab.items():
+            matches[code] = predicate(location)
+        return matches[self.column('location_codes')]
+    
+    def filter_mask(self, industries: Optional[Iterable[str]] = None,
+                    company_ids: Optional[Iterable[int]] = None,
+                    remote: Optional[bool] = None,
+                    posted_after: Optional[float] = None,
+                    max_education_level: Optional[int] = None,
+                    exclude_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Live rows matching every given criterion
+        
+        Args:
+            industries: Allowed industries (case-insensitive)
+            company_ids: Allowed company ids
+            remote: Require remote_allowed to equal this
+            posted_after: Minimum posting timestamp (rows without a date are dropped)
+            max_education_level: Highest EDUCATION_LEVELS value required
+            exclude_ids: Internship ids to leave out (e.g. already applied)
+        """
+        mask = self.column('alive').copy()
+        if industries is not None:
+            mask &= self.sector_mask(industry.lower() for industry in industries)
+        if company_ids is not None:
+            mask &= np.isin(self.column('company_ids'), list(company_ids))
+        if remote is not None:
+            mask &= self.flag('remote_allowed') == remote
+        if posted_after is not None:
+            mask &= self.column('posted_timestamps') >= posted_after
+        if max_education_level is not None:
+            mask &= self.column('education_codes') <= max_education_level
+        if exclude_ids is not None:
+            mask &= ~np.isin(self.column('ids'), list(exclude_ids))
+        return mask
\ No newline at end of file
@@ -11,6 +11,12 @@ from geopy.distance import geodesic
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import logging
+import time
+
+from data_extraction.feature_store import description_vector
+from data_extraction.features import InternshipFeatures
+from recommendation.catalog import Catalog, EDUCATION_LEVELS
+from utils.skill_canonicalizer import get_skill_canonicalizer
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,7 @@ class RecommendationEngine:
     def __init__(self):
         self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
         self.parameter_weights = self._initialize_weights()
+        self.skill_canonicalizer = get_skill_canonicalizer()
         
     def _initialize_weights(self) -> Dict[str, float]:
         """Initialize parameter weights for scoring"""
@@ -61,12 +68,28 @@ class RecommendationEngine:
         Returns:
             List of internship IDs ordered by recommendation score
         """
+        return [
+            recommendation['internship_id']
+            for recommendation in self.generate_scored_recommendations(user_data, internships, top_k)
+        ]
+    
+    def generate_scored_recommendations(self, user_data: Dict, internships: List[Dict],
+                                        top_k: int = 6) -> List[Dict[str, Any]]:
+        """
+        generate_recommendations with the score behind each recommendation
+        
+        Returns:
+            Top-k dicts of internship_id, score (after diversity rotation) and
+            breakdown (the 20 parameter scores), ordered by score
+        """
         try:
             scores = []
+            breakdowns = {}
             
             for internship in internships:
-                score = self._calculate_overall_score(user_data, internship)
-                scores.append((internship['internship_id'], score))
+                parameter_scores = self._calculate_parameter_scores(user_data, internship)
+                breakdowns[internship['internship_id']] = parameter_scores
+                scores.append((internship['internship_id'], self._weighted_score(parameter_scores)))
             
             # Sort by score (descending) and return top-k IDs
             scores.sort(key=lambda x: x[1], reverse=True)
@@ -74,14 +97,219 @@ class RecommendationEngine:
             # Apply diversity rotation to avoid same company/sector dominance
             diversified_scores = self._apply_diversity_rotation(scores, internships)
             
-            return [internship_id for internship_id, _ in diversified_scores[:top_k]]
+            return [
+                {'internship_id': internship_id, 'score': score, 'breakdown': breakdowns[internship_id]}
+                for internship_id, score in diversified_scores[:top_k]
+            ]
             
         except Exception as e:
             logger.error(f"Recommendation generation failed: {e}")
             return []
     
+    def build_catalog(self, internships: List[Dict]) -> Catalog:
+        """Columnar catalog of normalized internships for generate_catalog_recommendations"""
+        catalog = Catalog(required_skills_fn=self._ordered_required_skills)
+        catalog.append(internships)
+        return catalog
+    
+    def generate_catalog_recommendations(self, user_data: Dict, catalog: Catalog, top_k: int = 6,
+                                         mask: Optional[np.ndarray] = None) -> List[int]:
+        """
+        Vectorized generate_recommendations over a Catalog
+        
+        Args:
+            user_data: Normalized user profile
+            catalog: Internship catalog
+            top_k: Number of recommendations to return
+            mask: Optional boolean row filter, e.g. from catalog.filter_mask()
+        
+        Returns:
+            List of internship IDs ordered by recommendation score
+        """
+        try:
+            scores = self._calculate_catalog_scores(user_data, catalog)
+            total_score = sum(
+                scores[param] * self.parameter_weights[param]
+                for param in scores
+            )
+            
+            valid = catalog.column('alive') if mask is None else mask & catalog.column('alive')
+            rows = np.flatnonzero(valid)
+            if not len(rows) or top_k <= 0:
+                return []
+            
+            # Diversity penalties cut a score by at most 15%, so rows scoring below
+            # 85% of the k-th best can't reach the top-k and are skipped
+            candidate_scores = total_score[rows]
+            if len(rows) > top_k:
+                kth_best = np.partition(candidate_scores, -top_k)[-top_k]
+                if kth_best > 0:
+                    keep = candidate_scores >= 0.85 * kth_best
+                    rows, candidate_scores = rows[keep], candidate_scores[keep]
+            
+            order = np.argsort(-candidate_scores, kind='stable')
+            rows, candidate_scores = rows[order], candidate_scores[order]
+            adjusted = self._catalog_diversity_rotation(catalog, rows, candidate_scores)
+            
+            ranked = rows[np.argsort(-adjusted, kind='stable')[:top_k]]
+            return [int(internship_id) for internship_id in catalog.column('ids')[ranked]]
+        
+        except Exception as e:
+            logger.error(f"Catalog recommendation generation failed: {e}")
+            return []
+    
+    def _calculate_catalog_scores(self, user: Dict, catalog: Catalog) -> Dict[str, np.ndarray]:
+        """The 20 parameters of _calculate_overall_score over every catalog row (scalars where constant)"""
+        n = catalog.size
+        scores = {}
+        
+        # 1-3. Skills: |S∩R| from one sparse product
+        user_skills = self._extract_user_skills(user)
+        user_vector = catalog.skill_vector(user_skills)
+        intersection = catalog.skill_matrix() @ user_vector
+        required_counts = catalog.skill_counts()
+        union = required_counts + len(user_skills) - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores['skill_coverage'] = np.where(required_counts > 0, intersection / required_counts, 1.0)
+            scores['skill_jaccard'] = np.where(union > 0, intersection / union, 0.0)
+        scores['top_k_skills'] = (catalog.top_skill_matrix() @ user_vector > 0).astype(np.float64)
+        
+        # 4. Sector Similarity
+        user_industry = (user.get('preferred_industry', '') or '').lower()
+        sector_codes = catalog.column('sector_codes')
+        if user_industry:
+            scores['sector_similarity'] = np.where(
+                sector_codes == 0, 0.5, catalog.sector_mask([user_industry]).astype(np.float64)
+            )
+        else:
+            scores['sector_similarity'] = 0.5
+        
+        # 5. Education Gap
+        user_level = EDUCATION_LEVELS.get((user.get('education_level', '') or '').lower(), 3)
+        gap = user_level - catalog.column('education_codes').astype(np.float64)
+        scores['education_gap'] = np.where(gap >= 0, np.maximum(0.0, 1.0 - gap * 0.1), np.maximum(0.0, 1.0 + gap * 0.2))
+        
+        # 6. Geo Distance (normalized internships carry no coordinates)
+        scores['geo_distance'] = 0.5
+        
+        # 7. Remote Suitability
+        remote = catalog.flag('remote_allowed')
+        if user.get('remote_work_preference', False):
+            scores['remote_suitability'] = np.where(remote, 1.0, 0.3)
+        else:
+            scores['remote_suitability'] = np.where(remote, 0.8, 0.7)
+        
+        # 8-10. Freshness and time-decayed engagement
+        posted = catalog.column('posted_timestamps')
+        dated = ~np.isnan(posted)
+        days_old = np.floor((time.time() - np.where(dated, posted, 0.0)) / 86400.0)
+        scores['freshness'] = np.where(dated, np.exp(-days_old / 10.0), 0.5)
+        smoothed_ctr = (catalog.column('click_through_rates') + 0.01) / 1.01
+        scores['decayed_ctr'] = np.where(dated, np.minimum(1.0, smoothed_ctr * np.exp(-days_old / 30.0) * 10), 0.1)
+        smoothed_rate = (catalog.column('apply_rates') + 0.005) / 1.005
+        scores['decayed_apply_rate'] = np.where(dated, np.minimum(1.0, smoothed_rate * np.exp(-days_old / 30.0) * 20), 0.1)
+        
+        # 11. Selection/Completion Ratio
+        ratio = (catalog.column('total_selections') + 1) / (catalog.column('total_applications') + 10)
+        scores['selection_ratio'] = np.minimum(1.0, ratio * 5)
+        
+        # 12-13. Text similarity against the catalog-wide TF-IDF vocabulary
+        user_profile = f"{user.get('degree', '')} {user.get('technical_skills', '')} {user.get('preferred_role', '')}"
+        title_query = user_profile.lower() if user_profile.strip() else ''
+        scores['title_similarity'] = self._catalog_text_similarity(
+            catalog, catalog.title_matrix(), title_query, catalog.column('has_title')
+        )
+        user_skill_text = " ".join(user_skills)
+        scores['description_alignment'] = self._catalog_text_similarity(
+            catalog, catalog.description_matrix(), user_skill_text.lower(), catalog.column('has_description')
+        )
+        
+        # 14. Sector Affinity (User)
+        user_interests = (user.get('preferred_industry', '') or '').lower().split(',')
+        scores['sector_affinity'] = np.where(catalog.sector_mask(user_interests), 1.0, 0.3)
+        
+        # 15. Location Affinity (User)
+        preferred_locations = [loc.strip() for loc in (user.get('preferred_locations', '') or '').lower().split(',')]
+        scores['location_affinity'] = np.where(
+            catalog.location_mask(lambda location: any(loc in location for loc in preferred_locations)), 1.0, 0.3
+        )
+        
+        # 16-17. Novelty and fatigue need interaction history
+        scores['novelty_desire'] = 0.7
+        scores['fatigue_score'] = 0.8
+        
+        # 18. Barrier Score
+        barriers = catalog.flag('requires_fee') * 0.3
+        if user.get('flexible_hours_needed', False):
+            barriers = barriers + catalog.flag('strict_hours') * 0.2
+        if not user.get('willing_to_relocate', True):
+            barriers = barriers + catalog.flag('requires_relocation') * 0.4
+        scores['barrier_score'] = np.maximum(0.0, 1.0 - barriers)
+        
+        # 19. Inclusivity Flag
+        boost = np.zeros(n)
+        if user.get('requires_accessibility', False):
+            boost = boost + catalog.flag('pwd_friendly') * 0.5
+        if (user.get('gender', '') or '').lower() == 'female':
+            boost = boost + catalog.flag('women_encouraged') * 0.3
+        if user.get('is_local', False):
+            boost = boost + catalog.flag('local_quota') * 0.2
+        scores['inclusivity_flag'] = np.minimum(1.0, 0.5 + boost)
+        
+        # 20. Diversity Rotation Count
+        scores['diversity_rotation'] = 1.0
+        
+        return scores
+    
+    def _catalog_text_similarity(self, catalog: Catalog, matrix, query: str, has_text: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each row to query; 0.5 where either side is empty"""
+        if not query:
+            return np.full(catalog.size, 0.5)
+        query_vector = catalog.text_vector(query)
+        if matrix is None or query_vector is None:
+            similarity = np.zeros(catalog.size)
+        else:
+            # TF-IDF rows are L2-normalized, so the dot product is the cosine
+            similarity = matrix @ query_vector
+        return np.where(has_text, similarity, 0.5)
+    
+    def _catalog_diversity_rotation(self, catalog: Catalog, rows: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        """Parameter 20 over rows sorted by score: penalize repeat companies and sectors"""
+        penalty = np.zeros(len(rows))
+        for column, amount in (('company_ids', 0.1), ('sector_codes', 0.05)):
+            values = catalog.column(column)[rows]
+            first_seen = np.zeros(len(rows), dtype=np.bool_)
+            first_seen[np.unique(values, return_index=True)[1]] = True
+            penalty += np.where(first_seen, 0.0, amount)
+        return scores * (1.0 - penalty)
+    
+    def _ordered_required_skills(self, internship: Dict) -> List[str]:
+        """_extract_required_skills with listed skills first, in order (the top-k skills)"""
+        canonical = self.skill_canonicalizer.canonical
+        skills = []
+        required_skills = internship.get('required_skills', '')
+        if required_skills:
+            skills.extend(canonical(s) for s in required_skills.split(','))
+        
+        description = internship.get('description', '')
+        if description:
+            skills.extend(sorted(self.skill_canonicalizer.canonical_set(self._extract_skills_from_text(description))))
+        
+        return [skill for skill in dict.fromkeys(skills) if skill]
+    
     def _calculate_overall_score(self, user: Dict, internship: Dict) -> float:
         """Calculate weighted score using all 20 parameters"""
+        return self._weighted_score(self._calculate_parameter_scores(user, internship))
+    
+    def _weighted_score(self, scores: Dict[str, float]) -> float:
+        """Weighted sum of parameter scores"""
+        return sum(
+            scores[param] * self.parameter_weights[param] 
+            for param in scores
+        )
+    
+    def _calculate_parameter_scores(self, user: Dict, internship: Dict) -> Dict[str, float]:
+        """Each of the 20 parameter scores of an internship for a user"""
         
         scores = {}
         
@@ -145,19 +373,12 @@ class RecommendationEngine:
         # 20. Diversity Rotation Count
         scores['diversity_rotation'] = 1.0  # Applied later in diversification
         
-        # Calculate weighted sum
-        total_score = sum(
-            scores[param] * self.parameter_weights[param] 
-            for param in scores
-        )
-        
-        return total_score
+        return scores
     
     def _skill_coverage_score(self, user: Dict, internship: Dict) -> float:
         """Parameter 1: |S∩R| / |R|"""
         try:
-            user_skills = self._extract_user_skills(user)
-            required_skills = self._extract_required_skills(internship)
+            user_skills, required_skills = self._skill_sets(user, internship)
             
             if not required_skills:
                 return 1.0  # No requirements = perfect match
@@ -170,8 +391,7 @@ class RecommendationEngine:
     def _jaccard_similarity_score(self, user: Dict, internship: Dict) -> float:
         """Parameter 2: |S∩R| / |S∪R|"""
         try:
-            user_skills = self._extract_user_skills(user)
-            required_skills = self._extract_required_skills(internship)
+            user_skills, required_skills = self._skill_sets(user, internship)
             
             intersection = len(user_skills.intersection(required_skills))
             union = len(user_skills.union(required_skills))
@@ -183,11 +403,14 @@ class RecommendationEngine:
     def _top_k_skill_hit(self, user: Dict, internship: Dict, k: int = 3) -> float:
         """Parameter 3: Binary match for top-k important skills"""
         try:
-            user_skills = self._extract_user_skills(user)
+            user_skills, required_skills = self._skill_sets(user, internship)
             
             # Get top-k most important skills from internship
-            required_skills = self._extract_required_skills(internship)
-            top_skills = list(required_skills)[:k]  # Assume first k are most important
+            skill_keys = internship.skill_keys if isinstance(internship, InternshipFeatures) else internship.get('skill_keys')
+            if skill_keys is not None:
+                top_skills = skill_keys[:k]  # Stored in order, listed skills first
+            else:
+                top_skills = list(required_skills)[:k]  # Assume first k are most important
             
             # Check if any top skills match
             return 1.0 if any(skill in user_skills for skill in top_skills) else 0.0
@@ -211,10 +434,7 @@ class RecommendationEngine:
     def _education_gap_score(self, user: Dict, internship: Dict) -> float:
         """Parameter 5: Education level alignment"""
         try:
-            education_levels = {
-                'high school': 1, 'diploma': 2, 'undergraduate': 3, 
-                'bachelor': 3, 'graduate': 4, 'master': 4, 'phd': 5
-            }
+            education_levels = EDUCATION_LEVELS
             
             user_edu = user.get('education_level', '').lower()
             required_edu = internship.get('education_requirement', '').lower()
@@ -273,8 +493,7 @@ class RecommendationEngine:
     def _freshness_score(self, internship: Dict) -> float:
         """Parameter 8: Posting recency score"""
         try:
-            posted_date = datetime.fromisoformat(internship.get('posted_date', datetime.now().isoformat()))
-            days_old = (datetime.now() - posted_date).days
+            days_old = self._days_since_posted(internship)
             
             # Exponential decay (half-life of 7 days)
             return math.exp(-days_old / 10.0)
@@ -282,13 +501,23 @@ class RecommendationEngine:
         except:
             return 0.5
     
+    def _days_since_posted(self, internship: Dict) -> int:
+        """Whole days since posting, using the pre-parsed timestamp of InternshipFeatures when present"""
+        if isinstance(internship, InternshipFeatures):
+            posted_timestamp = internship.posted_timestamp
+        else:
+            posted_timestamp = internship.get('posted_timestamp')
+        if posted_timestamp is not None:
+            posted_date = datetime.fromtimestamp(posted_timestamp)
+        else:
+            posted_date = datetime.fromisoformat(internship.get('posted_date', datetime.now().isoformat()))
+        return (datetime.now() - posted_date).days
+    
     def _decayed_ctr_score(self, internship: Dict) -> float:
         """Parameter 9: Time-decayed click-through rate"""
         try:
             raw_ctr = internship.get('click_through_rate', 0.05)
-            days_since_posted = (datetime.now() - datetime.fromisoformat(
-                internship.get('posted_date', datetime.now().isoformat())
-            )).days
+            days_since_posted = self._days_since_posted(internship)
             
             # Smooth and decay CTR
             smoothed_ctr = (raw_ctr + 0.01) / 1.01  # Laplace smoothing
@@ -303,9 +532,7 @@ class RecommendationEngine:
         """Parameter 10: Time-decayed apply rate"""
         try:
             raw_apply_rate = internship.get('apply_rate', 0.02)
-            days_since_posted = (datetime.now() - datetime.fromisoformat(
-                internship.get('posted_date', datetime.now().isoformat())
-            )).days
+            days_since_posted = self._days_since_posted(internship)
             
             smoothed_rate = (raw_apply_rate + 0.005) / 1.005
             decayed_rate = smoothed_rate * math.exp(-days_since_posted / 30.0)
@@ -351,16 +578,19 @@ class RecommendationEngine:
         """Parameter 13: Skills vs job description alignment"""
         try:
             user_skills = " ".join(self._extract_user_skills(user))
-            job_description = internship.get('description', '')
             
-            if not user_skills or not job_description:
-                return 0.5
-                
-            documents = [user_skills.lower(), job_description.lower()]
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # Hashed description vector persisted at write time, computed here when the backend stored none,
+            # so every internship is scored with the same metric
+            if isinstance(internship, InternshipFeatures):
+                job_vector = internship.description_vector
+            else:
+                job_vector = internship.get('description_vector')
+            if job_vector is None:
+                job_vector = description_vector(internship.get('description', ''))
             
-            return similarity
+            if not user_skills or not job_vector.nnz:
+                return 0.5
+            return float((description_vector(user_skills) @ job_vector.T)[0, 0])
             
         except:
             return 0.5
@@ -482,14 +712,14 @@ class RecommendationEngine:
             return scores  # Return original if diversity rotation fails
     
     def _extract_user_skills(self, user: Dict) -> set:
-        """Extract and normalize user skills"""
+        """Extract user skills as canonical skill names"""
         try:
             skills = set()
             
             # Technical skills from form
             tech_skills = user.get('technical_skills', '')
             if tech_skills:
-                skills.update([s.strip().lower() for s in tech_skills.split(',')])
+                skills.update(self.skill_canonicalizer.split(tech_skills))
             
             # Skills from vision-extracted data
             vision_data = user.get('vision_extracted_data', {})
@@ -500,14 +730,14 @@ class RecommendationEngine:
                     vision_data = {}
                     
             extracted_skills = vision_data.get('combined_skills', [])
-            skills.update([s.lower() for s in extracted_skills])
+            skills.update(self.skill_canonicalizer.canonical_set(extracted_skills))
             
             # Skills from projects/experience
             projects = user.get('projects', '')
             if projects:
                 # Simple keyword extraction from projects description
                 project_skills = self._extract_skills_from_text(projects)
-                skills.update(project_skills)
+                skills.update(self.skill_canonicalizer.canonical_set(project_skills))
                 
             return skills
             
@@ -515,20 +745,29 @@ class RecommendationEngine:
             logger.error(f"Skill extraction failed: {e}")
             return set()
     
+    def _skill_sets(self, user: Dict, internship: Dict) -> Tuple[set, set]:
+        """User and required skills to compare as canonical names, the internship's stored ones when present"""
+        user_skills = self._extract_user_skills(user)
+        # Slots are read directly on records, FeatureRecord.get costs a field lookup per call; .get() is for dicts
+        skill_keys = internship.skill_keys if isinstance(internship, InternshipFeatures) else internship.get('skill_keys')
+        if skill_keys is None:
+            return user_skills, self._extract_required_skills(internship)
+        return user_skills, set(skill_keys)
+    
     def _extract_required_skills(self, internship: Dict) -> set:
-        """Extract required skills from internship"""
+        """Extract required skills from internship as canonical skill names"""
         try:
             skills = set()
             
             required_skills = internship.get('required_skills', '')
             if required_skills:
-                skills.update([s.strip().lower() for s in required_skills.split(',')])
+                skills.update(self.skill_canonicalizer.split(required_skills))
                 
             # Extract from job description
             description = internship.get('description', '')
             if description:
                 desc_skills = self._extract_skills_from_text(description)
-                skills.update(desc_skills)
+                skills.update(self.skill_canonicalizer.canonical_set(desc_skills))
                 
             return skills
             
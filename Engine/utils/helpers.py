@@ -5,6 +5,8 @@ Utility functions for the recommendation engine
 import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
@@ -63,6 +65,52 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Cache storage failed: {e}")
 
+class LRUCache:
+    """
+    Thread-safe, size-bounded in-memory cache with least-recently-used eviction
+    """
+    
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value and mark it as recently used"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+    
+    def set(self, key: Any, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove and return an entry"""
+        with self._lock:
+            return self._data.pop(key, default)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit counts for health output"""
+        return {'size': len(self._data), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses}
+
 class ConfigManager:
     """
     Manages configuration for the recommendation engine
@@ -75,11 +123,34 @@ class ConfigManager:
             'ollama': {
                 'url': 'http://localhost:11434',
                 'model': 'llama3.2-vision:latest',
-                'timeout': 60
+                'timeout': 120,
+                'max_retries': 2,
+                'retry_backoff_base': 1.0,
+                'retry_backoff_max': 10.0,
+                'batch_deadline_seconds': 300,
+                # How long Ollama keeps the model loaded after a request
+                'keep_alive': os.getenv('VISION_KEEP_ALIVE', '30m'),
+                'warmup_timeout': 180,
+                'keep_warm_interval_minutes': 0,
+                'business_hours': [9, 18],
+                'business_days': [0, 1, 2, 3, 4],
+                'stream': False,
+                'max_tokens': 1024,
+                'max_generation_seconds': 90,
+                'max_images_per_request': 1,
+                'page_render_workers': 4,
+                'pdf_zoom': 1.5,
+                'page_budget': {
+                    'certificate': 1,
+                    'resume': 2,
+                    'transcript': 3
+                }
             },
             'recommendation': {
                 'top_k': 6,
                 'cache_duration_hours': 24,
+                'internship_cache_size': 10000,
+                'persist_normalized_user': True,
                 'min_score_threshold': 0.1
             },
             'scoring_weights': {
@@ -150,8 +221,16 @@ class MetricsCollector:
             'cache_misses': 0,
             'vision_extractions': 0,
             'extraction_failures': 0,
-            'avg_recommendation_time': 0.0
+            'avg_recommendation_time': 0.0,
+            'vision_generations': 0,
+            'vision_generation_aborts': 0,
+            'avg_time_to_first_token': 0.0,
+            'avg_tokens_per_second': 0.0,
+            'vision_retries': 0,
+            'vision_timeouts': 0,
+            'vision_deadline_exceeded': 0
         }
+        self._sample_counts = {}
     
     def record_recommendation_generated(self, processing_time: float):
         """Record a recommendation generation event"""
@@ -177,6 +256,36 @@ class MetricsCollector:
         else:
             self.metrics['extraction_failures'] += 1
     
+    def record_generation_stats(self, stats: Dict[str, Any]):
+        """Record time-to-first-token and throughput for a vision generation"""
+        self.metrics['vision_generations'] += 1
+        
+        if stats.get('aborted') and stats['aborted'] != 'object_complete':
+            self.metrics['vision_generation_aborts'] += 1
+        
+        # Running averages over the generations that reported each value
+        for metric, key in (('avg_time_to_first_token', 'time_to_first_token'),
+                            ('avg_tokens_per_second', 'tokens_per_second')):
+            value = stats.get(key)
+            if value is None:
+                continue
+            self._sample_counts[metric] = self._sample_counts.get(metric, 0) + 1
+            count = self._sample_counts[metric]
+            current_avg = self.metrics[metric]
+            self.metrics[metric] = (current_avg * (count - 1) + value) / count
+    
+    def record_vision_retry(self):
+        """Record a retried vision request"""
+        self.metrics['vision_retries'] += 1
+    
+    def record_vision_timeout(self):
+        """Record a vision request that timed out"""
+        self.metrics['vision_timeouts'] += 1
+    
+    def record_vision_deadline_exceeded(self):
+        """Record a vision request skipped because the batch deadline passed"""
+        self.metrics['vision_deadline_exceeded'] += 1
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
         total_cache_requests = self.metrics['cache_hits'] + self.metrics['cache_misses']
@@ -0,0 +1,151 @@
+"""
+Skill synonym canonicalization
+
+Maps free-text skills ("JS", "ReactJS", "node") to a canonical skill so set
+intersections between user and internship skills compare like with like.
+The alias table lives in data/skill_aliases.json; a skill's id is its index in
+that file, so new skills must be appended to keep ids stable.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALIASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'skill_aliases.json')
+
+# Set on ids of skills missing from the alias table, which never collide with table indices
+UNKNOWN_SKILL_BIT = 0x80000000
+
+_EDGE_PUNCTUATION = ' ,;:()[]{}"\'*•'
+_COMPACT_PATTERN = re.compile(r'[\s.\-_/]+')
+
+
+class CanonicalSkill(NamedTuple):
+    skill_id: int
+    key: str           # lowercase canonical name, what skill sets are compared on
+    display_name: str  # name shown to users
+
+
+def normalize_skill_token(raw: str) -> str:
+    """Lowercase, collapse whitespace and trim list punctuation ("  React.JS, " -> "react.js")"""
+    token = ' '.join(str(raw).lower().split()).strip(_EDGE_PUNCTUATION)
+    return token.rstrip('.')
+
+
+class SkillCanonicalizer:
+    """
+    Alias table compiled into a hash map, with an LRU memo on raw tokens
+    
+    Aliases are indexed both as written and with separators removed, so
+    "Node JS", "node-js" and "NodeJS" all resolve to Node.js.
+    """
+    
+    def __init__(self, aliases_path: Optional[str] = None, memo_size: int = 4096):
+        self.aliases_path = aliases_path or DEFAULT_ALIASES_PATH
+        self.skills: List[CanonicalSkill] = []
+        self._index: Dict[str, int] = {}
+        self._compact_index: Dict[str, int] = {}
+        self._load_aliases()
+        self._resolve = lru_cache(maxsize=memo_size)(self._resolve_uncached)
+    
+    def _load_aliases(self):
+        """Compile data/skill_aliases.json into the lookup maps"""
+        try:
+            with open(self.aliases_path, encoding='utf-8') as f:
+                table = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skill alias table unavailable ({e}), skills will only be normalized")
+            return
+        
+        for skill_id, entry in enumerate(table.get('skills', [])):
+            name = entry['name']
+            self.skills.append(CanonicalSkill(skill_id, normalize_skill_token(name), name))
+            for alias in [name] + entry.get('aliases', []):
+                token = normalize_skill_token(alias)
+                for index, key in ((self._index, token), (self._compact_index, _COMPACT_PATTERN.sub('', token))):
+                    existing = index.setdefault(key, skill_id)
+                    if existing != skill_id:
+                        logger.debug(f"Skill alias '{alias}' already maps to {self.skills[existing].display_name}")
+        
+        logger.info(f"Loaded {len(self.skills)} canonical skills from {self.aliases_path}")
+    
+    def _resolve_uncached(self, raw: str) -> CanonicalSkill:
+        token = normalize_skill_token(raw)
+        skill_id = self._index.get(token)
+        if skill_id is None:
+            skill_id = self._compact_index.get(_COMPACT_PATTERN.sub('', token))
+        if skill_id is not None:
+            return self.skills[skill_id]
+        
+        # Unknown skills keep their own spelling and get a stable hashed id
+        return CanonicalSkill(
+            zlib.crc32(token.encode('utf-8')) | UNKNOWN_SKILL_BIT,
+            token,
+            ' '.join(str(raw).split()).strip(_EDGE_PUNCTUATION)
+        )
+    
+    def resolve(self, raw: str) -> CanonicalSkill:
+        """Canonical skill of a raw token"""
+        return self._resolve(raw)
+    
+    def canonical(self, raw: str) -> str:
+        """Lowercase canonical name of a raw token ('' for blank tokens)"""
+        return self._resolve(raw).key
+    
+    def skill_id(self, raw: str) -> int:
+        """Stable integer id: table index for known skills, crc32 | UNKNOWN_SKILL_BIT otherwise"""
+        return self._resolve(raw).skill_id
+    
+    def canonical_set(self, skills: Iterable[str]) -> Set[str]:
+        """Canonical names of raw skills, blanks dropped"""
+        canonical = {self._resolve(skill).key for skill in skills if skill}
+        canonical.discard('')
+        return canonical
+    
+    def split(self, text: str) -> Set[str]:
+        """Canonical names of a comma-separated skill string"""
+        if not text:
+            return set()
+        return self.canonical_set(text.split(','))
+    
+    def merge(self, skills: Iterable[str]) -> List[str]:
+        """Display names of raw skills with synonyms merged, in first-seen order"""
+        merged = {}
+        for skill in skills:
+            if not skill:
+                continue
+            resolved = self._resolve(skill)
+            if resolved.key:
+                merged.setdefault(resolved.skill_id, resolved.display_name)
+        return list(merged.values())
+    
+    def name_of(self, skill_id: int) -> Optional[str]:
+        """Display name of a known skill id (unknown ids can't be reversed)"""
+        if 0 <= skill_id < len(self.skills):
+            return self.skills[skill_id].display_name
+        return None
+    
+    def memo_stats(self) -> Dict[str, int]:
+        info = self._resolve.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
+
+
+_default_canonicalizer = None
+_default_lock = threading.Lock()
+
+
+def get_skill_canonicalizer() -> SkillCanonicalizer:
+    """Process-wide canonicalizer over the bundled alias table"""
+    global _default_canonicalizer
+    if _default_canonicalizer is None:
+        with _default_lock:
+            if _default_canonicalizer is None:
+                _default_canonicalizer = SkillCanonicalizer()
+    return _default_canonicalizer
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Database migration script to add updated_at to the companies table
+
+Company profile edits then change the catalog version behind the internship
+ETags in every worker, not only in the one that handled the edit.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+
+app = create_app()
+
+def migrate_add_company_updated_at():
+    """Add updated_at to companies, starting from each company's created_at"""
+    
+    with app.app_context():
+        try:
+            alter_statements = [
+                "ALTER TABLE companies ADD COLUMN updated_at DATETIME NULL"
+            ]
+            
+            print("Adding updated_at to companies...")
+            
+            for statement in alter_statements:
+                try:
+                    with db.engine.connect() as connection:
+                        connection.execute(db.text(statement))
+                        connection.commit()
+                    print(f"✓ Executed: {statement}")
+                except Exception as e:
+                    if "already exists" in str(e).lower() or "duplicate column name" in str(e).lower():
+                        print(f"⚠ Column already exists, skipping: {statement}")
+                    else:
+                        print(f"✗ Error executing {statement}: {e}")
+                        return False
+            
+            # Backfill existing rows before making the column NOT NULL like internships.updated_at
+            with db.engine.connect() as connection:
+                result = connection.execute(db.text(
+                    "UPDATE companies SET updated_at = created_at WHERE updated_at IS NULL"
+                ))
+                connection.commit()
+            print(f"✓ Backfilled updated_at of {result.rowcount} companies")
+            
+            if db.engine.dialect.name == 'mysql':
+                statement = "ALTER TABLE companies MODIFY COLUMN updated_at DATETIME NOT NULL"
+                with db.engine.connect() as connection:
+                    connection.execute(db.text(statement))
+                    connection.commit()
+                print(f"✓ Executed: {statement}")
+            
+            print("✓ Successfully added companies.updated_at!")
+            return True
+        
+        except Exception as e:
+            print(f"✗ Migration failed: {e}")
+            return False
+
+if __name__ == "__main__":
+    migrate_add_company_updated_at()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Add the internship_features table and compute features for existing internships
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models import Internship, InternshipFeature
+from app.hooks import _import_feature_store, store_internship_features
+
+app = create_app()
+
+def add_internship_features_table(batch_size=500):
+    """Create internship_features and backfill rows that are missing or from an older feature version"""
+    
+    with app.app_context():
+        try:
+            print("Creating internship_features table...")
+            InternshipFeature.__table__.create(db.engine, checkfirst=True)
+            print("✓ internship_features table ready")
+            
+            feature_store = _import_feature_store()
+            if not feature_store:
+                print("✗ Engine unavailable, cannot compute features")
+                return False
+            
+            print("Computing features for existing internships...")
+            processed = 0
+            last_id = 0
+            while True:
+                internships = (
+                    Internship.query.options(db.joinedload(Internship.features))
+                    .filter(Internship.internship_id > last_id)
+                    .order_by(Internship.internship_id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not internships:
+                    break
+                
+                for internship in internships:
+                    stored = internship.features.to_engine_dict() if internship.features else None
+                    if not feature_store.is_current(stored):
+                        store_internship_features(internship)
+                        processed += 1
+                
+                db.session.commit()
+                last_id = internships[-1].internship_id
+                print(f"✓ Up to internship {last_id}: {processed} computed")
+            
+            print(f"✓ Successfully computed features for {processed} internships!")
+            return True
+        
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+if __name__ == "__main__":
+    add_internship_features_table()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Database migration script to add composite indexes for the internship hot-path queries
+
+The indexes are the ones declared in Internship.__table_args__. After creating
+them, each route's query shape is run through EXPLAIN to check it uses its index.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.schema import CreateIndex
+
+from app import create_app, db
+from app.models import Company, Internship
+from app.catalog_loader import catalog_query
+from app.pagination import LISTING_ORDER
+
+app = create_app()
+
+
+def hot_queries():
+    """(description, query, index it should use) for each route's query shape"""
+    recent = datetime.utcnow() - timedelta(days=1)
+    return [
+        ("Active catalog (load_catalog)", catalog_query(), 'ix_internships_active_created'),
+        ("Company internships (/api/company/internships)",
+         db.select(Internship).where(Internship.company_id == 1), 'ix_internships_company_active'),
+        ("Company internship counts (Company.internship_counts)",
+         Company._counts_query().statement, 'ix_internships_company_active'),
+        ("Listing page (/api/internships)",
+         db.select(Internship).order_by(*LISTING_ORDER).limit(10), 'ix_internships_created'),
+        ("Listing by location type",
+         db.select(Internship).where(Internship.location_type == 'Remote').order_by(*LISTING_ORDER).limit(10),
+         'ix_internships_location_created'),
+        ("Listing by education level",
+         db.select(Internship).where(Internship.education_level == 'Undergraduate').order_by(*LISTING_ORDER).limit(10),
+         'ix_internships_education_created'),
+        ("Rows changed since the last staleness check (search index, facets)",
+         db.select(Internship.internship_id).where(Internship.updated_at >= recent), 'ix_internships_updated'),
+    ]
+
+
+def migrate_add_internship_indexes():
+    """Create the indexes declared on the internships table"""
+    
+    with app.app_context():
+        try:
+            print("Adding indexes for internship queries...")
+            
+            for index in sorted(Internship.__table__.indexes, key=lambda index: index.name):
+                statement = str(CreateIndex(index).compile(dialect=db.engine.dialect))
+                try:
+                    with db.engine.connect() as connection:
+                        connection.execute(db.text(statement))
+                        connection.commit()
+                    print(f"✓ Executed: {statement}")
+                except Exception as e:
+                    if "already exists" in str(e).lower() or "duplicate key name" in str(e).lower():
+                        print(f"⚠ Index already exists, skipping: {index.name}")
+                    else:
+                        print(f"✗ Error executing {statement}: {e}")
+                        return False
+            
+            print("✓ Successfully added internship indexes!")
+            return True
+        
+        except Exception as e:
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+def explain_index_usage(query):
+    """Names of the internships indexes the database plans to use for a query"""
+    dialect = db.engine.dialect
+    sql = str(query.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    
+    with db.engine.connect() as connection:
+        if dialect.name == 'sqlite':
+            plan = connection.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+            details = ' '.join(row[-1] for row in plan)
+            return {index.name for index in Internship.__table__.indexes if index.name in details}
+        
+        plan = connection.execute(db.text(f"EXPLAIN {sql}")).mappings().all()
+        return {row['key'] for row in plan if row['table'] == 'internships' and row['key']}
+
+
+def check_index_usage():
+    """EXPLAIN every hot query and report whether it uses its index"""
+    
+    with app.app_context():
+        print("Checking query plans...")
+        all_used = True
+        
+        for description, query, expected in hot_queries():
+            try:
+                used = explain_index_usage(query)
+            except Exception as e:
+                print(f"✗ Could not explain {description}: {e}")
+                all_used = False
+                continue
+            
+            if expected in used:
+                print(f"✓ {description}: {expected}")
+            else:
+                # On small tables the optimizer may prefer a scan, rerun once the table has data
+                print(f"⚠ {description}: expected {expected}, plan uses {', '.join(sorted(used)) or 'no index'}")
+                all_used = False
+        
+        if all_used:
+            print("✓ Every hot query uses its index!")
+        return all_used
+
+if __name__ == "__main__":
+    if migrate_add_internship_indexes():
+        check_index_usage()
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Add normalized_profile column for the persisted normalized user profile
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models import User
+
+app = create_app()
+
+def add_normalized_profile_column():
+    """Add normalized_profile column to users table"""
+    
+    with app.app_context():
+        try:
+            # SQL to add new column
+            alter_statements = [
+                "ALTER TABLE users ADD COLUMN normalized_profile TEXT NULL"
+            ]
+            
+            print("Adding normalized profile column...")
+            
+            for statement in alter_statements:
+                try:
+                    with db.engine.connect() as connection:
+                        connection.execute(db.text(statement))
+                        connection.commit()
+                    print(f"✓ Executed: {statement}")
+                except Exception as e:
+                    if "already exists" in str(e).lower() or "duplicate column name" in str(e).lower():
+                        print(f"⚠ Column already exists, skipping: {statement}")
+                    else:
+                        print(f"✗ Error executing {statement}: {e}")
+                        return False
+            
+            print("✓ Successfully added normalized profile column!")
+            return True
+            
+        except Exception as e:
+            print(f"✗ Migration failed: {e}")
+            return False
+
+if __name__ == "__main__":
+    add_normalized_profile_column()
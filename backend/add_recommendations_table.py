@@ -0,0 +1,73 @@
+"""
+Add the recommendations table and copy existing rankings out of users.recommendation_list
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models import Internship, Recommendation, User
+
+app = create_app()
+
+def add_recommendations_table(batch_size=500):
+    """Create recommendations and backfill the users that have a JSON ranking but no rows"""
+    
+    with app.app_context():
+        try:
+            print("Creating recommendations table...")
+            Recommendation.__table__.create(db.engine, checkfirst=True)
+            print("✓ recommendations table ready")
+            
+            print("Copying stored rankings...")
+            existing = set(db.session.execute(db.select(Internship.internship_id)).scalars())
+            migrated = 0
+            last_id = ''
+            while True:
+                users = db.session.execute(
+                    db.select(User.user_id, User.recommendation_list, User.recommendations_updated_at)
+                    .where(User.user_id > last_id, User.recommendation_list.isnot(None))
+                    .order_by(User.user_id)
+                    .limit(batch_size)
+                ).all()
+                if not users:
+                    break
+                
+                stored = set(db.session.execute(
+                    db.select(Recommendation.user_id).distinct()
+                    .where(Recommendation.user_id.in_([user.user_id for user in users]))
+                ).scalars())
+                
+                for user_id, recommendation_list, updated_at in users:
+                    if user_id in stored:
+                        continue
+                    try:
+                        internship_ids = json.loads(recommendation_list)
+                    except ValueError:
+                        print(f"⚠ Skipping user {user_id}: unreadable recommendation_list")
+                        continue
+                    
+                    # Scores of old rankings are unknown; internships deleted since are dropped
+                    Recommendation.replace_for_user(
+                        user_id,
+                        [{'internship_id': internship_id} for internship_id in internship_ids if internship_id in existing],
+                        updated_at
+                    )
+                    migrated += 1
+                
+                db.session.commit()
+                last_id = users[-1].user_id
+                print(f"✓ Up to user {last_id}: {migrated} migrated")
+            
+            print(f"✓ Successfully migrated rankings of {migrated} users!")
+            return True
+        
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+if __name__ == "__main__":
+    add_recommendations_table()
\ No newline at end of file
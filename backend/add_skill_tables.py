@@ -0,0 +1,106 @@
+"""
+Add the skills, internship_skills and user_skills tables and fill them for existing rows
+
+Run with --recanonicalize after data/skill_aliases.json changed: every
+internship and user is canonicalized again, so a token that now resolves to
+another skill moves to it, and skills nobody references any more are deleted.
+"""
+
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models import Internship, InternshipSkill, Skill, User, UserSkill
+from app.hooks import _import_feature_store, store_internship_features, store_user_skills
+
+app = create_app()
+
+def add_skill_tables(batch_size=500, recanonicalize=False):
+    """
+    Create the skill tables and canonicalize the skills of internships and users that have no rows yet
+    
+    Args:
+        batch_size: Rows per commit
+        recanonicalize: Rewrite the skill rows of every internship and user, not only those without any
+    """
+    
+    with app.app_context():
+        try:
+            print("Creating skill tables...")
+            for model in (Skill, InternshipSkill, UserSkill):
+                model.__table__.create(db.engine, checkfirst=True)
+            print("✓ skills, internship_skills and user_skills tables ready")
+            
+            if not _import_feature_store():
+                print("✗ Engine unavailable, cannot canonicalize skills")
+                return False
+            
+            print("Canonicalizing internship skills...")
+            processed = 0
+            last_id = 0
+            while True:
+                internships = (
+                    Internship.query
+                    .filter(Internship.internship_id > last_id)
+                    .order_by(Internship.internship_id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not internships:
+                    break
+                
+                for internship in internships:
+                    if recanonicalize or not internship.skills:
+                        store_internship_features(internship)
+                        processed += 1
+                
+                db.session.commit()
+                last_id = internships[-1].internship_id
+                print(f"✓ Up to internship {last_id}: {processed} canonicalized")
+            
+            print("Canonicalizing user skills...")
+            users_processed = 0
+            last_user_id = ''
+            while True:
+                users = (
+                    User.query
+                    .filter(User.user_id > last_user_id)
+                    .order_by(User.user_id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not users:
+                    break
+                
+                for user in users:
+                    if recanonicalize or not user.skills:
+                        store_user_skills(user)
+                        users_processed += 1
+                
+                db.session.commit()
+                last_user_id = users[-1].user_id
+                print(f"✓ Up to user {last_user_id}: {users_processed} canonicalized")
+            
+            if recanonicalize:
+                referenced = db.union(db.select(InternshipSkill.skill_id), db.select(UserSkill.skill_id))
+                result = db.session.execute(db.delete(Skill).where(Skill.skill_id.not_in(referenced)))
+                db.session.commit()
+                print(f"✓ Deleted {result.rowcount} skills no longer referenced")
+            
+            print(f"✓ Successfully canonicalized skills of {processed} internships and {users_processed} users!")
+            return True
+        
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create and fill the canonical skill tables")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per commit")
+    parser.add_argument("--recanonicalize", action="store_true",
+                        help="Canonicalize every internship and user again, after the skill alias table changed")
+    args = parser.parse_args()
+    add_skill_tables(batch_size=args.batch_size, recanonicalize=args.recanonicalize)
\ No newline at end of file
@@ -4,6 +4,8 @@ from flask_bcrypt import Bcrypt
 from flask_login import LoginManager
 from flask_cors import CORS
 import os
+import sys
+import threading
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -88,4 +90,35 @@ def create_app():
     with app.app_context():
         db.create_all()
     
-    return app
\ No newline at end of file
+    # Optionally load the vision model now so the first upload does not pay the model-load time
+    if os.getenv('VISION_WARMUP_ON_STARTUP', 'false').lower() in ['true', '1', 'yes']:
+        start_vision_warmup()
+    
+    return app
+
+def start_vision_warmup():
+    """Warm up the vision model in the background and start the keep-warm schedule
+
+    VISION_KEEP_WARM_MINUTES sets the ping interval during business hours (0 disables it)
+    and VISION_KEEP_ALIVE how long Ollama keeps the model loaded after each request; the
+    default config reads the latter, so it applies to every orchestrator, not only this one.
+    """
+    def warm_up():
+        try:
+            engine_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Engine')
+            if engine_path not in sys.path:
+                sys.path.append(engine_path)
+            
+            from main import RecommendationOrchestrator
+            from utils.helpers import ConfigManager
+        except ImportError as e:
+            print(f"Warning: Vision warm-up skipped, engine unavailable: {e}")
+            return
+        
+        config = ConfigManager.get_default_config()
+        config['ollama']['keep_warm_interval_minutes'] = float(os.getenv('VISION_KEEP_WARM_MINUTES', '0'))
+        
+        orchestrator = RecommendationOrchestrator(config)
+        orchestrator.warm_up_vision_model()
+    
+    threading.Thread(target=warm_up, name='vision-warmup', daemon=True).start()
\ No newline at end of file
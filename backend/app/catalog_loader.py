@@ -0,0 +1,129 @@
+"""
+Catalog loader for the recommendation route
+
+Selects only the columns the Engine reads, with the company name and the
+stored features joined into the same query, and streams the rows with
+yield_per. One round trip loads the whole active catalog, where
+Internship.query...all() + to_dict() issued one company query per internship.
+
+Given a user, the catalog can be narrowed in SQL to the internships sharing
+at least one canonical skill with them (joined through internship_skills and
+user_skills), plus those listing no skills at all, which the Engine scores
+as fully covered.
+"""
+
+import os
+
+from app import db
+from app.models import Company, Internship, InternshipFeature, InternshipSkill, UserSkill
+from app.hooks import engine_internship_data
+
+# Internship columns the Engine normalizes (see Engine/data_extraction/row_adapter.py)
+ENGINE_COLUMNS = (
+    Internship.internship_id,
+    Internship.company_id,
+    Internship.internship_title,
+    Internship.job_description,
+    Internship.industry_domain,
+    Internship.education_level,
+    Internship.location_type,
+    Internship.duration,
+    Internship.stipend,
+    Internship.required_skills,
+    Internship.created_at,
+    Internship.updated_at,
+    Company.company_name
+)
+
+# Stored feature columns, labelled so they can't shadow Engine fields of the same name
+FEATURE_COLUMNS = {
+    column: getattr(InternshipFeature, column).label(f'feature_{column}')
+    for column in InternshipFeature.ENGINE_COLUMNS
+}
+
+# Below this many skill-sharing candidates the whole catalog is loaded instead
+MIN_CANDIDATES = int(os.getenv('RECOMMENDATION_MIN_CANDIDATES', '50'))
+
+# Most candidates handed to the Engine, best overlap first (0 = no limit)
+MAX_CANDIDATES = int(os.getenv('RECOMMENDATION_MAX_CANDIDATES', '0'))
+
+
+def catalog_query():
+    """Projection of every active internship with its company name and stored features"""
+    return (
+        db.select(*ENGINE_COLUMNS, *FEATURE_COLUMNS.values())
+        .join(Company, Company.company_id == Internship.company_id)
+        .outerjoin(InternshipFeature, InternshipFeature.internship_id == Internship.internship_id)
+        .where(Internship.is_active == db.true())  # Equality, so MySQL can seek ix_internships_active_created
+    )
+
+
+def skill_overlap(user_id):
+    """Subquery of internship_id -> number of canonical skills it shares with the user"""
+    return (
+        db.select(InternshipSkill.internship_id, db.func.count().label('overlap'))
+        .join(UserSkill, UserSkill.skill_id == InternshipSkill.skill_id)
+        .where(UserSkill.user_id == user_id)
+        .group_by(InternshipSkill.internship_id)
+        .subquery()
+    )
+
+
+def candidate_query(user_id, max_candidates=0):
+    """
+    catalog_query() narrowed to the internships sharing a skill with the user, or listing none
+    
+    Args:
+        user_id: The user recommendations are generated for
+        max_candidates: Keep only this many, by descending overlap (0 = all)
+    """
+    overlap = skill_overlap(user_id)
+    lists_no_skills = ~db.exists().where(InternshipSkill.internship_id == Internship.internship_id)
+    query = (
+        catalog_query()
+        .outerjoin(overlap, overlap.c.internship_id == Internship.internship_id)
+        .where(db.or_(overlap.c.overlap.isnot(None), lists_no_skills))
+    )
+    if max_candidates:
+        query = query.order_by(db.func.coalesce(overlap.c.overlap, 0).desc(), Internship.internship_id).limit(max_candidates)
+    return query
+
+
+def stored_features(row):
+    """The row's stored feature columns as InternshipFeatureStore.load expects them, None when absent"""
+    if row.feature_feature_version is None:
+        return None
+    return {column: getattr(row, label.name) for column, label in FEATURE_COLUMNS.items()}
+
+
+def iter_catalog(batch_size=1000, query=None):
+    """
+    Stream the active catalog as Engine-ready rows
+    
+    Args:
+        batch_size: Rows fetched from the database at a time
+        query: A narrower catalog_query(), e.g. candidate_query()
+    
+    Yields:
+        Read-only views of each row under the Engine's field names
+    """
+    query = catalog_query() if query is None else query
+    result = db.session.execute(query.execution_options(yield_per=batch_size))
+    for row in result:
+        yield engine_internship_data(row, stored_features=stored_features(row))
+
+
+def load_catalog(batch_size=1000, user_id=None, min_candidates=MIN_CANDIDATES, max_candidates=MAX_CANDIDATES):
+    """
+    iter_catalog() as a list, what generate_user_recommendations takes
+    
+    With a user_id whose skills are stored, only the candidates of candidate_query()
+    are loaded, unless fewer than min_candidates share a skill with the user.
+    """
+    if user_id is not None:
+        has_skills = db.session.execute(db.select(UserSkill.skill_id).where(UserSkill.user_id == user_id).limit(1)).first()
+        if has_skills:
+            candidates = list(iter_catalog(batch_size, candidate_query(user_id, max_candidates)))
+            if len(candidates) >= (min(min_candidates, max_candidates) if max_candidates else min_candidates):
+                return candidates
+    return list(iter_catalog(batch_size))
\ No newline at end of file
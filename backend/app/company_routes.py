@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, render_template, session, redirec
 from flask_login import login_user, logout_user, login_required, current_user
 from app import db, bcrypt
 from app.models import Company, Internship
+from app.hooks import company_changed, internship_changed, store_internship_features
 import re
 
 company_bp = Blueprint('company', __name__, url_prefix='/api/company')
@@ -155,6 +156,7 @@ def update_profile():
             company.company_description = data['company_description'].strip()
         
         db.session.commit()
+        company_changed(company.company_id)
         
         return jsonify({
             'success': True,
@@ -236,8 +238,10 @@ def create_internship():
             past_intern_records=data.get('past_intern_records', '').strip()
         )
         
+        store_internship_features(new_internship)
         db.session.add(new_internship)
         db.session.commit()
+        internship_changed(new_internship.internship_id)
         
         return jsonify({
             'success': True,
@@ -321,7 +325,9 @@ def update_internship(internship_id):
         if 'fulltime_conversion' in data:
             internship.fulltime_conversion = bool(data['fulltime_conversion'])
         
+        store_internship_features(internship)
         db.session.commit()
+        internship_changed(internship_id)
         
         return jsonify({
             'success': True,
@@ -350,6 +356,7 @@ def delete_internship(internship_id):
         
         db.session.delete(internship)
         db.session.commit()
+        internship_changed(internship_id)
         
         return jsonify({
             'success': True,
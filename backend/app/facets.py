@@ -0,0 +1,179 @@
+"""
+Filter facets with live counts for /api/internships/filters
+
+Every facet value keeps a bitmap (a Python int with bit internship_id set)
+of the internships carrying it. A count under the applied filters is then
+the popcount of an AND of a few bitmaps instead of a GROUP BY over the
+table. Counts are disjunctive: a facet's own selection is ignored when
+counting its values, so selecting "Remote" still shows how many On-site and
+Hybrid internships the other filters leave.
+
+The bitmaps are built on the first request. Writes in this process mark ids
+dirty through app.hooks.internship_changed; writes from other workers are
+picked up by a periodic row count / latest updated_at check.
+"""
+
+import os
+import threading
+import time
+
+from app import db
+from app.models import Company, Internship
+
+# Facet name -> Internship column
+FACETS = {
+    'industry': Internship.industry_domain,
+    'education_level': Internship.education_level,
+    'location_type': Internship.location_type,
+    'company_id': Internship.company_id
+}
+
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count  # Python 3.10+
+else:
+    def _popcount(bits):
+        return bin(bits).count('1')
+
+
+class FacetIndex:
+    """
+    Per-value internship bitmaps of every facet
+    
+    Args:
+        staleness_seconds: How often to check the table for writes from other processes
+    """
+    
+    def __init__(self, staleness_seconds=30):
+        self.staleness_seconds = staleness_seconds
+        self._lock = threading.RLock()
+        self.reset()
+    
+    def reset(self):
+        """Drop the bitmaps; they are rebuilt on the next request"""
+        with self._lock:
+            self._bitmaps = {facet: {} for facet in FACETS}  # facet -> {value: bitmap}
+            self._values = {}                                # internship_id -> facet values
+            self._all = 0
+            self._company_names = None
+            self._dirty = set()
+            self._built = False
+            self._table_stamp = None
+            self._checked_at = 0.0
+    
+    def mark_dirty(self, internship_id):
+        """Re-read an internship from the database before the next request"""
+        with self._lock:
+            self._dirty.add(internship_id)
+    
+    def forget_company_names(self):
+        with self._lock:
+            self._company_names = None
+    
+    def _remove(self, internship_id):
+        values = self._values.pop(internship_id, None)
+        if values is None:
+            return
+        bit = 1 << internship_id
+        for facet, value in zip(FACETS, values):
+            bitmaps = self._bitmaps[facet]
+            bitmaps[value] &= ~bit
+            if not bitmaps[value]:
+                del bitmaps[value]
+        self._all &= ~bit
+    
+    def _add_rows(self, rows):
+        for internship_id, *values in rows:
+            self._remove(internship_id)
+            bit = 1 << internship_id
+            for facet, value in zip(FACETS, values):
+                bitmaps = self._bitmaps[facet]
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+            self._values[internship_id] = tuple(values)
+            self._all |= bit
+    
+    def _read_stamp(self):
+        """Row count and latest updated_at of the internships table"""
+        count, latest = db.session.execute(
+            db.select(db.func.count(Internship.internship_id), db.func.max(Internship.updated_at))
+        ).one()
+        return count, latest
+    
+    def _refresh(self):
+        """Bring the bitmaps up to date before a request"""
+        columns = (Internship.internship_id, *FACETS.values())
+        if not self._built:
+            self._table_stamp = self._read_stamp()
+            self._checked_at = time.monotonic()
+            self._add_rows(db.session.execute(db.select(*columns).execution_options(yield_per=1000)))
+            self._built = True
+        
+        if self._dirty:
+            dirty, self._dirty = list(self._dirty), set()
+            for internship_id in dirty:
+                self._remove(internship_id)
+            self._add_rows(db.session.execute(db.select(*columns).where(Internship.internship_id.in_(dirty))))
+        
+        if time.monotonic() - self._checked_at >= self.staleness_seconds:
+            self._checked_at = time.monotonic()
+            stamp = self._read_stamp()
+            if stamp != self._table_stamp:
+                # Other processes wrote: re-read what changed since the last stamp
+                query = db.select(*columns)
+                if self._table_stamp[1] is not None:
+                    query = query.where(Internship.updated_at >= self._table_stamp[1])
+                self._add_rows(db.session.execute(query))
+                self._table_stamp = stamp
+                self._company_names = None
+                
+                # Deletions don't show up in updated_at, rebuild when rows went missing
+                if stamp[0] != len(self._values):
+                    self.reset()
+                    self._refresh()
+                    return
+        
+        if self._company_names is None or not self._bitmaps['company_id'].keys() <= self._company_names.keys():
+            company_ids = list(self._bitmaps['company_id'])
+            self._company_names = dict(db.session.execute(
+                db.select(Company.company_id, Company.company_name).where(Company.company_id.in_(company_ids))
+            ).all()) if company_ids else {}
+    
+    def counts(self, selected=None):
+        """
+        Per-value internship counts of every facet under the applied filters
+        
+        Args:
+            selected: {facet: [values]}; values of one facet are OR-ed, facets are AND-ed
+        
+        Returns:
+            {'total': matches of all filters, 'facets': {facet: {value: count}}, 'company_names': {company_id: name}}
+        """
+        selected = {facet: values for facet, values in (selected or {}).items() if facet in FACETS and values}
+        with self._lock:
+            self._refresh()
+            
+            # Union of the selected values of each facet
+            unions = {}
+            for facet, values in selected.items():
+                union = 0
+                for value in values:
+                    union |= self._bitmaps[facet].get(value, 0)
+                unions[facet] = union
+            
+            total = self._all
+            for union in unions.values():
+                total &= union
+            
+            facets = {}
+            for facet, bitmaps in self._bitmaps.items():
+                # Filter by every other facet's selection, not this facet's own
+                others = self._all
+                for other, union in unions.items():
+                    if other != facet:
+                        others &= union
+                facets[facet] = {value: _popcount(bitmap & others) for value, bitmap in bitmaps.items()}
+            
+            return {'total': _popcount(total), 'facets': facets, 'company_names': dict(self._company_names)}
+
+
+facet_index = FacetIndex(staleness_seconds=float(os.getenv('FACET_STALENESS_SECONDS', '30')))
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Hooks run after internships or user profiles are written so that
+in-process caches built from that data stay consistent
+"""
+
+import os
+import sys
+
+_feature_store = None
+_row_adapter = None
+_skill_engine = None
+
+
+def _import_data_extractor():
+    """Import the Engine's DataExtractor, or None when the engine is unavailable"""
+    try:
+        engine_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Engine')
+        if engine_path not in sys.path:
+            sys.path.append(engine_path)
+        
+        from data_extraction.extractor import DataExtractor
+        return DataExtractor
+    except ImportError as e:
+        print(f"Engine import failed: {e}")
+        return None
+
+
+def _import_feature_store():
+    """The Engine's InternshipFeatureStore (created once), or None when the engine is unavailable"""
+    global _feature_store
+    if _feature_store is None and _import_data_extractor():
+        try:
+            from data_extraction.feature_store import InternshipFeatureStore
+            _feature_store = InternshipFeatureStore()
+        except ImportError as e:
+            print(f"Engine import failed: {e}")
+    return _feature_store
+
+
+def _import_skill_engine():
+    """A RecommendationEngine (created once) for its user skill extraction, or None when the engine is unavailable"""
+    global _skill_engine
+    if _skill_engine is None and _import_data_extractor():
+        try:
+            from recommendation.engine import RecommendationEngine
+            _skill_engine = RecommendationEngine()
+        except ImportError as e:
+            print(f"Engine import failed: {e}")
+    return _skill_engine
+
+
+def engine_internship_data(internship, **extra):
+    """Read-only view of an internship under the field names the Engine normalizes"""
+    global _row_adapter
+    if _row_adapter is None:
+        _import_data_extractor()
+        from data_extraction.row_adapter import RowAdapter
+        _row_adapter = RowAdapter
+    return _row_adapter(internship, extra=extra or None)
+
+
+def store_internship_features(internship):
+    """Compute the internship's Engine features and canonical skills and attach them, before the commit"""
+    from app.models import InternshipFeature, InternshipSkill, Skill
+    
+    feature_store = _import_feature_store()
+    if not feature_store:
+        return
+    
+    # Features only speed up reads, a failure here must not fail the write
+    try:
+        columns, skills = feature_store.compute_with_skills([engine_internship_data(internship)])[0]
+    except Exception as e:
+        print(f"Feature computation failed for internship {internship.internship_id}: {e}")
+        return
+    
+    if internship.features is None:
+        internship.features = InternshipFeature(**columns)
+    else:
+        for column, value in columns.items():
+            setattr(internship.features, column, value)
+    
+    skill_ids = Skill.ensure(skills)
+    internship.skills = [
+        InternshipSkill(skill_id=skill_id, position=position)
+        for position, skill_id in enumerate(dict.fromkeys(skill_ids[skill.key] for skill in skills))
+    ]
+
+
+def internship_changed(internship_id):
+    """Invalidate everything cached for an internship after a write has been committed"""
+    from app.facets import facet_index
+    from app.http_cache import catalog_version
+    from app.hydration import card_cache
+    from app.pagination import listing_counts
+    from app.search_index import search_index
+    card_cache.pop(internship_id)
+    catalog_version.invalidate()
+    listing_counts.clear()
+    search_index.mark_dirty(internship_id)
+    facet_index.mark_dirty(internship_id)
+    
+    DataExtractor = _import_data_extractor()
+    if DataExtractor:
+        DataExtractor.invalidate_internship(internship_id)
+
+
+def company_changed(company_id):
+    """Drop cached copies of a company's details (internship cards, facet names, ETags) after the company was updated"""
+    from app.facets import facet_index
+    from app.http_cache import catalog_version
+    from app.hydration import card_cache
+    card_cache.pop_company(company_id)
+    catalog_version.invalidate()
+    facet_index.forget_company_names()
+
+
+def user_profile_changed(user):
+    """Drop the user's normalized profile, in process and the persisted copy, and rewrite their skills, before the commit"""
+    user.normalized_profile = None
+    
+    DataExtractor = _import_data_extractor()
+    if DataExtractor:
+        DataExtractor.invalidate_user(user.user_id)
+    
+    store_user_skills(user)
+
+
+def store_user_skills(user):
+    """Replace the user's canonical skill rows with the skills the Engine extracts from the profile"""
+    from app.models import Skill, UserSkill
+    
+    engine = _import_skill_engine()
+    if not engine:
+        return
+    
+    canonicalizer = engine.skill_canonicalizer
+    profile = {field: value for field, value in user.to_dict().items() if value is not None}
+    skills = {}
+    for key in engine._extract_user_skills(profile):
+        skill = canonicalizer.resolve(key)
+        skills[skill.key] = skill
+    
+    skill_ids = Skill.ensure(skills.values())
+    user.skills = [UserSkill(skill_id=skill_id) for skill_id in set(skill_ids.values())]
@@ -0,0 +1,91 @@
+"""
+Conditional GET for the public internship read endpoints
+
+Responses carry a strong ETag derived from a catalog version: the row counts
+and latest updated_at of the internships and companies tables, cached for a
+few seconds, plus the request path and query string. A poll whose If-None-Match still
+matches gets a 304 before the view runs, so it costs neither a catalog query
+nor JSON serialization.
+
+The write hooks in app/hooks.py drop the cached version so this process sees
+its own writes at once; other workers' writes show up within
+CATALOG_VERSION_TTL_SECONDS.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from functools import wraps
+
+from flask import make_response, request
+
+from app import db
+from app.models import Company, Internship
+
+
+class CatalogVersion:
+    """Short-lived cache of the catalog's version token"""
+    
+    def __init__(self, ttl=5):
+        self.ttl = ttl
+        self._version = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not None and self._expires > now:
+                return self._version
+        
+        internships, latest = db.session.execute(
+            db.select(db.func.count(Internship.internship_id), db.func.max(Internship.updated_at))
+        ).one()
+        companies, companies_latest = db.session.execute(
+            db.select(db.func.count(Company.company_id), db.func.max(Company.updated_at))
+        ).one()
+        
+        with self._lock:
+            self._version = ':'.join(str(part) for part in (
+                internships, latest.isoformat() if latest else '',
+                companies, companies_latest.isoformat() if companies_latest else ''
+            ))
+            self._expires = now + self.ttl
+            return self._version
+    
+    def invalidate(self):
+        """Read the version again on the next request, after a write"""
+        with self._lock:
+            self._version = None
+
+
+catalog_version = CatalogVersion(float(os.getenv('CATALOG_VERSION_TTL_SECONDS', '5')))
+
+
+def conditional_get(max_age=0):
+    """
+    Decorator adding a catalog ETag and Cache-Control to a GET view, answering matching If-None-Match with 304
+    
+    Args:
+        max_age: Seconds clients may reuse a response before revalidating
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = f'{catalog_version.get()}|{request.full_path}'
+            etag = hashlib.sha1(key.encode()).hexdigest()
+            cache_control = f'public, max-age={max_age}, must-revalidate'
+            
+            if request.if_none_match.contains(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = cache_control
+            return response
+        return wrapper
+    return decorator
\ No newline at end of file
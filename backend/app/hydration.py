@@ -0,0 +1,125 @@
+"""
+Hydrate recommended internship ids into the payloads shown on recommendation cards
+
+All ids missing from the card cache are fetched, with their companies, in a
+single IN (...) query, and payloads come back in the order the ids were
+ranked. Cached payloads are dropped by the write hooks in app/hooks.py, and
+since other workers' writes never reach those hooks, cache hits are checked
+against the updated_at of the internship and its company before they are
+served: when every id is cached, in a query of just those stamps, otherwise
+as part of the one query that fetches the misses.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from app import db
+from app.models import Company, Internship
+
+
+class CardCache:
+    """Thread-safe LRU of internship_id -> (stamp, card payload), stamp being the updated_at of the internship and its company"""
+    
+    def __init__(self, max_size=5000):
+        self.max_size = max_size
+        self._cards = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_many(self, internship_ids):
+        """Cached (stamp, payload) of the given ids, as a dict (misses are left out)"""
+        found = {}
+        with self._lock:
+            for internship_id in internship_ids:
+                entry = self._cards.get(internship_id)
+                if entry is not None:
+                    self._cards.move_to_end(internship_id)
+                    found[internship_id] = entry
+        return found
+    
+    def set_many(self, entries):
+        with self._lock:
+            for internship_id, entry in entries.items():
+                self._cards[internship_id] = entry
+                self._cards.move_to_end(internship_id)
+            while len(self._cards) > self.max_size:
+                self._cards.popitem(last=False)
+    
+    def pop(self, internship_id):
+        with self._lock:
+            self._cards.pop(internship_id, None)
+    
+    def pop_company(self, company_id):
+        """Drop every card of a company, e.g. after its name changed"""
+        with self._lock:
+            for internship_id in [key for key, (_, card) in self._cards.items() if card['company_id'] == company_id]:
+                del self._cards[internship_id]
+    
+    def clear(self):
+        with self._lock:
+            self._cards.clear()
+
+
+card_cache = CardCache(int(os.getenv('CARD_CACHE_SIZE', '5000')))
+
+
+def hydrate_internships(internship_ids, active_only=False):
+    """
+    Card payloads of internships in the order of internship_ids
+    
+    Args:
+        internship_ids: Ranked internship ids
+        active_only: Leave out internships that have been deactivated
+    
+    Returns:
+        Internship.to_dict() payloads; ids that no longer exist are skipped
+    """
+    internship_ids = [int(internship_id) for internship_id in internship_ids]
+    unique_ids = list(dict.fromkeys(internship_ids))
+    cached = card_cache.get_many(unique_ids)
+    
+    # Other workers' edits, deactivations, deletions and company renames don't reach the hooks,
+    # so a cached card is served only while its internship and company updated_at are unchanged
+    cards = {}
+    fetch = unique_ids
+    if cached and len(cached) == len(unique_ids):
+        # Everything cached: one query of the stamps alone
+        stamps = {
+            internship_id: (updated_at, company_updated_at)
+            for internship_id, updated_at, company_updated_at in db.session.execute(
+                db.select(Internship.internship_id, Internship.updated_at, Company.updated_at)
+                .outerjoin(Company, Internship.company_id == Company.company_id)
+                .where(Internship.internship_id.in_(unique_ids))
+            )
+        }
+        for internship_id, (stamp, card) in cached.items():
+            if internship_id not in stamps:
+                card_cache.pop(internship_id)
+            elif stamps[internship_id] == stamp:
+                cards[internship_id] = card
+        # Only rows changed by another worker since they were cached need a second query
+        fetch = [internship_id for internship_id in unique_ids if internship_id in stamps and internship_id not in cards]
+    
+    if fetch:
+        # Misses: one query of the full rows of every id, reusing cached cards whose stamps still match
+        internships = (
+            Internship.query.options(db.joinedload(Internship.company))
+            .filter(Internship.internship_id.in_(fetch))
+            .all()
+        )
+        entries = {}
+        for internship in internships:
+            stamp = (internship.updated_at, internship.company.updated_at if internship.company else None)
+            entry = cached.get(internship.internship_id)
+            if entry is None or entry[0] != stamp:
+                entry = entries[internship.internship_id] = (stamp, internship.to_dict())
+            cards[internship.internship_id] = entry[1]
+        card_cache.set_many(entries)
+        
+        for internship_id in set(cached) - {internship.internship_id for internship in internships}:
+            card_cache.pop(internship_id)
+    
+    return [
+        cards[internship_id] for internship_id in internship_ids
+        if internship_id in cards and (cards[internship_id]['is_active'] or not active_only)
+    ]
\ No newline at end of file
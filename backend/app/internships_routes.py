@@ -2,6 +2,12 @@ from flask import Blueprint, request, jsonify
 from flask_login import login_required
 from app import db
 from app.models import Internship
+from app.hooks import internship_changed, store_internship_features
+from app.facets import facet_index
+from app.http_cache import conditional_get
+from app.hydration import hydrate_internships
+from app.pagination import LISTING_ORDER, keyset_page, listing_counts
+from app.search_index import search_index
 from sqlalchemy.exc import IntegrityError
 import re
 
@@ -89,8 +95,10 @@ def create_internship():
             past_intern_records=data.get('past_intern_records', '').strip()
         )
         
+        store_internship_features(internship)
         db.session.add(internship)
         db.session.commit()
+        internship_changed(internship.internship_id)
         
         return jsonify({
             'success': True,
@@ -115,12 +123,15 @@ def create_internship():
 
 
 @internships_bp.route('/api/internships', methods=['GET'])
+@conditional_get(max_age=0)
 def get_all_internships():
     """Fetch all internships"""
     try:
         # Get query parameters for filtering/pagination
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
+        cursor = request.args.get('cursor')
+        include_total = request.args.get('include_total', '').lower() in ('1', 'true', 'yes')
         industry = request.args.get('industry', '')
         location_type = request.args.get('location_type', '')
         education_level = request.args.get('education_level', '')
@@ -137,8 +148,34 @@ def get_all_internships():
         if education_level:
             query = query.filter(Internship.education_level == education_level)
         
+        # Cursor pagination: pass cursor= (empty) for the first page, then next_cursor
+        if cursor is not None:
+            per_page = min(max(per_page, 1), 100)
+            try:
+                internships, next_cursor = keyset_page(query, cursor, per_page)
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'message': str(e)
+                }), 400
+            
+            pagination = {
+                'per_page': per_page,
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None
+            }
+            if include_total:
+                pagination['total'] = listing_counts.get((industry, location_type, education_level), query)
+                pagination['total_is_approximate'] = True
+            
+            return jsonify({
+                'success': True,
+                'internships': [internship.to_dict() for internship in internships],
+                'pagination': pagination
+            }), 200
+        
         # Order by creation date (newest first)
-        query = query.order_by(Internship.created_at.desc())
+        query = query.order_by(*LISTING_ORDER)
         
         # Paginate results
         internships_paginated = query.paginate(
@@ -170,6 +207,7 @@ def get_all_internships():
 
 
 @internships_bp.route('/api/internships/<int:internship_id>', methods=['GET'])
+@conditional_get(max_age=0)
 def get_internship_by_id(internship_id):
     """Fetch a specific internship by ID"""
     try:
@@ -236,7 +274,9 @@ def update_internship(internship_id):
         internship.description = data.get('description', internship.description).strip() if data.get('description') else internship.description
         internship.past_intern_records = data.get('past_intern_records', internship.past_intern_records).strip() if data.get('past_intern_records') else internship.past_intern_records
         
+        store_internship_features(internship)
         db.session.commit()
+        internship_changed(internship_id)
         
         return jsonify({
             'success': True,
@@ -278,6 +318,7 @@ def delete_internship(internship_id):
         
         db.session.delete(internship)
         db.session.commit()
+        internship_changed(internship_id)
         
         return jsonify({
             'success': True,
@@ -296,21 +337,38 @@ def delete_internship(internship_id):
 # Additional utility routes
 
 @internships_bp.route('/api/internships/filters', methods=['GET'])
+@conditional_get(max_age=60)
 def get_filter_options():
     """Get available filter options for internships"""
     try:
-        # Get unique values for filtering
-        industries = db.session.query(Internship.industry_domain).distinct().all()
-        education_levels = db.session.query(Internship.education_level).distinct().all()
+        # Filters currently applied in the UI; counts are computed under them
+        selected = {
+            'industry': request.args.getlist('industry'),
+            'education_level': request.args.getlist('education_level'),
+            'location_type': request.args.getlist('location_type'),
+            'company_id': request.args.getlist('company_id', type=int)
+        }
+        counts = facet_index.counts(selected)
+        facets = {facet: {value: count for value, count in values.items() if value} for facet, values in counts['facets'].items()}
         location_types = ['On-site', 'Remote', 'Hybrid']  # From enum
         
         return jsonify({
             'success': True,
             'filters': {
-                'industries': [industry[0] for industry in industries if industry[0]],
-                'education_levels': [level[0] for level in education_levels if level[0]],
+                'industries': sorted(facets['industry']),
+                'education_levels': sorted(facets['education_level']),
                 'location_types': location_types
-            }
+            },
+            'counts': {
+                'industries': facets['industry'],
+                'education_levels': facets['education_level'],
+                'location_types': {location_type: facets['location_type'].get(location_type, 0) for location_type in location_types},
+                'companies': [
+                    {'company_id': company_id, 'company_name': counts['company_names'].get(company_id), 'count': count}
+                    for company_id, count in sorted(facets['company_id'].items(), key=lambda item: (-item[1], item[0]))
+                ]
+            },
+            'total': counts['total']
         }), 200
         
     except Exception as e:
@@ -332,22 +390,26 @@ def search_internships():
                 'message': 'Search keyword is required'
             }), 400
         
-        # Search in title, industry, skills, and description
-        internships = Internship.query.filter(
-            db.or_(
-                Internship.internship_title.ilike(f'%{keyword}%'),
-                Internship.industry_domain.ilike(f'%{keyword}%'),
-                Internship.required_skills.ilike(f'%{keyword}%'),
-                Internship.description.ilike(f'%{keyword}%')
-            )
-        ).order_by(Internship.created_at.desc()).all()
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 10, type=int), 1), 100)
         
-        internships_list = [internship.to_dict() for internship in internships]
+        # BM25 over title, industry, skills and job description, best matches first
+        internship_ids, total = search_index.search(keyword, page, per_page)
+        internships_list = hydrate_internships(internship_ids)
+        pages = (total + per_page - 1) // per_page
         
         return jsonify({
             'success': True,
             'internships': internships_list,
             'search_term': keyword,
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'pages': pages,
+                'has_next': page < pages,
+                'has_prev': page > 1
+            },
             'count': len(internships_list)
         }), 200
         
@@ -1,6 +1,7 @@
 from app import db, bcrypt
 from flask_login import UserMixin
 from datetime import datetime
+import json
 import string
 import random
 
@@ -60,10 +61,14 @@ class User(UserMixin, db.Model):
     recommendation_list = db.Column(db.Text, nullable=True)    # JSON string of recommended internship IDs
     recommendations_updated_at = db.Column(db.DateTime, nullable=True)
     vision_processed_at = db.Column(db.DateTime, nullable=True) # When documents were last processed
+    normalized_profile = db.Column(db.Text, nullable=True)     # Compact JSON of the engine's normalized profile, shared by workers
     
     # Profile completion tracking
     profile_updated_at = db.Column(db.DateTime, nullable=True)
     
+    # Canonical skills, rewritten with the profile
+    skills = db.relationship('UserSkill', lazy=True, cascade='all, delete-orphan')
+    
     def __init__(self, username, password):
         """Initialize user with username, hashed password, and generated user_id"""
         self.user_id = self.generate_user_id()
@@ -189,6 +194,7 @@ class Company(UserMixin, db.Model):
     company_website = db.Column(db.String(200))
     company_description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     
     # Relationship to internships
@@ -214,8 +220,48 @@ class Company(UserMixin, db.Model):
         """Return the company_id for Flask-Login"""
         return str(self.company_id)
     
-    def to_dict(self):
-        """Convert company object to dictionary for JSON responses"""
+    @staticmethod
+    def _counts_query():
+        """Internship totals per company: company_id, total, active"""
+        return db.session.query(
+            Internship.company_id.label('company_id'),
+            db.func.count(Internship.internship_id).label('total'),
+            db.func.coalesce(db.func.sum(db.case((Internship.is_active.is_(True), 1), else_=0)), 0).label('active')
+        ).group_by(Internship.company_id)
+    
+    @staticmethod
+    def _counts_dict(total, active):
+        total, active = int(total or 0), int(active or 0)
+        return {'total': total, 'active': active, 'inactive': total - active}
+    
+    @classmethod
+    def internship_counts(cls, company_ids):
+        """Internship counts of several companies in one GROUP BY query: {company_id: {total, active, inactive}}"""
+        company_ids = list(company_ids)
+        counts = {company_id: cls._counts_dict(0, 0) for company_id in company_ids}
+        if company_ids:
+            rows = cls._counts_query().filter(Internship.company_id.in_(company_ids)).all()
+            for company_id, total, active in rows:
+                counts[company_id] = cls._counts_dict(total, active)
+        return counts
+    
+    @classmethod
+    def list_with_counts(cls, query=None):
+        """Companies (optionally a filtered Company query) with their counts, in one query"""
+        counts = cls._counts_query().subquery()
+        query = (query or cls.query).outerjoin(counts, counts.c.company_id == cls.company_id)
+        rows = query.add_columns(counts.c.total, counts.c.active).all()
+        return [company.to_dict(counts=cls._counts_dict(total, active)) for company, total, active in rows]
+    
+    def to_dict(self, counts=None):
+        """
+        Convert company object to dictionary for JSON responses
+        
+        counts ({total, active, inactive}, from internship_counts) is queried with one
+        aggregate when not given, instead of loading every internship of the company.
+        """
+        if counts is None:
+            counts = self.internship_counts([self.company_id])[self.company_id]
         return {
             'company_id': self.company_id,
             'company_name': self.company_name,
@@ -224,7 +270,9 @@ class Company(UserMixin, db.Model):
             'company_description': self.company_description,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'is_active': self.is_active,
-            'total_internships': len(self.internships)
+            'total_internships': counts['total'],
+            'active_internships': counts['active'],
+            'inactive_internships': counts['inactive']
         }
     
     def __repr__(self):
@@ -236,6 +284,16 @@ class Internship(db.Model):
     """Internship model for managing internship opportunities"""
     __tablename__ = 'internships'
     
+    # Matched to the hot query shapes, see add_internship_indexes.py
+    __table_args__ = (
+        db.Index('ix_internships_active_created', 'is_active', 'created_at'),      # active catalog
+        db.Index('ix_internships_company_active', 'company_id', 'is_active'),      # company listings and counts
+        db.Index('ix_internships_created', 'created_at', 'internship_id'),         # listing order and cursors
+        db.Index('ix_internships_location_created', 'location_type', 'created_at', 'internship_id'),
+        db.Index('ix_internships_education_created', 'education_level', 'created_at', 'internship_id'),
+        db.Index('ix_internships_updated', 'updated_at'),                          # cache staleness checks
+    )
+    
     internship_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     company_id = db.Column(db.Integer, db.ForeignKey('companies.company_id'), nullable=False)
     
@@ -263,6 +321,10 @@ class Internship(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # Engine features computed when the internship is written
+    features = db.relationship('InternshipFeature', backref='internship', uselist=False, lazy=True, cascade='all, delete-orphan')
+    skills = db.relationship('InternshipSkill', lazy=True, cascade='all, delete-orphan', order_by='InternshipSkill.position')
+    
     def to_dict(self):
         """Convert internship object to dictionary"""
         return {
@@ -286,4 +348,205 @@ class Internship(db.Model):
         }
     
     def __repr__(self):
-        return f'<Internship {self.internship_title} - {self.company.company_name if self.company else "No Company"}>'
\ No newline at end of file
+        return f'<Internship {self.internship_title} - {self.company.company_name if self.company else "No Company"}>'
+
+
+class InternshipFeature(db.Model):
+    """Derived features of an internship, computed by the Engine on create/update"""
+    __tablename__ = 'internship_features'
+    
+    internship_id = db.Column(db.Integer, db.ForeignKey('internships.internship_id', ondelete='CASCADE'), primary_key=True)
+    feature_version = db.Column(db.Integer, nullable=False)
+    
+    skill_keys = db.Column(db.Text, nullable=False)  # JSON list of canonical skill keys in scoring order
+    parsed_skills = db.Column(db.Text)  # JSON of category -> skills
+    competitiveness = db.Column(db.Float, default=0.0, nullable=False)
+    popularity_score = db.Column(db.Float, default=0.0, nullable=False)
+    
+    # Hashed description term vector, sparse: int32 indices and float32 values
+    description_indices = db.Column(db.LargeBinary, nullable=False)
+    description_values = db.Column(db.LargeBinary, nullable=False)
+    
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # Columns handed to the Engine's InternshipFeatureStore
+    ENGINE_COLUMNS = (
+        'feature_version', 'skill_keys', 'parsed_skills', 'competitiveness',
+        'popularity_score', 'description_indices', 'description_values'
+    )
+    
+    def to_engine_dict(self):
+        """Stored features in the shape InternshipFeatureStore.load expects"""
+        return {column: getattr(self, column) for column in self.ENGINE_COLUMNS}
+    
+    def __repr__(self):
+        return f'<InternshipFeature {self.internship_id} v{self.feature_version}>'
+
+
+class Recommendation(db.Model):
+    """One ranked internship recommendation of a user, with the score behind it"""
+    __tablename__ = 'recommendations'
+    __table_args__ = (
+        db.Index('ix_recommendations_user_rank', 'user_id', 'rank'),
+        db.Index('ix_recommendations_internship', 'internship_id'),
+    )
+    
+    user_id = db.Column(db.String(6), db.ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    internship_id = db.Column(db.Integer, db.ForeignKey('internships.internship_id', ondelete='CASCADE'), primary_key=True)
+    rank = db.Column(db.Integer, nullable=False)  # 1 = best
+    score = db.Column(db.Float)                   # None when the engine served its cached ranking
+    breakdown = db.Column(db.Text)                # JSON of parameter -> score
+    generated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Columns refreshed when a recommendation is upserted
+    UPSERT_COLUMNS = ('rank', 'score', 'breakdown', 'generated_at')
+    
+    @classmethod
+    def replace_for_user(cls, user_id, recommendations, generated_at=None):
+        """
+        Store a user's ranking with one bulk upsert, before the commit
+        
+        Args:
+            user_id: The user's id
+            recommendations: Ranked dicts of internship_id and optionally score and breakdown
+            generated_at: When the ranking was generated, now by default
+        """
+        generated_at = generated_at or datetime.utcnow()
+        rows = [
+            {
+                'user_id': user_id,
+                'internship_id': int(recommendation['internship_id']),
+                'rank': rank,
+                'score': recommendation.get('score'),
+                'breakdown': json.dumps(recommendation['breakdown']) if recommendation.get('breakdown') else None,
+                'generated_at': generated_at
+            }
+            for rank, recommendation in enumerate(recommendations, 1)
+        ]
+        
+        # Internships that dropped out of the ranking
+        stale = db.delete(cls).where(cls.user_id == user_id)
+        if rows:
+            stale = stale.where(cls.internship_id.not_in([row['internship_id'] for row in rows]))
+        db.session.execute(stale)
+        if not rows:
+            return
+        
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert
+            statement = insert(cls).values(rows)
+            statement = statement.on_duplicate_key_update({column: statement.inserted[column] for column in cls.UPSERT_COLUMNS})
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+            statement = insert(cls).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=['user_id', 'internship_id'],
+                set_={column: statement.excluded[column] for column in cls.UPSERT_COLUMNS}
+            )
+        else:
+            db.session.execute(db.delete(cls).where(cls.user_id == user_id))
+            statement = db.insert(cls).values(rows)
+        db.session.execute(statement)
+    
+    @classmethod
+    def for_user(cls, user_id):
+        """A user's recommendations joined to their internships (and companies), in rank order, in one query"""
+        return db.session.execute(
+            db.select(cls, Internship)
+            .join(Internship, Internship.internship_id == cls.internship_id)
+            .options(db.joinedload(Internship.company))
+            .where(cls.user_id == user_id)
+            .order_by(cls.rank)
+        ).all()
+    
+    @classmethod
+    def user_ids_for_internship(cls, internship_id):
+        """Ids of the users who currently have an internship recommended"""
+        return db.session.execute(db.select(cls.user_id).where(cls.internship_id == internship_id)).scalars().all()
+    
+    def to_dict(self):
+        return {
+            'internship_id': self.internship_id,
+            'rank': self.rank,
+            'score': self.score,
+            'breakdown': json.loads(self.breakdown) if self.breakdown else None,
+            'generated_at': self.generated_at.isoformat() if self.generated_at else None
+        }
+    
+    def __repr__(self):
+        return f'<Recommendation {self.user_id} -> {self.internship_id} #{self.rank}>'
+
+
+class Skill(db.Model):
+    """A canonical skill, unique by its canonical key; ids are assigned by the database and never change"""
+    __tablename__ = 'skills'
+    
+    skill_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # Lowercase canonical name; binary on MySQL so keys differing only in accents stay separate skills
+    skill_key = db.Column(
+        db.String(200).with_variant(db.String(200, collation='utf8mb4_bin'), 'mysql'), nullable=False, unique=True
+    )
+    display_name = db.Column(db.String(200), nullable=False)
+    
+    @classmethod
+    def ensure(cls, skills):
+        """
+        Insert the skills that don't exist yet, before the commit
+        
+        Args:
+            skills: Objects with key and display_name (the Engine's CanonicalSkill)
+        
+        Returns:
+            {key: skill_id} of the given skills
+        """
+        skills = list(skills)
+        rows = {
+            skill.key[:200]: {'skill_key': skill.key[:200], 'display_name': skill.display_name[:200]}
+            for skill in skills
+        }
+        if not rows:
+            return {}
+        
+        ids = dict(db.session.execute(db.select(cls.skill_key, cls.skill_id).where(cls.skill_key.in_(list(rows)))).all())
+        missing = [row for skill_key, row in rows.items() if skill_key not in ids]
+        if missing:
+            # Another worker may insert the same new skill concurrently
+            dialect = db.session.get_bind().dialect.name
+            prefix = {'mysql': 'IGNORE', 'sqlite': 'OR IGNORE'}.get(dialect)
+            statement = db.insert(cls)
+            if prefix:
+                statement = statement.prefix_with(prefix)
+            db.session.execute(statement, missing)
+            
+            ids.update(db.session.execute(
+                db.select(cls.skill_key, cls.skill_id).where(cls.skill_key.in_([row['skill_key'] for row in missing]))
+            ).all())
+        
+        return {skill.key: ids[skill.key[:200]] for skill in skills}
+    
+    def __repr__(self):
+        return f'<Skill {self.skill_id} {self.display_name}>'
+
+
+class InternshipSkill(db.Model):
+    """Canonical skill required by an internship, what skill-overlap queries join on"""
+    __tablename__ = 'internship_skills'
+    
+    internship_id = db.Column(db.Integer, db.ForeignKey('internships.internship_id', ondelete='CASCADE'), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skills.skill_id'), primary_key=True, index=True)
+    position = db.Column(db.Integer, nullable=False)  # Order the Engine scores skills in, 0 = first listed
+    
+    def __repr__(self):
+        return f'<InternshipSkill {self.internship_id} -> {self.skill_id}>'
+
+
+class UserSkill(db.Model):
+    """Canonical skill of a user"""
+    __tablename__ = 'user_skills'
+    
+    user_id = db.Column(db.String(6), db.ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skills.skill_id'), primary_key=True, index=True)
+    
+    def __repr__(self):
+        return f'<UserSkill {self.user_id} -> {self.skill_id}>'
\ No newline at end of file
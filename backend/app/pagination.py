@@ -0,0 +1,101 @@
+"""
+Keyset (cursor) pagination for internship listings
+
+Pages are ordered by (created_at, internship_id) descending and each page
+starts right after the last row of the previous one, so a deep page costs the
+same as the first: no OFFSET scan and no COUNT(*) per request. Cursors are
+opaque base64 tokens of that sort key. Totals are optional and served from a
+short-lived count cache, so they are approximate.
+"""
+
+import base64
+import os
+import threading
+import time
+from datetime import datetime
+
+from app import db
+from app.models import Internship
+
+# Listing order, newest first; internship_id makes rows created in the same instant deterministic
+LISTING_ORDER = (Internship.created_at.desc(), Internship.internship_id.desc())
+
+
+def encode_cursor(internship):
+    """Opaque cursor pointing just past an internship (anything with created_at and internship_id)"""
+    key = f'{internship.created_at.isoformat()}|{internship.internship_id}'
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    (created_at, internship_id) of a cursor
+    
+    Raises:
+        ValueError: The cursor was not produced by encode_cursor
+    """
+    try:
+        key = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, internship_id = key.split('|')
+        return datetime.fromisoformat(created_at), int(internship_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def keyset_page(query, cursor=None, per_page=10):
+    """
+    One page of an internship query in LISTING_ORDER
+    
+    Args:
+        query: Internship.query with any filters applied, unordered
+        cursor: next_cursor of the previous page, None for the first page
+        per_page: Rows per page
+    
+    Returns:
+        (internships, next_cursor); next_cursor is None on the last page
+    
+    Raises:
+        ValueError: The cursor is invalid
+    """
+    if cursor:
+        created_at, internship_id = decode_cursor(cursor)
+        query = query.filter(db.or_(
+            Internship.created_at < created_at,
+            db.and_(Internship.created_at == created_at, Internship.internship_id < internship_id)
+        ))
+    
+    # One extra row tells whether another page follows; companies come in the same query for to_dict()
+    internships = query.options(db.joinedload(Internship.company)).order_by(*LISTING_ORDER).limit(per_page + 1).all()
+    if len(internships) > per_page:
+        internships = internships[:per_page]
+        return internships, encode_cursor(internships[-1])
+    return internships, None
+
+
+class CountCache:
+    """Row counts of filtered queries, kept for ttl seconds and dropped on internship writes"""
+    
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._counts = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key, query):
+        """Cached count for key, running query.count() when missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        count = query.order_by(None).count()
+        with self._lock:
+            self._counts[key] = (count, now + self.ttl)
+        return count
+    
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+
+
+listing_counts = CountCache(float(os.getenv('LISTING_COUNT_TTL_SECONDS', '60')))
\ No newline at end of file
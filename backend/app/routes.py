@@ -1,7 +1,8 @@
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, flash
 from flask_login import login_user, logout_user, login_required, current_user
 from app import db
-from app.models import User
+from app.models import Recommendation, User
+from app.hooks import user_profile_changed
 import re
 from datetime import datetime
 import os
@@ -317,6 +318,7 @@ def complete_profile():
         
         # Update profile timestamp
         user.profile_updated_at = datetime.utcnow()
+        user_profile_changed(user)
         
         print(f"User object before save: {user.__dict__}")  # Debug logging
         
@@ -479,6 +481,7 @@ def process_user_documents_automatically(user_id):
                 }
                 user.vision_vector_data = json.dumps(vector_data)
                 user.vision_processed_at = datetime.utcnow()
+                user_profile_changed(user)
                 
                 db.session.commit()
                 
@@ -549,6 +552,8 @@ def process_documents():
             # Update user's vision_extracted_data field
             import json
             current_user.vision_extracted_data = json.dumps(result['extracted_data'])
+            current_user.vision_processed_at = datetime.utcnow()
+            user_profile_changed(current_user)
             db.session.commit()
             
             return jsonify({
@@ -588,14 +593,16 @@ def generate_recommendations():
                 'success': False,
                 'message': 'Recommendation engine temporarily unavailable'
             }), 503
-        from app.models import Internship
+        from app.catalog_loader import load_catalog
+        from app.hydration import hydrate_internships
         
-        # Get user data
+        # Get user data, with the persisted normalized profile so the engine can skip re-normalizing
         user_data = current_user.to_dict()
+        user_data['normalized_profile'] = current_user.normalized_profile
         
-        # Get all active internships
-        internships = Internship.query.filter_by(is_active=True).all()
-        internships_data = [internship.to_dict() for internship in internships]
+        # Active catalog in one projection query, narrowed in SQL to internships sharing a skill with the user,
+        # rows handed to the Engine under its field names
+        internships_data = load_catalog(user_id=current_user.user_id)
         
         if not internships_data:
             return jsonify({
@@ -618,16 +625,23 @@ def generate_recommendations():
         if result['recommendations']:
             # Update user's recommendation_list in database
             import json
+            generated_at = datetime.utcnow()
+            scored = result.get('scored_recommendations')
+            if scored is not None or current_user.recommendation_list != json.dumps(result['recommendations']):
+                # A cached ranking carries no scores; only store it when it differs from the stored one
+                Recommendation.replace_for_user(
+                    current_user.user_id,
+                    scored or [{'internship_id': internship_id} for internship_id in result['recommendations']],
+                    generated_at
+                )
             current_user.recommendation_list = json.dumps(result['recommendations'])
-            current_user.recommendations_updated_at = datetime.utcnow()
+            current_user.recommendations_updated_at = generated_at
+            if result.get('normalized_profile'):
+                current_user.normalized_profile = result['normalized_profile']
             db.session.commit()
             
-            # Get detailed internship data for the recommendations
-            recommended_internships = []
-            for internship_id in result['recommendations']:
-                internship = Internship.query.get(internship_id)
-                if internship:
-                    recommended_internships.append(internship.to_dict())
+            # Get detailed internship data for the recommendations, in rank order
+            recommended_internships = hydrate_internships(result['recommendations'])
             
             return jsonify({
                 'success': True,
@@ -659,24 +673,32 @@ def get_recommendations():
     """Get current user's recommendations"""
     try:
         import json
-        from app.models import Internship
+        from app.hydration import hydrate_internships
+        
+        # Ranked rows joined to their internships in one query
+        rows = Recommendation.for_user(current_user.user_id)
+        if rows:
+            recommendation_ids = [recommendation.internship_id for recommendation, _ in rows]
+            recommended_internships = []
+            for recommendation, internship in rows:
+                if internship.is_active:
+                    card = internship.to_dict()
+                    card['match'] = recommendation.to_dict()
+                    recommended_internships.append(card)
+        
+        elif current_user.recommendation_list:
+            # Ranking stored before the recommendations table existed
+            recommendation_ids = json.loads(current_user.recommendation_list)
+            
+            # Get detailed internship data, one query at most
+            recommended_internships = hydrate_internships(recommendation_ids, active_only=True)
         
-        if not current_user.recommendation_list:
+        else:
             return jsonify({
                 'success': False,
                 'message': 'No recommendations available. Generate recommendations first.'
             }), 404
         
-        # Parse recommendation list
-        recommendation_ids = json.loads(current_user.recommendation_list)
-        
-        # Get detailed internship data
-        recommended_internships = []
-        for internship_id in recommendation_ids:
-            internship = Internship.query.get(internship_id)
-            if internship and internship.is_active:
-                recommended_internships.append(internship.to_dict())
-        
         return jsonify({
             'success': True,
             'recommendations': recommendation_ids,
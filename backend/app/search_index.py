@@ -0,0 +1,227 @@
+"""
+In-process BM25 full-text index for /api/internships/search
+
+An inverted index over title, industry, required skills and job description.
+Queries are ranked with BM25, every query term also matches the indexed
+terms it is a prefix of ("pyth" -> "python"), and only the postings of the
+query terms are touched, so latency depends on the number of matches rather
+than the size of the catalog.
+
+The index is built on the first search. Writes in this process mark ids
+dirty through app.hooks.internship_changed and are re-read on the next
+search. Writes made by other workers are picked up by a periodic check of
+the table's row count and latest updated_at.
+"""
+
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from app import db
+from app.models import Internship
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+INDEXED_COLUMNS = (
+    Internship.internship_id,
+    Internship.internship_title,
+    Internship.industry_domain,
+    Internship.required_skills,
+    Internship.job_description
+)
+
+# Title tokens are counted this many times, so title matches outrank description-only ones
+TITLE_BOOST = 2
+
+
+def tokenize(text):
+    """Lowercase word tokens, keeping the + and # of c++ / c#"""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class SearchIndex:
+    """
+    Incrementally updated BM25 index of internships
+    
+    Args:
+        k1, b: BM25 parameters
+        prefix_weight: Score multiplier of prefix matches relative to exact ones
+        max_expansions: Indexed terms a query term may expand to by prefix
+        staleness_seconds: How often to check the table for writes from other processes
+    """
+    
+    def __init__(self, k1=1.2, b=0.75, prefix_weight=0.7, max_expansions=50, staleness_seconds=30):
+        self.k1 = k1
+        self.b = b
+        self.prefix_weight = prefix_weight
+        self.max_expansions = max_expansions
+        self.staleness_seconds = staleness_seconds
+        self._lock = threading.RLock()
+        self.reset()
+    
+    def __len__(self):
+        return len(self._doc_lengths)
+    
+    # Maintenance
+    
+    def mark_dirty(self, internship_id):
+        """Re-read an internship from the database before the next search"""
+        with self._lock:
+            self._dirty.add(internship_id)
+    
+    def reset(self):
+        """Drop the index; it is rebuilt on the next search"""
+        with self._lock:
+            self._postings = {}     # term -> {internship_id: term frequency}
+            self._terms = []        # sorted vocabulary, for prefix lookups
+            self._doc_terms = {}    # internship_id -> {term: term frequency}
+            self._doc_lengths = {}  # internship_id -> tokens
+            self._total_length = 0
+            self._dirty = set()
+            self._built = False
+            self._table_stamp = None
+            self._checked_at = 0.0
+    
+    def upsert(self, internship_id, title='', industry='', skills='', description=''):
+        """Index (or re-index) one internship"""
+        tokens = tokenize(title) * TITLE_BOOST + tokenize(industry) + tokenize(skills) + tokenize(description)
+        frequencies = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        
+        with self._lock:
+            self.remove(internship_id)
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._terms, term)
+                postings[internship_id] = frequency
+            self._doc_terms[internship_id] = frequencies
+            self._doc_lengths[internship_id] = len(tokens)
+            self._total_length += len(tokens)
+    
+    def remove(self, internship_id):
+        with self._lock:
+            frequencies = self._doc_terms.pop(internship_id, None)
+            if frequencies is None:
+                return
+            for term in frequencies:
+                postings = self._postings[term]
+                del postings[internship_id]
+                if not postings:
+                    del self._postings[term]
+                    del self._terms[bisect_left(self._terms, term)]
+            self._total_length -= self._doc_lengths.pop(internship_id)
+    
+    def _index_rows(self, rows):
+        for internship_id, title, industry, skills, description in rows:
+            self.upsert(internship_id, title, industry, skills, description)
+    
+    def _read_stamp(self):
+        """Row count and latest updated_at of the internships table"""
+        count, latest = db.session.execute(
+            db.select(db.func.count(Internship.internship_id), db.func.max(Internship.updated_at))
+        ).one()
+        return count, latest
+    
+    def _build(self):
+        self.reset()
+        stamp = self._read_stamp()
+        rows = db.session.execute(db.select(*INDEXED_COLUMNS).execution_options(yield_per=1000))
+        self._index_rows(rows)
+        self._built = True
+        self._table_stamp = stamp
+        self._checked_at = time.monotonic()
+    
+    def _refresh(self):
+        """Bring the index up to date before a search"""
+        if not self._built:
+            self._build()
+            return
+        
+        if self._dirty:
+            dirty, self._dirty = list(self._dirty), set()
+            rows = db.session.execute(db.select(*INDEXED_COLUMNS).where(Internship.internship_id.in_(dirty))).all()
+            for internship_id in dirty:
+                self.remove(internship_id)
+            self._index_rows(rows)
+        
+        if time.monotonic() - self._checked_at >= self.staleness_seconds:
+            self._checked_at = time.monotonic()
+            stamp = self._read_stamp()
+            if stamp == self._table_stamp:
+                return
+            
+            # Other processes wrote: re-read what changed since the last stamp
+            previous_latest = self._table_stamp[1]
+            query = db.select(*INDEXED_COLUMNS)
+            if previous_latest is not None:
+                query = query.where(Internship.updated_at >= previous_latest)
+            self._index_rows(db.session.execute(query))
+            
+            # Deletions don't show up in updated_at, rebuild when rows went missing
+            if stamp[0] != len(self):
+                self._build()
+            else:
+                self._table_stamp = stamp
+    
+    # Search
+    
+    def _expansions(self, term):
+        """(indexed term, weight) pairs a query term matches"""
+        start = bisect_left(self._terms, term)
+        matches = []
+        for position in range(start, len(self._terms)):
+            candidate = self._terms[position]
+            if not candidate.startswith(term) or len(matches) >= self.max_expansions:
+                break
+            matches.append((candidate, 1.0 if candidate == term else self.prefix_weight))
+        return matches
+    
+    def search(self, query, page=1, per_page=10):
+        """
+        Rank internships against a free-text query
+        
+        Args:
+            query: Search terms, any of which may match (more matches rank higher)
+            page: 1-based page number
+            per_page: Results per page
+        
+        Returns:
+            (internship ids of the page in rank order, total number of matches)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            self._refresh()
+            if not terms or not self._doc_lengths:
+                return [], 0
+            
+            documents = len(self._doc_lengths)
+            average_length = self._total_length / documents
+            scores = {}
+            for term in terms:
+                # A document scores once per query term, through its best matching expansion
+                best = {}
+                for candidate, weight in self._expansions(term):
+                    postings = self._postings[candidate]
+                    idf = math.log(1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for internship_id, frequency in postings.items():
+                        length_norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[internship_id] / average_length)
+                        score = weight * idf * frequency * (self.k1 + 1) / (frequency + length_norm)
+                        if score > best.get(internship_id, 0.0):
+                            best[internship_id] = score
+                for internship_id, score in best.items():
+                    scores[internship_id] = scores.get(internship_id, 0.0) + score
+        
+        # Newest (highest id) first among equal scores
+        page = max(page, 1)
+        top = heapq.nlargest(page * per_page, scores.items(), key=lambda item: (item[1], item[0]))
+        return [internship_id for internship_id, _ in top[(page - 1) * per_page:]], len(scores)
+
+
+search_index = SearchIndex(staleness_seconds=float(os.getenv('SEARCH_STALENESS_SECONDS', '30')))
\ No newline at end of file
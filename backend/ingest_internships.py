@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Bulk-load internships from a JSONL or CSV file
+
+Records stream through validation, normalization and Engine feature
+extraction as generators, and are inserted in batches with executemany-style
+core inserts, so memory stays flat however large the file is. Progress is
+checkpointed after every committed batch; rerunning the same command resumes
+after the last committed record.
+
+Usage:
+    python ingest_internships.py partners.jsonl --company-id 3
+    python ingest_internships.py scraped.csv --batch-size 2000 --restart
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models import Company, Internship, InternshipFeature, InternshipSkill, Skill
+from app.internships_routes import validate_internship_data
+from app.hooks import _import_feature_store, engine_internship_data
+
+# Columns taken from each record; everything else in the file is ignored
+STRING_FIELDS = [
+    'internship_title', 'industry_domain', 'location_type', 'education_level', 'duration',
+    'stipend', 'required_skills', 'job_description', 'past_intern_records'
+]
+
+
+def read_records(path, file_format):
+    """Yield (record number, dict) for every record in the file, numbered from 1"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if file_format == 'csv':
+            for number, record in enumerate(csv.DictReader(f), start=1):
+                yield number, record
+        else:
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    yield number, json.loads(line)
+                except ValueError as e:
+                    yield number, {'_parse_error': str(e)}
+
+
+def validated(records, default_company_id, stats):
+    """Drop records that fail validate_internship_data (or can't become an Internship row)"""
+    known_companies = {}
+    for number, record in records:
+        if '_parse_error' in record:
+            errors = [f"Invalid JSON: {record['_parse_error']}"]
+        else:
+            # Partner feeds use either name for the description
+            if not record.get('job_description') and record.get('description'):
+                record['job_description'] = record['description']
+            errors = validate_internship_data(record)
+            if not str(record.get('job_description') or '').strip():
+                errors.append('Job Description is required')
+            
+            company_id = record.get('company_id') or default_company_id
+            try:
+                company_id = int(company_id)
+            except (TypeError, ValueError):
+                company_id = None
+            if company_id not in known_companies:
+                known_companies[company_id] = company_id is not None and db.session.get(Company, company_id) is not None
+            if not known_companies[company_id]:
+                errors.append(f'Unknown company: {company_id}')
+            record['company_id'] = company_id
+        
+        if errors:
+            stats['rejected'] += 1
+            print(f"⚠ Record {number} skipped: {'. '.join(errors)}")
+            continue
+        yield number, record
+
+
+def normalized(records):
+    """Internship column values of each validated record"""
+    for number, record in records:
+        row = {field: str(record.get(field) or '').strip() for field in STRING_FIELDS}
+        row['company_id'] = record['company_id']
+        row['minimum_gpa'] = float(record['minimum_gpa']) if record.get('minimum_gpa') else None
+        row['fulltime_conversion'] = bool(record.get('fulltime_conversion', False))
+        row['is_active'] = True
+        yield number, row
+
+
+def batched(rows, batch_size):
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def with_features(batches, feature_store):
+    """Attach the Engine's stored feature columns to every row of each batch"""
+    for batch in batches:
+        features = [(None, [])] * len(batch)
+        if feature_store:
+            try:
+                features = feature_store.compute_with_skills([
+                    engine_internship_data(Internship(**row)) for _, row in batch
+                ])
+            except Exception as e:
+                print(f"⚠ Feature computation failed, batch left for add_internship_features_table.py: {e}")
+        yield [(number, row, *row_features) for (number, row), row_features in zip(batch, features)]
+
+
+def insert_batch(batch):
+    """
+    Insert one batch with executemany core inserts (internships, features, skills) and return how many got features
+    
+    MySQL can't return ids from an executemany, so the new ids are read back as
+    everything above the previous maximum and matched to the batch in order.
+    If another writer interleaved, the features are left for the backfill script.
+    """
+    internships = Internship.__table__
+    stamp = datetime.utcnow()
+    rows = [dict(row, created_at=stamp, updated_at=stamp) for _, row, _, _ in batch]
+    
+    previous_max = db.session.execute(db.select(db.func.max(internships.c.internship_id))).scalar() or 0
+    db.session.execute(internships.insert(), rows)
+    inserted = db.session.execute(
+        db.select(internships.c.internship_id, internships.c.company_id, internships.c.internship_title)
+        .where(internships.c.internship_id > previous_max)
+        .order_by(internships.c.internship_id)
+    ).all()
+    
+    matched = len(inserted) == len(rows) and all(
+        (found.company_id, found.internship_title) == (row['company_id'], row['internship_title'])
+        for found, row in zip(inserted, rows)
+    )
+    feature_rows = [
+        dict(features, internship_id=found.internship_id, computed_at=stamp)
+        for found, (_, _, features, _) in zip(inserted, batch) if features
+    ] if matched else []
+    skill_ids = Skill.ensure(skill for _, _, _, skills in batch for skill in skills) if matched else {}
+    skill_rows = [
+        {'internship_id': found.internship_id, 'skill_id': skill_id, 'position': position}
+        for found, (_, _, _, skills) in zip(inserted, batch)
+        for position, skill_id in enumerate(dict.fromkeys(skill_ids[skill.key] for skill in skills))
+    ] if matched else []
+    if not matched:
+        print("⚠ Concurrent inserts detected, features for this batch left for add_internship_features_table.py")
+    if feature_rows:
+        db.session.execute(InternshipFeature.__table__.insert(), feature_rows)
+    if skill_rows:
+        db.session.execute(InternshipSkill.__table__.insert(), skill_rows)
+    
+    db.session.commit()
+    return len(feature_rows)
+
+
+def load_checkpoint(checkpoint_path, source):
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+    return checkpoint if checkpoint.get('source') == os.path.abspath(source) else None
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    """Write the checkpoint atomically so a crash mid-write can't corrupt it"""
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(temporary_path, checkpoint_path)
+
+
+def ingest(path, company_id=None, batch_size=1000, file_format=None, checkpoint_path=None,
+           restart=False, compute_features=True):
+    """Stream a file into the internships table, returning the final stats"""
+    file_format = file_format or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    checkpoint_path = checkpoint_path or f"{path}.checkpoint"
+    
+    checkpoint = None if restart else load_checkpoint(checkpoint_path, path)
+    stats = {'source': os.path.abspath(path), 'record': 0, 'inserted': 0, 'rejected': 0, 'with_features': 0}
+    if checkpoint:
+        stats.update(checkpoint)
+        print(f"✓ Resuming after record {checkpoint['record']} ({checkpoint['inserted']} already inserted)")
+    resume_after = stats['record']
+    
+    feature_store = _import_feature_store() if compute_features else None
+    if compute_features and not feature_store:
+        print("⚠ Engine unavailable, inserting without features")
+    
+    records = ((number, record) for number, record in read_records(path, file_format) if number > resume_after)
+    pipeline = with_features(batched(normalized(validated(records, company_id, stats)), batch_size), feature_store)
+    
+    start = time.time()
+    inserted_this_run = 0
+    for batch in pipeline:
+        try:
+            stats['with_features'] += insert_batch(batch)
+        except Exception:
+            db.session.rollback()
+            print(f"✗ Batch after record {stats['record']} failed, rerun to resume from there")
+            raise
+        
+        stats['inserted'] += len(batch)
+        stats['record'] = batch[-1][0]
+        inserted_this_run += len(batch)
+        save_checkpoint(checkpoint_path, stats)
+        
+        elapsed = time.time() - start
+        print(f"✓ {stats['inserted']} inserted through record {stats['record']} "
+              f"({inserted_this_run / elapsed:,.0f} rows/s)")
+    
+    elapsed = time.time() - start
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"✓ Done: {inserted_this_run} inserted this run, {stats['rejected']} rejected, "
+          f"{stats['with_features']} with features, {inserted_this_run / elapsed if elapsed else 0:,.0f} rows/s")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load internships from JSONL or CSV")
+    parser.add_argument("path", help="JSONL or CSV file, fields named like the internships table")
+    parser.add_argument("--company-id", type=int, help="Company for records without a company_id")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per insert and commit")
+    parser.add_argument("--format", choices=['jsonl', 'csv'], help="Input format (default: from the extension)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--no-features", action="store_true", help="Skip Engine feature extraction")
+    args = parser.parse_args()
+    
+    app = create_app()
+    with app.app_context():
+        ingest(
+            args.path,
+            company_id=args.company_id,
+            batch_size=args.batch_size,
+            file_format=args.format,
+            checkpoint_path=args.checkpoint,
+            restart=args.restart,
+            compute_features=not args.no_features
+        )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
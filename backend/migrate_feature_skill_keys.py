@@ -0,0 +1,52 @@
+"""
+Database migration script to store canonical skill keys instead of skill ids in internship_features
+
+Skill ids were indices into the Engine's alias table, which shift when the
+table is edited, so rows computed before an edit were scored against the wrong
+skills. Rows from the old feature version are recomputed afterwards.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+
+app = create_app()
+
+def migrate_feature_skill_keys():
+    """Replace internship_features.skill_ids with skill_keys and recompute the stored features"""
+    
+    with app.app_context():
+        try:
+            alter_statements = [
+                "ALTER TABLE internship_features ADD COLUMN skill_keys TEXT NULL",
+                "ALTER TABLE internship_features DROP COLUMN skill_ids"
+            ]
+            
+            print("Replacing skill ids with skill keys in internship_features...")
+            
+            for statement in alter_statements:
+                try:
+                    with db.engine.connect() as connection:
+                        connection.execute(db.text(statement))
+                        connection.commit()
+                    print(f"✓ Executed: {statement}")
+                except Exception as e:
+                    message = str(e).lower()
+                    if "duplicate column name" in message or "can't drop" in message or "no such column" in message:
+                        print(f"⚠ Already migrated, skipping: {statement}")
+                    else:
+                        print(f"✗ Error executing {statement}: {e}")
+                        return False
+            
+        except Exception as e:
+            print(f"✗ Migration failed: {e}")
+            return False
+    
+    # Rows of the previous feature version fall back to raw-text scoring until they are recomputed
+    from add_internship_features_table import add_internship_features_table
+    return add_internship_features_table()
+
+if __name__ == "__main__":
+    migrate_feature_skill_keys()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test the recommendation catalog loader against the per-row ORM path
+
+Runs on an in-memory SQLite database, either with pytest or directly:
+    python test_catalog_loader.py
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask
+from sqlalchemy import event
+
+from app import db, bcrypt
+from app.models import Company, Internship, InternshipSkill, User
+from app.catalog_loader import load_catalog
+from app.hooks import store_internship_features, store_user_skills
+
+COMPANIES = 200
+INTERNSHIPS = 2000
+
+_app = None
+
+
+def get_app():
+    """SQLite app seeded once with COMPANIES companies and INTERNSHIPS internships"""
+    global _app
+    if _app is not None:
+        return _app
+    
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['BCRYPT_LOG_ROUNDS'] = 4  # Minimum cost, company passwords only need to exist
+    db.init_app(app)
+    bcrypt.init_app(app)
+    
+    with app.app_context():
+        db.create_all()
+        companies = [
+            Company(f'Company {i}', f'hr{i}@company{i}.com', 'password123')
+            for i in range(COMPANIES)
+        ]
+        db.session.add_all(companies)
+        db.session.flush()
+        
+        for i in range(INTERNSHIPS):
+            internship = Internship(
+                company_id=companies[i % COMPANIES].company_id,
+                internship_title=f'Python Developer Intern {i}',
+                industry_domain=['Software Development', 'Data Science', 'Design'][i % 3],
+                location_type=['Remote', 'On-site', 'Hybrid'][i % 3],
+                education_level='Undergraduate',
+                duration='3 months',
+                stipend='10,000 INR/month',
+                required_skills='Python, SQL, React',
+                job_description=f'Build data pipelines with pandas and docker ({i})',
+                is_active=i % 10 != 0
+            )
+            # Stored features on half the catalog, the rest falls back to raw text
+            if i % 2 == 0:
+                store_internship_features(internship)
+            db.session.add(internship)
+        db.session.commit()
+    
+    _app = app
+    return app
+
+
+class QueryCounter:
+    """Count the SQL statements executed inside the with block"""
+    
+    def __enter__(self):
+        self.count = 0
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+        return self
+    
+    def __exit__(self, *exc):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+    
+    def _count(self, *args):
+        self.count += 1
+
+
+def orm_catalog():
+    """The previous route code: every active internship through to_dict()"""
+    db.session.expunge_all()
+    return [internship.to_dict() for internship in Internship.query.filter_by(is_active=True).all()]
+
+
+def test_loader_runs_one_query():
+    with get_app().app_context():
+        db.session.expunge_all()
+        with QueryCounter() as queries:
+            catalog = load_catalog(batch_size=250)
+        
+        assert queries.count == 1, f"expected 1 query, got {queries.count}"
+        assert len(catalog) == Internship.query.filter_by(is_active=True).count()
+
+
+def test_loader_matches_orm_rows():
+    with get_app().app_context():
+        expected = {internship['internship_id']: internship for internship in orm_catalog()}
+        catalog = load_catalog()
+        
+        assert set(row['internship_id'] for row in catalog) == set(expected)
+        for row in catalog:
+            internship = expected[row['internship_id']]
+            assert row['title'] == internship['internship_title']
+            assert row['description'] == internship['job_description']
+            assert row['industry'] == internship['industry_domain']
+            assert row['company_name'] == internship['company_name']
+            assert row['remote_allowed'] == (internship['location_type'] == 'Remote')
+            assert (row['stored_features'] is not None) == (row['internship_id'] % 2 == 1)
+
+
+def test_loader_beats_orm_path():
+    with get_app().app_context():
+        with QueryCounter() as orm_queries:
+            start = time.perf_counter()
+            orm_rows = orm_catalog()
+            orm_time = time.perf_counter() - start
+        
+        db.session.expunge_all()
+        with QueryCounter() as loader_queries:
+            start = time.perf_counter()
+            load_catalog()
+            loader_time = time.perf_counter() - start
+        
+        print(f"ORM path: {orm_queries.count} queries in {orm_time * 1000:.0f} ms, "
+              f"loader: {loader_queries.count} queries in {loader_time * 1000:.0f} ms")
+        
+        # One lazy company load per distinct company on the ORM path
+        assert orm_queries.count == 1 + len({row['company_id'] for row in orm_rows})
+        assert loader_queries.count == 1
+        assert loader_time < orm_time
+
+
+def student(username, technical_skills):
+    """A user whose skill rows were written from technical_skills"""
+    user = User.query.filter_by(username=username).first()
+    if user is None:
+        user = User(username, 'password123')
+        user.technical_skills = technical_skills
+        store_user_skills(user)
+        db.session.add(user)
+        db.session.commit()
+    return user
+
+
+def test_loader_prefilters_by_skill_overlap():
+    with get_app().app_context():
+        active = Internship.query.filter_by(is_active=True)
+        without_skills = active.filter(~Internship.skills.any()).count()
+        
+        # Every internship with skills lists Python, none lists Figma
+        designer = student('designer', 'Figma')
+        candidates = load_catalog(user_id=designer.user_id, min_candidates=1)
+        assert len(candidates) == without_skills
+        assert all(row['stored_features'] is None for row in candidates)
+        
+        developer = student('developer', 'Python, Docker')
+        assert len(load_catalog(user_id=developer.user_id, min_candidates=1)) == active.count()
+        
+        # Too few candidates falls back to the whole catalog
+        assert len(load_catalog(user_id=designer.user_id, min_candidates=without_skills + 1)) == active.count()
+        
+        top = load_catalog(user_id=developer.user_id, max_candidates=10)
+        assert len(top) == 10
+        assert all(row['stored_features'] is not None for row in top)
+        assert InternshipSkill.query.count() > 0
+
+
+if __name__ == "__main__":
+    for test in (test_loader_runs_one_query, test_loader_matches_orm_rows, test_loader_beats_orm_path,
+                 test_loader_prefilters_by_skill_overlap):
+        test()
+        print(f"✓ {test.__name__}")
\ No newline at end of file